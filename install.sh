@@ -15,6 +15,13 @@ if ! pacman -Q pyside6 qt6-charts python-requests noto-fonts-emoji &>/dev/null;
     sudo pacman -S --needed pyside6 qt6-charts python-requests noto-fonts-emoji
 fi
 
+# PySide6 6.12.0 is excluded: see HANDOFF.md, Known Issues.
+PYSIDE_VERSION="$(python -c 'import PySide6; print(PySide6.__version__)')"
+if [ "$PYSIDE_VERSION" = "6.12.0" ]; then
+    echo "PySide6 $PYSIDE_VERSION is not supported (see HANDOFF.md, Known Issues)." >&2
+    exit 1
+fi
+
 # Create venv if it doesn't exist.
 # --system-site-packages lets it see pyside6/qt6-charts installed by pacman.
 if [ ! -f "$VENV/bin/python" ]; then
@@ -26,6 +33,12 @@ fi
 echo "Installing kde-weather into venv..."
 "$VENV/bin/pip" install --quiet -e "$SCRIPT_DIR"
 
+# Warm Qt's on-disk QML cache (~/.cache/kde-weather) so the first launch from
+# the app menu doesn't have to parse and compile every QML file.
+echo "Precompiling QML..."
+QT_QPA_PLATFORM=offscreen "$VENV/bin/kde-weather" --precompile-qml \
+    || echo "  QML precompile failed; the app will compile it on first launch instead."
+
 # Install a wrapper script to ~/.local/bin so 'kde-weather' is on PATH
 BIN_DIR="${HOME}/.local/bin"
 mkdir -p "$BIN_DIR"
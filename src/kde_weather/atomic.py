@@ -0,0 +1,41 @@
+"""
+Crash-safe file replacement for the settings file and the on-disk caches.
+
+What: write_atomic(path, text) replaces a file's contents so that anyone
+      reading it -- including the next start after a crash or power cut --
+      sees either the old file or the new one, never a truncated mix.
+Why:  settings.json, the forecast cache entries and the NWS gridpoint map
+      all need this, and each used to carry its own copy.
+How:  the text goes to a temp file beside path (named by process and
+      thread, so concurrent writers never share one), is fsync()ed, and
+      os.replace() moves it over path -- a single atomic rename on POSIX.
+      Failures return False instead of raising: for every caller the file
+      is either a cache or a copy of state it still holds in memory, so
+      it carries on either way.
+"""
+
+import os
+import threading
+
+
+def write_atomic(path, text):
+    """Replace path (a pathlib.Path) with text; False if that failed.
+
+    Creates missing parent directories.  On failure the temp file is
+    removed and path is left as it was.
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        return True
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        return False
@@ -0,0 +1,103 @@
+"""Coroutine versions of the fetch functions, for the asyncio I/O loop.
+
+What: fetch_forecast_async(), fetch_geocode_async(),
+      fetch_nws_details_async() and fetch_nws_alerts_async() -- the same
+      requests, caching and return values as open_meteo.fetch_forecast(),
+      open_meteo.fetch_geocode(), nws.fetch_nws_details() and
+      nws.fetch_nws_alerts(), but awaiting a Transport (aio_http.py)
+      instead of blocking in http_client.get().
+Why:  see io_loop.py: coroutines can be cancelled and given deadlines, and
+      any number of them share one I/O thread.
+How:  everything but the requests themselves -- parameters, cache lookups
+      and conditional headers, what each status means, response parsing --
+      is the blocking modules' own request/response steps
+      (open_meteo.prepare_forecast()/finish_forecast(), the nws helpers), so
+      the two engines can't drift apart.
+      The NWS alerts query runs as a concurrent task next to the forecast
+      chain, the coroutine equivalent of nws._side_requests.
+
+The on-disk cache files are small and read/written in place on the I/O
+thread, as the blocking fetches do on their pool threads.
+"""
+import asyncio
+
+from . import gridpoint_cache, nws, resilience
+from .open_meteo import (
+    FORECAST_URL, GEOCODE_COUNT, GEOCODE_URL, finish_forecast, geocode_params,
+    prepare_forecast, stale_forecast,
+)
+
+
+async def fetch_forecast_async(transport, lat, lon):
+    """Async fetch_forecast(): fresh cache hit, conditional GET, or full GET."""
+    key, entry, params, headers = prepare_forecast(lat, lon)
+    if params is None:
+        return entry["body"]
+    try:
+        resp = await transport.get(FORECAST_URL, params=params, headers=headers, timeout=15)
+    except resilience.CircuitOpenError as e:
+        return stale_forecast(entry, e)
+    return finish_forecast(key, entry, resp)
+
+
+async def fetch_geocode_async(transport, name, count=GEOCODE_COUNT):
+    """Async fetch_geocode(): up to `count` matching places."""
+    resp = await transport.get(GEOCODE_URL, params=geocode_params(name, count), timeout=10)
+    resp.raise_for_status()
+    return resp.json().get("results", [])
+
+
+async def _fetch_alerts(transport, lat, lon):
+    return nws.alerts_result(await transport.get(
+        nws.ALERTS_URL, headers=nws._HEADERS, params=nws.alerts_params(lat, lon), timeout=15
+    ))
+
+
+async def _fetch_periods(transport, lat, lon, cached):
+    """Async nws._fetch_periods(): remembered gridpoint first, else /points."""
+    if cached is not None:
+        forecast = await transport.get(
+            cached["forecast"], headers=nws._HEADERS, timeout=15, allow_redirects=False
+        )
+        if not nws.grid_moved(lat, lon, forecast):
+            return nws.periods_result(forecast)
+
+    points = await transport.get(nws.points_url(lat, lon), headers=nws._HEADERS, timeout=15)
+    forecast_url = nws.forecast_url_from_points(lat, lon, points)
+    if forecast_url is None:
+        return None
+    return nws.periods_result(await transport.get(forecast_url, headers=nws._HEADERS, timeout=15))
+
+
+def _discard(task):
+    """Cancel a task whose result no longer matters, and silence its error."""
+    task.cancel()
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
+async def fetch_nws_details_async(transport, lat, lon):
+    """Async fetch_nws_details(), with its payload already indexed."""
+    cached = gridpoint_cache.lookup(lat, lon)
+    if nws.known_outside(cached):
+        payload = nws.details()
+    else:
+        alerts_task = asyncio.create_task(_fetch_alerts(transport, lat, lon))
+        try:
+            forecast = await _fetch_periods(transport, lat, lon, cached)
+        except BaseException:
+            _discard(alerts_task)
+            raise
+        if forecast is None:
+            _discard(alerts_task)
+            payload = nws.details()
+        else:
+            payload = nws.details(forecast, await alerts_task)
+    nws.index_payload(payload)
+    return payload
+
+
+async def fetch_nws_alerts_async(transport, lat, lon):
+    """Async fetch_nws_alerts(), with its update already indexed."""
+    update = nws.alerts_update(await _fetch_alerts(transport, lat, lon))
+    nws.index_payload(update)
+    return update
@@ -0,0 +1,358 @@
+"""Minimal asyncio HTTP/1.1 client, behind a swappable transport interface.
+
+What: Transport.get() -- a coroutine returning a Response with the same
+      attributes the fetch code already uses from requests (status_code,
+      headers, content, json(), raise_for_status()) -- and StreamTransport,
+      an implementation over asyncio streams with per-host keep-alive.
+Why:  the requests-based fetches block a pool thread each and can't be
+      interrupted, so shutdown has to wait out whatever is in flight.  A
+      coroutine can be cancelled at any await and holds no thread while it
+      waits, so one I/O thread (io_loop.py) carries any number of requests.
+How:  plain stdlib -- asyncio.open_connection (with TLS for https), a
+      hand-written request line and header block, and a response reader
+      that handles Content-Length, chunked and read-until-close bodies plus
+      gzip/deflate.  Idle connections are kept per (scheme, host, port) and
+      reused; a reused one that turns out to have been closed by the server
+      is retried once on a fresh connection.  Cancelling or timing out a
+      request closes its connection instead of returning it to the pool.
+      Proxies come from the same environment variables requests honours
+      (http_proxy, https_proxy, all_proxy, no_proxy): plain-http requests
+      go to the proxy in absolute form, https ones through a CONNECT
+      tunnel with TLS started inside it.  Only http:// proxies are
+      supported, as with requests without extras.
+      Like http_client.get(), get() goes through resilience.py: adaptive
+      timeout, retry with backoff, and the per-host circuit breaker -- and
+      records the same per-host metrics (connect, time to first byte, body
+      bytes, JSON decode) when they are on.
+
+Tests swap in their own Transport subclass (or point StreamTransport at a
+local server); nothing here talks to a particular API.
+"""
+import asyncio
+import base64
+import json
+import time
+import urllib.request
+import zlib
+from urllib.parse import unquote, urlencode, urljoin, urlsplit
+
+from . import resilience
+from ... import metrics
+
+# Idle keep-alive connections kept per host (matches http_client.POOL_MAXSIZE).
+MAX_IDLE_PER_HOST = 4
+MAX_REDIRECTS = 5
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+_MAX_LINE = 64 * 1024
+
+
+class HTTPError(Exception):
+    """Raised by Response.raise_for_status() for 4xx/5xx responses."""
+
+    def __init__(self, message, response=None):
+        super().__init__(message)
+        self.response = response
+
+
+class ProxyError(ConnectionError):
+    """The proxy refused a CONNECT tunnel (e.g. 407: authentication)."""
+
+
+def proxy_for(scheme, host, proxies=None):
+    """The proxy for scheme://host per the environment, or None.
+
+    Returns (host, port, Proxy-Authorization value or None).  proxies is a
+    urllib.request.getproxies() dict, read fresh when None.
+    """
+    proxies = urllib.request.getproxies() if proxies is None else proxies
+    url = proxies.get(scheme) or proxies.get("all")
+    if not url or urllib.request.proxy_bypass(host):
+        return None
+    if "://" not in url:
+        url = "http://" + url
+    parts = urlsplit(url)
+    if parts.scheme != "http":
+        raise ValueError(f"unsupported proxy {url!r} (only http:// proxies are)")
+    auth = None
+    if parts.username is not None:
+        user_pass = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+        auth = "Basic " + base64.b64encode(user_pass.encode()).decode("ascii")
+    return parts.hostname, parts.port or 80, auth
+
+
+class Headers(dict):
+    """Response headers with case-insensitive lookup (keys stored lowercase)."""
+
+    def __init__(self, items=()):
+        super().__init__((k.lower(), v) for k, v in items)
+
+    def __getitem__(self, key):
+        return super().__getitem__(key.lower())
+
+    def __contains__(self, key):
+        return super().__contains__(key.lower())
+
+    def get(self, key, default=None):
+        return super().get(key.lower(), default)
+
+
+class Response:
+    def __init__(self, url, status_code, headers, content):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @metrics.timed("http.json_decode_s")
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise HTTPError(f"HTTP {self.status_code} for url: {self.url}", self)
+
+
+class Transport:
+    """Interface the async fetch coroutines talk to."""
+
+    async def get(self, url, params=None, headers=None, timeout=15, allow_redirects=True):
+        """GET url (with query params); returns a Response.
+
+        timeout bounds each attempt, redirects included, and raises
+        TimeoutError when it runs out.
+        """
+        raise NotImplementedError
+
+    async def close(self):
+        """Drop any pooled connections."""
+
+
+class StreamTransport(Transport):
+    def __init__(self, max_idle_per_host=MAX_IDLE_PER_HOST):
+        self._max_idle = max_idle_per_host
+        self._idle = {}  # (scheme, host, port) -> [(reader, writer), ...]
+        self._ssl = None
+        # Proxy settings are read once; the per-host answer is memoized.
+        self._proxies = urllib.request.getproxies()
+        self._proxy_memo = {}  # (scheme, host) -> proxy_for() result
+        self.stats = {"requests": 0, "connections": 0}
+
+    async def get(self, url, params=None, headers=None, timeout=15, allow_redirects=True):
+        if params:
+            url = f"{url}{'&' if '?' in url else '?'}{urlencode(params)}"
+        health = resilience.host(urlsplit(url).hostname)
+        for attempt in range(resilience.RETRIES + 1):
+            last = attempt == resilience.RETRIES
+            health.acquire()
+            started = time.monotonic()
+            try:
+                resp = await self._get(url, headers, health.timeout(timeout), allow_redirects)
+            except (OSError, TimeoutError, asyncio.IncompleteReadError, ValueError):
+                health.failure()
+                metrics.count(f"http.{health.host}.errors")
+                if last:
+                    raise
+            except BaseException:
+                health.release()  # cancelled: no verdict on the host
+                raise
+            else:
+                if not resilience.is_retryable_status(resp.status_code):
+                    health.success(time.monotonic() - started)
+                    return resp
+                health.failure()
+                if last:
+                    return resp
+            metrics.count(f"http.{health.host}.retries")
+            await asyncio.sleep(resilience.backoff(attempt))
+
+    async def _get(self, url, headers, timeout, allow_redirects):
+        """One attempt: the request plus any redirects, within timeout."""
+        async with asyncio.timeout(timeout):
+            for _hop in range(MAX_REDIRECTS + 1):
+                resp = await self._request(url, headers or {})
+                if not allow_redirects or resp.status_code not in _REDIRECT_CODES:
+                    return resp
+                location = resp.headers.get("Location")
+                if not location:
+                    return resp
+                url = urljoin(url, location)
+        raise HTTPError(f"more than {MAX_REDIRECTS} redirects", resp)
+
+    async def close(self):
+        idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for _reader, writer in conns:
+                writer.close()
+
+    async def _request(self, url, headers):
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        host = parts.hostname
+        port = parts.port or (443 if scheme == "https" else 80)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        host_header = host if parts.port is None else f"{host}:{parts.port}"
+        extra = []
+        proxy = self._proxy(scheme, host)
+        if proxy is not None and scheme == "http":
+            # Through a proxy, plain http names the whole URL.
+            target = f"http://{host_header}{target}"
+            if proxy[2]:
+                extra.append(f"Proxy-Authorization: {proxy[2]}")
+        lines = [f"GET {target} HTTP/1.1", f"Host: {host_header}",
+                 "Accept-Encoding: gzip, deflate", "Connection: keep-alive", *extra]
+        lines += [f"{k}: {v}" for k, v in headers.items()]
+        head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+        pool_key = (scheme, host, port)
+        conn, reused = self._checkout(pool_key), True
+        if conn is None:
+            conn, reused = await self._connect(scheme, host, port), False
+        while True:
+            reader, writer = conn
+            try:
+                writer.write(head)
+                await writer.drain()
+                sent = metrics.start()
+                version, status, resp_headers = await _read_head(reader)
+                metrics.stop(f"http.{host}.ttfb_s", sent)
+                body, keep_alive = await _read_body(reader, version, status, resp_headers)
+                break
+            except (ConnectionError, asyncio.IncompleteReadError):
+                writer.close()
+                if not reused:
+                    raise
+                # The server closed an idle keep-alive socket; retry fresh.
+                conn, reused = await self._connect(scheme, host, port), False
+            except BaseException:
+                # Cancelled or timed out mid-exchange: the socket is in an
+                # unknown state, so it can't go back to the pool.
+                writer.close()
+                raise
+        self.stats["requests"] += 1
+        metrics.count(f"http.{host}.requests")
+        metrics.observe(f"http.{host}.body_bytes", len(body))
+        if keep_alive:
+            self._checkin(pool_key, conn)
+        else:
+            writer.close()
+        return Response(url, status, resp_headers, _decode(body, resp_headers))
+
+    def _checkout(self, key):
+        conns = self._idle.get(key)
+        while conns:
+            reader, writer = conns.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer
+            writer.close()
+        return None
+
+    def _checkin(self, key, conn):
+        conns = self._idle.setdefault(key, [])
+        if len(conns) < self._max_idle:
+            conns.append(conn)
+        else:
+            conn[1].close()
+
+    def _proxy(self, scheme, host):
+        key = (scheme, host)
+        if key not in self._proxy_memo:
+            self._proxy_memo[key] = proxy_for(scheme, host, self._proxies)
+        return self._proxy_memo[key]
+
+    async def _connect(self, scheme, host, port):
+        ssl_context = None
+        if scheme == "https":
+            if self._ssl is None:
+                import ssl
+                self._ssl = ssl.create_default_context()
+            ssl_context = self._ssl
+        proxy = self._proxy(scheme, host)
+        started = metrics.start()
+        if proxy is None:
+            conn = await asyncio.open_connection(
+                host, port, ssl=ssl_context, server_hostname=host if ssl_context else None,
+                limit=_MAX_LINE,
+            )
+        else:
+            conn = await asyncio.open_connection(proxy[0], proxy[1], limit=_MAX_LINE)
+            if ssl_context is not None:
+                await _tunnel(conn, host, port, proxy[2])
+                await conn[1].start_tls(ssl_context, server_hostname=host)
+        metrics.stop(f"http.{host}.connect_s", started)
+        self.stats["connections"] += 1
+        return conn
+
+
+async def _tunnel(conn, host, port, auth):
+    """Ask the proxy on conn for a CONNECT tunnel to host:port."""
+    reader, writer = conn
+    lines = [f"CONNECT {host}:{port} HTTP/1.1", f"Host: {host}:{port}"]
+    if auth:
+        lines.append(f"Proxy-Authorization: {auth}")
+    try:
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+        _version, status, headers = await _read_head(reader)
+        if not 200 <= status < 300:
+            raise ProxyError(f"proxy refused CONNECT to {host}:{port}: HTTP {status}")
+    except BaseException:
+        writer.close()
+        raise
+
+
+async def _read_head(reader):
+    """Read a response's status line and headers: (version, status, Headers)."""
+    status_line = await reader.readuntil(b"\r\n")
+    version, status, *_reason = status_line.decode("latin-1").split(" ", 2)
+    status = int(status)
+    items = []
+    while True:
+        line = await reader.readuntil(b"\r\n")
+        if line == b"\r\n":
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        items.append((name.strip(), value.strip()))
+    return version, status, Headers(items)
+
+
+async def _read_body(reader, version, status, headers):
+    """Read the body that follows _read_head(): (raw bytes, keep_alive)."""
+    connection = headers.get("Connection", "").lower()
+    keep_alive = connection != "close" and (version != "HTTP/1.0" or connection == "keep-alive")
+    if status in (204, 304) or 100 <= status < 200:
+        body = b""
+    elif "chunked" in headers.get("Transfer-Encoding", "").lower():
+        body = await _read_chunked(reader)
+    elif "Content-Length" in headers:
+        body = await reader.readexactly(int(headers["Content-Length"]))
+    else:
+        body = await reader.read()
+        keep_alive = False
+    return body, keep_alive
+
+
+async def _read_chunked(reader):
+    chunks = []
+    while True:
+        size = int((await reader.readuntil(b"\r\n")).split(b";", 1)[0], 16)
+        if size == 0:
+            # Skip any trailer fields up to the final blank line.
+            while await reader.readuntil(b"\r\n") != b"\r\n":
+                pass
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)  # CRLF after each chunk
+
+
+def _decode(body, headers):
+    encoding = headers.get("Content-Encoding", "").lower()
+    if encoding == "gzip":
+        return zlib.decompress(body, 16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:  # raw deflate without the zlib header
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
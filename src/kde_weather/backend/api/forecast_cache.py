@@ -0,0 +1,147 @@
+"""Persistent on-disk cache for Open-Meteo forecast responses.
+
+What: one JSON file per (rounded lat/lon, request params) holding the response
+      body, when it was fetched, and the HTTP validators that came with it
+      (ETag, Last-Modified, Cache-Control max-age).
+Why:  fetch_forecast() used to hit the network at startup, on every timer tick
+      and on every location switch, and kept nothing between runs -- so a cold
+      start showed an empty window until a ~15 KB fetch finished.  With this
+      cache the first paint is a local file read.
+How:  a fresh entry (younger than its max-age) is served with no request at
+      all.  A stale entry is still returned for painting, and its validators
+      become If-None-Match / If-Modified-Since headers on a conditional request
+      (stale-while-revalidate).  A 304 just re-stamps the entry.
+
+Files live under ~/.cache/kde-weather/forecast/ and are written with
+atomic.write_atomic() (temp file + rename), so a crash mid-write can never
+leave a truncated entry behind.
+"""
+import hashlib
+import json
+import re
+import time
+from pathlib import Path
+
+from ...atomic import write_atomic
+
+CACHE_DIR = Path.home() / ".cache" / "kde-weather" / "forecast"
+
+# Coordinates are rounded before keying: two saved locations a few hundred
+# metres apart land in the same Open-Meteo grid cell anyway.
+COORD_DECIMALS = 2
+
+# Open-Meteo doesn't always send Cache-Control; its models update at most
+# hourly, so 15 minutes is a conservative freshness window.
+DEFAULT_MAX_AGE = 15 * 60
+
+# A forecast older than its own horizon (7 days) is useless even for a first
+# paint -- HourlyModel would find no hours >= now -- so we ignore it.
+MAX_STALE_AGE = 7 * 24 * 3600
+
+_MAX_AGE_RE = re.compile(r"max-age\s*=\s*(\d+)", re.IGNORECASE)
+
+
+def cache_key(lat, lon, params):
+    """Stable key for a request: rounded coordinates + the other query params.
+
+    lat/lon are excluded from `params` before hashing (they're in the prefix,
+    already rounded) so a tiny coordinate difference doesn't miss the cache.
+    """
+    rest = {k: v for k, v in params.items() if k not in ("latitude", "longitude")}
+    digest = hashlib.sha1(
+        json.dumps(rest, sort_keys=True).encode("utf-8")
+    ).hexdigest()[:12]
+    return f"{round(lat, COORD_DECIMALS)}_{round(lon, COORD_DECIMALS)}_{digest}"
+
+
+def parse_max_age(cache_control):
+    """Return the max-age seconds from a Cache-Control header, or None."""
+    if not cache_control:
+        return None
+    if "no-store" in cache_control.lower() or "no-cache" in cache_control.lower():
+        return 0
+    m = _MAX_AGE_RE.search(cache_control)
+    return int(m.group(1)) if m else None
+
+
+def _path(key):
+    return CACHE_DIR / f"{key}.json"
+
+
+def load(key, now=None):
+    """Return the cached entry dict for key, or None if missing/corrupt/too old.
+
+    Entry shape: {"body", "fetched_at", "etag", "last_modified", "max_age"}.
+    """
+    try:
+        with open(_path(key)) as f:
+            entry = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(entry, dict) or "body" not in entry:
+        return None
+    now = time.time() if now is None else now
+    if now - entry.get("fetched_at", 0) > MAX_STALE_AGE:
+        return None
+    return entry
+
+
+def is_fresh(entry, now=None):
+    """True if the entry can be served without even a conditional request."""
+    if entry is None:
+        return False
+    now = time.time() if now is None else now
+    max_age = entry.get("max_age")
+    if max_age is None:
+        max_age = DEFAULT_MAX_AGE
+    return now - entry.get("fetched_at", 0) < max_age
+
+
+def conditional_headers(entry):
+    """If-None-Match / If-Modified-Since headers for revalidating an entry."""
+    headers = {}
+    if entry is None:
+        return headers
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def _write(key, entry):
+    # A cache write failing (read-only home, full disk) must never break
+    # the fetch that produced the data -- we just won't have it next time.
+    write_atomic(_path(key), json.dumps(entry))
+
+
+def store(key, body, headers, now=None):
+    """Save a 200 response body with its validators; returns the new entry."""
+    entry = {
+        "body": body,
+        "fetched_at": time.time() if now is None else now,
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified"),
+        "max_age": parse_max_age(headers.get("Cache-Control")),
+    }
+    _write(key, entry)
+    return entry
+
+
+def revalidated(key, entry, headers, now=None):
+    """Re-stamp an entry after a 304 Not Modified; returns the updated entry.
+
+    A 304 may carry fresh validators / Cache-Control, which replace the old
+    ones; anything it omits is kept from the original 200.
+    """
+    entry = dict(entry)
+    entry["fetched_at"] = time.time() if now is None else now
+    if headers.get("ETag"):
+        entry["etag"] = headers["ETag"]
+    if headers.get("Last-Modified"):
+        entry["last_modified"] = headers["Last-Modified"]
+    max_age = parse_max_age(headers.get("Cache-Control"))
+    if max_age is not None:
+        entry["max_age"] = max_age
+    _write(key, entry)
+    return entry
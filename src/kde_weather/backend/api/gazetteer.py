@@ -0,0 +1,254 @@
+"""Offline city gazetteer: a memory-mapped, sorted prefix index.
+
+What: an optional local geocoding backend next to open_meteo.fetch_geocode().
+      search() returns result dicts in the same shape as Open-Meteo's
+      geocoding API (name, admin1, country, latitude, longitude, population),
+      so GeocodeModel and AppController.addGeocodedLocation work unchanged.
+Why:  autocomplete shouldn't need a network round trip per keystroke, and
+      should keep working offline.
+How:  a single binary file, mmap'd read-only.  Lookups unpack only the few
+      records they touch with struct.unpack_from, so the index is never
+      loaded into the Python heap and the OS pages in just what's read.
+
+File layout (little-endian):
+
+    header    magic, record count, prefix count, section offsets
+    records   fixed-size, sorted by (normalized name bytes, -population):
+              string offset, 4 string lengths, lat, lon, population
+    prefixes  sorted by prefix bytes; for every normalized name prefix of
+              1..PREFIX_LEN characters, the TOP_K most populous record ids
+    strings   per record: normalized key, name, admin1, country (UTF-8)
+
+Short queries (<= PREFIX_LEN chars) are one binary search in the prefix
+table -- their match ranges are huge, so ranking is precomputed.  Longer
+queries binary-search the records for the first key >= query and scan the
+(small) run of keys starting with it, ranking by population.
+
+Build an index from a headered CSV/TSV city list with:
+
+    python -m kde_weather.backend.api.gazetteer cities.tsv gazetteer.idx
+
+Columns: name, admin1, country, latitude (or lat), longitude (or lon/lng),
+population.  Drop the result at ~/.local/share/kde-weather/gazetteer.idx and
+the app uses it for search automatically.
+"""
+import csv
+import heapq
+import mmap
+import struct
+import sys
+from pathlib import Path
+
+from .geocode_cache import normalize
+
+DEFAULT_PATH = Path.home() / ".local" / "share" / "kde-weather" / "gazetteer.idx"
+
+MAGIC = b"KWGAZ\x00\x01\x00"
+PREFIX_LEN = 4            # characters covered by the precomputed prefix table
+PREFIX_BYTES = 16         # PREFIX_LEN UTF-8 characters, NUL-padded
+TOP_K = 10                # ranked record ids kept per prefix
+MAX_SCAN = 2048           # cap on records scanned for one long-query lookup
+
+# magic, n_records, n_prefixes, records_off, prefixes_off, strings_off
+_HEADER = struct.Struct("<8sIIIII")
+# string offset, key/name/admin1/country byte lengths, lat, lon, population
+_RECORD = struct.Struct("<IHHHHffI")
+# prefix bytes, id count, padding, TOP_K record ids
+_PREFIX = struct.Struct(f"<{PREFIX_BYTES}sB3x{TOP_K}I")
+
+
+class Gazetteer:
+    """Read-only view over a gazetteer index file."""
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            self._file.close()
+            raise ValueError(f"{path}: not a gazetteer index")
+        (magic, self._n_records, self._n_prefixes,
+         self._records_off, self._prefixes_off, self._strings_off) = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path}: not a gazetteer index")
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+    def __len__(self):
+        return self._n_records
+
+    # --- low-level accessors (each touches only the bytes it needs) ---
+
+    def _record(self, i):
+        return _RECORD.unpack_from(self._mm, self._records_off + i * _RECORD.size)
+
+    def _key(self, i):
+        off, key_len = _RECORD.unpack_from(self._mm, self._records_off + i * _RECORD.size)[:2]
+        start = self._strings_off + off
+        return self._mm[start:start + key_len]
+
+    def _result(self, i):
+        off, key_len, name_len, admin_len, country_len, lat, lon, pop = self._record(i)
+        pos = self._strings_off + off + key_len
+        name = self._mm[pos:pos + name_len].decode("utf-8")
+        pos += name_len
+        admin1 = self._mm[pos:pos + admin_len].decode("utf-8")
+        pos += admin_len
+        country = self._mm[pos:pos + country_len].decode("utf-8")
+        return {
+            "name": name,
+            "admin1": admin1,
+            "country": country,
+            # float32 on disk; round off the representation noise
+            "latitude": round(lat, 5),
+            "longitude": round(lon, 5),
+            "population": pop,
+        }
+
+    # --- search ---
+
+    def search(self, query, count=5):
+        """Return up to `count` places whose name starts with query, most populous first."""
+        key = normalize(query)
+        if not key:
+            return []
+        if len(key) <= PREFIX_LEN:
+            ids = self._prefix_ids(key.encode("utf-8"))
+        else:
+            ids = self._scan_ids(key.encode("utf-8"), count)
+        return [self._result(i) for i in ids[:count]]
+
+    def _prefix_ids(self, prefix):
+        target = prefix.ljust(PREFIX_BYTES, b"\x00")
+        lo, hi = 0, self._n_prefixes
+        while lo < hi:
+            mid = (lo + hi) // 2
+            entry = _PREFIX.unpack_from(self._mm, self._prefixes_off + mid * _PREFIX.size)
+            if entry[0] < target:
+                lo = mid + 1
+            elif entry[0] > target:
+                hi = mid
+            else:
+                return list(entry[2:2 + entry[1]])
+        return []
+
+    def _scan_ids(self, prefix, count):
+        # Lower bound: first record whose key is >= prefix.
+        lo, hi = 0, self._n_records
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < prefix:
+                lo = mid + 1
+            else:
+                hi = mid
+        matches = []
+        for i in range(lo, min(self._n_records, lo + MAX_SCAN)):
+            if not self._key(i).startswith(prefix):
+                break
+            matches.append((self._record(i)[7], -i))
+        # Ties keep file order (alphabetical) via the negated index.
+        return [-neg_i for _pop, neg_i in heapq.nlargest(count, matches)]
+
+
+def open_default():
+    """Open the user's gazetteer if one is installed, else return None."""
+    if not DEFAULT_PATH.exists():
+        return None
+    try:
+        return Gazetteer(DEFAULT_PATH)
+    except (OSError, ValueError):
+        return None
+
+
+# --- builder ---
+
+def _column(row, *names, default=""):
+    for n in names:
+        if row.get(n) not in (None, ""):
+            return row[n]
+    return default
+
+
+def build_index(rows, out_path):
+    """Write a gazetteer index from an iterable of row dicts; returns record count."""
+    entries = []
+    for row in rows:
+        name = _column(row, "name").strip()
+        key = normalize(name)
+        if not key:
+            continue
+        try:
+            lat = float(_column(row, "latitude", "lat"))
+            lon = float(_column(row, "longitude", "lon", "lng"))
+        except ValueError:
+            continue
+        try:
+            pop = max(0, min(int(float(_column(row, "population", default="0"))), 0xFFFFFFFF))
+        except ValueError:
+            pop = 0
+        entries.append((
+            key.encode("utf-8")[:0xFFFF], name.encode("utf-8")[:0xFFFF],
+            _column(row, "admin1").strip().encode("utf-8")[:0xFFFF],
+            _column(row, "country").strip().encode("utf-8")[:0xFFFF],
+            lat, lon, pop, key,
+        ))
+    entries.sort(key=lambda e: (e[0], -e[6]))
+
+    records = bytearray()
+    strings = bytearray()
+    top = {}  # prefix bytes -> heap of (population, -record id)
+    for i, (kb, nb, ab, cb, lat, lon, pop, key) in enumerate(entries):
+        records += _RECORD.pack(len(strings), len(kb), len(nb), len(ab), len(cb), lat, lon, pop)
+        strings += kb + nb + ab + cb
+        for n in range(1, min(PREFIX_LEN, len(key)) + 1):
+            heap = top.setdefault(key[:n].encode("utf-8"), [])
+            item = (pop, -i)
+            if len(heap) < TOP_K:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+
+    prefixes = bytearray()
+    for prefix in sorted(top):
+        ids = [-neg_i for _pop, neg_i in sorted(top[prefix], reverse=True)]
+        prefixes += _PREFIX.pack(prefix.ljust(PREFIX_BYTES, b"\x00"), len(ids),
+                                 *(ids + [0] * (TOP_K - len(ids))))
+
+    records_off = _HEADER.size
+    prefixes_off = records_off + len(records)
+    strings_off = prefixes_off + len(prefixes)
+    with open(out_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(entries), len(top),
+                             records_off, prefixes_off, strings_off))
+        f.write(records)
+        f.write(prefixes)
+        f.write(strings)
+    return len(entries)
+
+
+def build_from_file(src_path, out_path):
+    """Build an index from a headered CSV (or .tsv/.txt tab-separated) file."""
+    src_path = Path(src_path)
+    delimiter = "\t" if src_path.suffix.lower() in (".tsv", ".tab", ".txt") else ","
+    with open(src_path, newline="", encoding="utf-8") as f:
+        return build_index(csv.DictReader(f, delimiter=delimiter), out_path)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) not in (1, 2):
+        print("usage: python -m kde_weather.backend.api.gazetteer CITIES.{csv,tsv} [OUT.idx]",
+              file=sys.stderr)
+        return 2
+    out = Path(argv[1]) if len(argv) == 2 else DEFAULT_PATH
+    out.parent.mkdir(parents=True, exist_ok=True)
+    n = build_from_file(argv[0], out)
+    print(f"wrote {n} places to {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
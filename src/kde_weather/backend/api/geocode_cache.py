@@ -0,0 +1,79 @@
+"""In-memory LRU cache of geocode results with local prefix filtering.
+
+What: maps a normalized search query to the result list Open-Meteo returned
+      for it, bounded by entry count and a TTL.
+Why:  every debounced keystroke in LocationSearchBar.qml used to go to the
+      network -- including retyping a query we'd already seen, and typing a
+      longer prefix whose matches are a subset of results we already hold.
+How:  lookup() answers an exact hit directly.  Otherwise, if a shorter
+      prefix of the query is cached with a *complete* result set (fewer
+      results than were asked for, so nothing was cut off), the longer query
+      is answered by filtering those results by name prefix -- no request.
+
+Open-Meteo only fuzzy-matches queries of 3+ characters (2 characters is an
+exact-name match), so only prefixes at least MIN_FILTER_PREFIX long are used
+as a base for local filtering.
+"""
+import time
+import unicodedata
+from collections import OrderedDict
+
+MAX_ENTRIES = 128
+TTL_SECONDS = 6 * 3600   # place names don't move; this just bounds staleness
+MIN_FILTER_PREFIX = 3
+
+
+def normalize(query):
+    """Case-fold, strip accents and collapse whitespace: 'São  Paulo' -> 'sao paulo'."""
+    decomposed = unicodedata.normalize("NFKD", query.casefold())
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.split())
+
+
+class GeocodeCache:
+    def __init__(self, max_entries=MAX_ENTRIES, ttl=TTL_SECONDS):
+        self._max_entries = max_entries
+        self._ttl = ttl
+        # normalized query -> (results, stored_at, complete); oldest first
+        self._entries = OrderedDict()
+
+    def _get(self, key, now):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if now - entry[1] > self._ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def lookup(self, query, now=None):
+        """Return cached results for query, or None if the network is needed."""
+        now = time.time() if now is None else now
+        key = normalize(query)
+        entry = self._get(key, now)
+        if entry is not None:
+            return list(entry[0])
+
+        # Longest cached complete prefix first: it holds the fewest results.
+        for end in range(len(key) - 1, MIN_FILTER_PREFIX - 1, -1):
+            base = self._get(key[:end], now)
+            if base is None or not base[2]:
+                continue
+            results = [r for r in base[0] if normalize(r.get("name", "")).startswith(key)]
+            # A filtered subset of a complete set is itself complete.  It
+            # inherits the base's timestamp so it can't outlive its source.
+            self._put(key, results, base[1], True)
+            return list(results)
+        return None
+
+    def store(self, query, results, requested, now=None):
+        """Cache a network response.  `requested` is the count asked for."""
+        now = time.time() if now is None else now
+        self._put(normalize(query), list(results), now, len(results) < requested)
+
+    def _put(self, key, results, stored_at, complete):
+        self._entries[key] = (results, stored_at, complete)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
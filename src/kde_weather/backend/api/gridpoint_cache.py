@@ -0,0 +1,101 @@
+"""Persistent map from a point to its NWS gridpoint forecast URL.
+
+What: one small JSON file mapping rounded coordinates to the gridpoint
+      (office/x,y) and forecast URL that api.weather.gov/points returned.
+Why:  the /points lookup for a saved location almost never changes -- the
+      NWS grid is redrawn a few times a decade -- yet fetch_nws_details()
+      repeated it before every forecast request, a full extra round trip.
+How:  lookup() returns the stored forecast URL while it is younger than
+      TTL_SECONDS; fetch_nws_details() then goes straight to the forecast.
+      If that URL answers 404 or with a redirect, the grid moved: forget()
+      drops the entry and the caller resolves it again through /points.
+      Points that /points answered 404 for (outside NWS coverage) are
+      stored too, via store_outside(), so that 404 is never repeated.
+
+The file lives at ~/.cache/kde-weather/nws_points.json and is replaced via
+atomic.write_atomic(), like the forecast cache entries.  NWS workers run on
+several pool threads, so reads and read-modify-writes take a module lock.
+"""
+import json
+import threading
+import time
+from pathlib import Path
+
+from ... import metrics
+from ...atomic import write_atomic
+
+CACHE_FILE = Path.home() / ".cache" / "kde-weather" / "nws_points.json"
+
+# The same precision as the /points request itself (NWS recommends 4).
+COORD_DECIMALS = 4
+
+# Re-resolve at least monthly even if nothing ever 404s.
+TTL_SECONDS = 30 * 24 * 3600
+
+_lock = threading.Lock()
+
+
+def cache_key(lat, lon):
+    return f"{round(lat, COORD_DECIMALS)},{round(lon, COORD_DECIMALS)}"
+
+
+def _read():
+    try:
+        with open(CACHE_FILE) as f:
+            entries = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return entries if isinstance(entries, dict) else {}
+
+
+def _write(entries):
+    # Losing the map only costs a /points round trip next time.
+    write_atomic(CACHE_FILE, json.dumps(entries))
+
+
+def lookup(lat, lon, now=None):
+    """Return the stored entry or None.
+
+    Entry shape: {"forecast", "gridpoint", "resolved_at"}, or
+    {"outside": True, "resolved_at"} for a point outside NWS coverage.
+    """
+    now = time.time() if now is None else now
+    with _lock:
+        entry = _read().get(cache_key(lat, lon))
+    if not isinstance(entry, dict) or not (entry.get("forecast") or entry.get("outside")):
+        entry = None
+    elif now - entry.get("resolved_at", 0) > TTL_SECONDS:
+        entry = None
+    metrics.count("gridpoint_cache.hit" if entry is not None else "gridpoint_cache.miss")
+    return entry
+
+
+def store(lat, lon, properties, now=None):
+    """Remember the forecast URL from a /points response's properties."""
+    entry = {
+        "forecast": properties["forecast"],
+        "gridpoint": f"{properties.get('gridId')}/{properties.get('gridX')},{properties.get('gridY')}",
+        "resolved_at": time.time() if now is None else now,
+    }
+    _put(lat, lon, entry)
+    return entry
+
+
+def store_outside(lat, lon, now=None):
+    """Remember that /points returned 404 (no NWS coverage) for a point."""
+    _put(lat, lon, {"outside": True, "resolved_at": time.time() if now is None else now})
+
+
+def _put(lat, lon, entry):
+    with _lock:
+        entries = _read()
+        entries[cache_key(lat, lon)] = entry
+        _write(entries)
+
+
+def forget(lat, lon):
+    """Drop a stale mapping so the next fetch resolves it again."""
+    with _lock:
+        entries = _read()
+        if entries.pop(cache_key(lat, lon), None) is not None:
+            _write(entries)
@@ -0,0 +1,195 @@
+"""Shared, pooled HTTP client used by every fetch function.
+
+What: one requests HTTPAdapter -- and therefore one urllib3 PoolManager with
+      per-host keep-alive pools -- shared by open_meteo.py and nws.py.
+Why:  module-level requests.get() builds a throwaway Session per call, so
+      every request paid its own DNS lookup, TCP connect and TLS handshake.
+      For ~15 KB payloads the handshake dominates; fetch_nws_details() alone
+      opened three separate connections to api.weather.gov back to back.
+How:  each thread gets its own requests.Session (Sessions carry cookie state
+      and aren't guaranteed thread-safe), but they all mount the SAME adapter.
+      The adapter's PoolManager is thread-safe, so a socket opened by the
+      forecast worker can be reused by the next geocode worker.
+
+Accept-Encoding is whatever urllib3 can decode here: gzip/deflate always, plus
+br (and zstd) when the optional brotli/zstandard packages are installed.
+
+pool_stats() reports how many requests went out and how many of them reused
+an already-open connection instead of opening a new one.
+
+get() also goes through the per-host resilience layer (resilience.py):
+adaptive timeouts, retry with backoff, and a circuit breaker that fails
+fast while a host is down.  With metrics on (kde_weather/metrics.py) it
+records per host the connect time, time to response headers, body size
+and JSON decode time.
+
+requests/urllib3 are imported on the first request, not with this module:
+importing them is a large share of app startup, and nothing before the
+first frame touches the network (the first paint comes from the on-disk
+cache).  The first request therefore happens on a worker thread, off the
+startup path.
+"""
+import threading
+import time
+from urllib.parse import urlsplit
+
+from . import resilience
+from ... import metrics
+
+# Distinct hosts we talk to: api.open-meteo.com, geocoding-api.open-meteo.com,
+# api.weather.gov.  Sized so none of their pools is evicted (and its warm
+# sockets closed) by the PoolManager's LRU.
+POOL_CONNECTIONS = 4
+# Keep-alive sockets retained per host.  Matches the worker pool's thread
+# count -- there's no point keeping more sockets than concurrent requests.
+POOL_MAXSIZE = 4
+
+# Per-request timeout ceiling (seconds) when the caller doesn't pass one.
+DEFAULT_TIMEOUT = 15
+
+_stats_lock = threading.Lock()
+_stats = {"requests": 0, "connections": 0}
+
+
+def _count(field):
+    with _stats_lock:
+        _stats[field] += 1
+
+
+class _TimedConnectMixin:
+    """Times DNS + TCP connect (+ TLS handshake) per host, when metrics are on."""
+
+    def connect(self):
+        started = metrics.start()
+        super().connect()
+        metrics.stop(f"http.{self.host}.connect_s", started)
+
+
+class _CountingPoolMixin:
+    """Counts new connections vs. requests so reuse can be reported."""
+
+    def _new_conn(self):
+        _count("connections")
+        return super()._new_conn()
+
+    def _make_request(self, *args, **kwargs):
+        _count("requests")
+        return super()._make_request(*args, **kwargs)
+
+
+_init_lock = threading.Lock()
+_adapter = None  # the shared HTTPAdapter, built by _shared_adapter()
+_local = threading.local()
+
+
+def _shared_adapter():
+    """Import requests and build the one adapter every Session mounts."""
+    global _adapter
+    with _init_lock:
+        if _adapter is not None:
+            return _adapter
+
+        from requests.adapters import HTTPAdapter
+        from urllib3.connection import HTTPConnection, HTTPSConnection
+        from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+        class _TimedHTTPConnection(_TimedConnectMixin, HTTPConnection):
+            pass
+
+        class _TimedHTTPSConnection(_TimedConnectMixin, HTTPSConnection):
+            pass
+
+        class _CountingHTTPPool(_CountingPoolMixin, HTTPConnectionPool):
+            ConnectionCls = _TimedHTTPConnection
+
+        class _CountingHTTPSPool(_CountingPoolMixin, HTTPSConnectionPool):
+            ConnectionCls = _TimedHTTPSConnection
+
+        class _PooledAdapter(HTTPAdapter):
+            def init_poolmanager(self, *args, **kwargs):
+                super().init_poolmanager(*args, **kwargs)
+                self.poolmanager.pool_classes_by_scheme = {
+                    "http": _CountingHTTPPool,
+                    "https": _CountingHTTPSPool,
+                }
+
+        # pool_block=False: if every socket for a host is busy we open an extra
+        # one rather than stall a worker; it just isn't kept afterwards.
+        _adapter = _PooledAdapter(
+            pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, pool_block=False
+        )
+        return _adapter
+
+
+def session():
+    """Return this thread's Session (created on first use, shared adapter)."""
+    s = getattr(_local, "session", None)
+    if s is None:
+        import requests
+        from urllib3.util import make_headers
+
+        adapter = _shared_adapter()
+        s = requests.Session()
+        s.mount("https://", adapter)
+        s.mount("http://", adapter)
+        s.headers.update(make_headers(accept_encoding=True))
+        _local.session = s
+    return s
+
+
+def get(url, timeout=DEFAULT_TIMEOUT, **kwargs):
+    """Pooled, resilient drop-in for requests.get(); same Response.
+
+    `timeout` is a ceiling: the host's adaptive timeout is used when it is
+    shorter.  Connection errors, timeouts, 429 and 5xx are retried with
+    backoff; the last attempt's response is returned (or its exception
+    raised) as usual.  Raises resilience.CircuitOpenError without sending
+    anything while the host's circuit is open.  See resilience.py.
+    """
+    s = session()
+    from requests.exceptions import RequestException
+
+    host = urlsplit(url).hostname
+    health = resilience.host(host)
+    for attempt in range(resilience.RETRIES + 1):
+        last = attempt == resilience.RETRIES
+        health.acquire()
+        started = time.monotonic()
+        try:
+            resp = s.get(url, timeout=health.timeout(timeout), **kwargs)
+        except RequestException:
+            health.failure()
+            metrics.count(f"http.{host}.errors")
+            if last:
+                raise
+        except BaseException:
+            health.release()
+            raise
+        else:
+            if metrics.active():
+                _record(host, resp)
+            if not resilience.is_retryable_status(resp.status_code):
+                health.success(time.monotonic() - started)
+                return resp
+            health.failure()
+            if last:
+                return resp
+        metrics.count(f"http.{host}.retries")
+        time.sleep(resilience.backoff(attempt))
+
+
+def _record(host, resp):
+    """Metrics for one response; its json() is wrapped to time decoding."""
+    metrics.count(f"http.{host}.requests")
+    # requests' elapsed runs from sending the request to parsing the
+    # response headers: time to first byte, plus connect on a new socket.
+    metrics.observe(f"http.{host}.ttfb_s", resp.elapsed.total_seconds())
+    metrics.observe(f"http.{host}.body_bytes", len(resp.content))
+    resp.json = metrics.timed("http.json_decode_s")(resp.json)
+
+
+def pool_stats():
+    """Return {"requests", "connections", "reused"} counters since startup."""
+    with _stats_lock:
+        reqs, conns = _stats["requests"], _stats["connections"]
+    return {"requests": reqs, "connections": conns, "reused": max(0, reqs - conns)}
@@ -0,0 +1,149 @@
+"""A dedicated asyncio I/O thread, and a Qt bridge for its requests.
+
+What: IoLoop runs one asyncio event loop on one background thread and
+      accepts coroutines from any thread; AsyncRequest wraps one coroutine
+      as a QObject with finished/error/cancelled signals, like the pool
+      workers in worker.py.
+Why:  the requests-based workers hold a pool thread per request and can't
+      be interrupted, so WorkerPool.shutdown() can only wait them out.  On
+      this loop a request is a task: cancel() ends it at its next await,
+      every request gets a deadline, and many can be in flight at once on
+      one thread.
+How:  submit() hands the coroutine to the loop with
+      asyncio.run_coroutine_threadsafe(), wrapped in asyncio.timeout() when
+      it has a deadline, and returns a concurrent.futures.Future.  The
+      AsyncRequest's future callback runs on the I/O thread and emits from
+      there; its QObject lives on the main thread, so Qt queues the signal
+      and the connected slots run on the main thread.  shutdown() cancels
+      every task, closes pooled connections and joins the thread -- it
+      never has to wait for a socket timeout.
+
+The thread and loop are created on the first submit(), so an unused IoLoop
+costs nothing at startup.
+"""
+import asyncio
+import threading
+
+from PySide6.QtCore import QObject, Signal
+
+from .aio_http import StreamTransport
+
+# Deadline for a request when the caller doesn't give one (seconds).
+DEFAULT_DEADLINE = 30
+
+
+class IoLoop:
+    def __init__(self, transport=None):
+        # StreamTransport's connections belong to this loop; a test can
+        # pass any other aio_http.Transport.
+        self.transport = transport or StreamTransport()
+        self._lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+        self._closed = False
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("IoLoop is shut down")
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name="kde-weather-io", daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    def submit(self, coro, deadline=DEFAULT_DEADLINE):
+        """Schedule coro on the I/O thread; returns a concurrent.futures.Future.
+
+        future.cancel() cancels the task.  When deadline (seconds) passes
+        first, the future fails with TimeoutError.
+        """
+        loop = self._ensure_started()
+        return asyncio.run_coroutine_threadsafe(_with_deadline(coro, deadline), loop)
+
+    def running(self):
+        return self._loop is not None and not self._closed
+
+    def shutdown(self, timeout=1.0):
+        """Cancel everything in flight, close connections, stop the thread.
+
+        Returns True if the thread ended within timeout seconds.  Safe to
+        call more than once, and on a loop that never started.
+        """
+        with self._lock:
+            loop, self._loop = self._loop, None
+            self._closed = True
+        if loop is None:
+            return True
+        try:
+            asyncio.run_coroutine_threadsafe(self._cancel_all(), loop).result(timeout)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join(timeout)
+        stopped = not self._thread.is_alive()
+        if stopped:
+            loop.close()
+        return stopped
+
+    async def _cancel_all(self):
+        me = asyncio.current_task()
+        tasks = [t for t in asyncio.all_tasks() if t is not me]
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.transport.close()
+
+
+async def _with_deadline(coro, deadline):
+    if deadline is None:
+        return await coro
+    try:
+        async with asyncio.timeout(deadline):
+            return await coro
+    except TimeoutError:
+        raise TimeoutError(f"request deadline of {deadline}s exceeded") from None
+
+
+class AsyncRequest(QObject):
+    """One coroutine on an IoLoop, reported through Qt signals.
+
+    Create it on the main thread, connect its signals, then start().  The
+    IoLoop-side callback keeps no reference to this object, so the caller
+    must hold it until one of the three signals has been delivered.
+    """
+
+    finished = Signal(object)  # the coroutine's return value
+    error = Signal(str)        # the exception message on failure / deadline
+    cancelled = Signal()       # cancel() or IoLoop.shutdown() got there first
+
+    def __init__(self, io_loop, coro_fn, *args, deadline=DEFAULT_DEADLINE):
+        super().__init__()
+        self._io = io_loop
+        self._coro_fn = coro_fn
+        self._args = args
+        self._deadline = deadline
+        self._future = None
+
+    def start(self):
+        coro = self._coro_fn(self._io.transport, *self._args)
+        self._future = self._io.submit(coro, self._deadline)
+        self._future.add_done_callback(self._done)
+
+    def cancel(self):
+        """Cancel the request; `cancelled` is emitted unless it already ended."""
+        if self._future is not None:
+            self._future.cancel()
+
+    def _done(self, future):
+        # Runs on the I/O thread (or the caller's, if already done).
+        if future.cancelled():
+            self.cancelled.emit()
+            return
+        exc = future.exception()
+        if exc is None:
+            self.finished.emit(future.result())
+        else:
+            self.error.emit(str(exc) or type(exc).__name__)
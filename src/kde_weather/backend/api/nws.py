@@ -4,13 +4,21 @@ What: api.weather.gov provides narrative forecasts and active alerts.
 Why:  Open-Meteo (the app's primary source) has neither narrative text nor US
       alerts, so this is a second, US-only source used by the 7-Day tab.
 How:  fetch_nws_details() (Task 2) does the network flow; the period/alert
-      parsing lives in pure helpers here so it can be unit-tested offline.
+      parsing lives in pure helpers here so it can be unit-tested offline,
+      and so do the request/response steps it shares with the coroutine
+      version in aio_fetch.py.
 
-NWS requires a descriptive User-Agent header or it returns 403.
+NWS requires a descriptive User-Agent header or it returns 403.  All
+requests go through the pooled client in http_client.py, so they reuse
+keep-alive connections to api.weather.gov.
 """
-from datetime import datetime, timedelta
+import copy
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 
-import requests
+from . import gridpoint_cache, http_client
+from .nws_cache import header_lifetime
 
 # NWS asks for a User-Agent identifying the app (and ideally a contact).
 # See https://www.weather.gov/documentation/services-web-api
@@ -20,6 +28,11 @@ _HEADERS = {"User-Agent": NWS_USER_AGENT, "Accept": "application/geo+json"}
 POINTS_URL = "https://api.weather.gov/points/{lat},{lon}"
 ALERTS_URL = "https://api.weather.gov/alerts/active"
 
+# Runs the alerts request of each fetch_nws_details() call concurrently with
+# its forecast chain.  Sized to the worker pool, which bounds how many NWS
+# fetches can be in flight; threads are only started on first use.
+_side_requests = ThreadPoolExecutor(max_workers=4, thread_name_prefix="nws-alerts")
+
 
 def _parse_iso(ts):
     """Parse an NWS ISO-8601 timestamp like '2026-06-12T18:00:00-04:00'.
@@ -100,6 +113,22 @@ def alerts_for_date(alerts, date_str):
     return out
 
 
+def active_alerts(alerts, now=None):
+    """Alert property dicts that haven't expired yet at `now` (aware datetime).
+
+    A cached payload can outlive some of its alerts; this keeps a stale
+    payload from showing a warning whose own expires/ends time has passed.
+    """
+    now = datetime.now(timezone.utc) if now is None else now
+    out = []
+    for props in alerts:
+        end = _parse_iso(props.get("expires") or props.get("ends"))
+        if end is not None and end.tzinfo is not None and end <= now:
+            continue
+        out.append(props)
+    return out
+
+
 def format_expires(ts):
     """Human-friendly end time, e.g. 'until Thu 6:00 PM'. '' if unparseable.
 
@@ -107,53 +136,299 @@ def format_expires(ts):
     Why:  Alert UI shows 'until Thu 6:00 PM' rather than a raw ISO string,
           so the user immediately knows when the alert lapses.
     """
-    dt = _parse_iso(ts)
+    return _until(_parse_iso(ts))
+
+
+def _until(dt):
     if dt is None:
         return ""
     # %-I uses the non-zero-padded hour (e.g. '6' not '06') on Linux
     return dt.strftime("until %a %-I:%M %p")
 
 
-def fetch_nws_details(lat, lon):
-    """Fetch NWS day/night periods + active alerts for a point.
+class DayIndex:
+    """Per-day lookups over one NWS payload, built once when it arrives.
 
-    What: Makes up to three requests — /points, the forecast URL it returns,
-          and /alerts/active — and returns the combined result.
-    Why:  NWS is US-only; the points endpoint returns 404 for non-US
-          coordinates, so we use that as the availability signal rather than
-          raising an exception (the caller doesn't need to treat this as an
-          error).
-    How:  Any 404 on the points call → available=False (outside NWS coverage).
-          Any other HTTP/network failure raises so NwsWorker can surface it as
-          an error state. The three requests all send the required User-Agent.
-    Returns {"available": bool, "periods": list, "alerts": list}.
+    What: the payload's periods keyed by local date, and its alerts as
+          parsed [start, end] windows sorted by start, plus a memo of the
+          finished per-day panel rows.
+    Why:  every day click used to run periods_for_date()/alerts_for_date()
+          over the whole payload, re-parsing every timestamp, and then
+          format_expires() parsed the alert ends again.
+    How:  NwsWorker builds the index on its pool thread (index_payload()), so
+          the GUI thread never parses a timestamp.  A day's alerts are the
+          prefix of the start-sorted list that begins before the day ends
+          (found by bisection), filtered by end.  Semantics match
+          periods_for_date() and alerts_for_date() exactly.
+    """
+
+    def __init__(self, payload):
+        self._periods = {}  # "YYYY-MM-DD" -> {"day": period|None, "night": period|None}
+        for p in payload.get("periods", []):
+            start = _parse_iso(p.get("startTime"))
+            if start is None:
+                continue
+            pair = self._periods.setdefault(start.strftime("%Y-%m-%d"),
+                                            {"day": None, "night": None})
+            slot = "day" if p.get("isDaytime") else "night"
+            if pair[slot] is None:
+                pair[slot] = p
+
+        windows = []  # (wall-clock start, wall-clock end, aware end, props)
+        for a in payload.get("alerts", []):
+            props = a.get("properties", a)
+            start = _parse_iso(props.get("effective") or props.get("onset"))
+            end = _parse_iso(props.get("expires") or props.get("ends"))
+            windows.append((
+                start.replace(tzinfo=None) if start else datetime.min,  # already active
+                end.replace(tzinfo=None) if end else datetime.max,      # open-ended
+                end,
+                props,
+            ))
+        windows.sort(key=lambda w: w[0])
+        self._alert_starts = [w[0] for w in windows]
+        self._alert_windows = windows
+        self._days = {}  # date_str -> (period rows, [(aware end, alert row)])
+
+    def periods(self, date_str):
+        """Same result as periods_for_date() for this payload."""
+        return self._periods.get(date_str, {"day": None, "night": None})
+
+    def alerts(self, date_str):
+        """Same result as alerts_for_date() for this payload (in start order)."""
+        return [w[3] for w in self._windows_for(date_str)]
+
+    def _windows_for(self, date_str):
+        day_start = datetime.fromisoformat(date_str + "T00:00:00")
+        day_end = day_start + timedelta(days=1)
+        stop = bisect_left(self._alert_starts, day_end)
+        return [w for w in self._alert_windows[:stop] if w[1] >= day_start]
+
+    def detail(self, date_str, now=None):
+        """(period_list, alert_list) rows for DayDetail.set_data(), memoized.
+
+        With `now` (an aware datetime), alerts that have ended by then are
+        left out, as active_alerts() does.  The lists are shared between
+        calls; callers must not mutate them.
+        """
+        day = self._days.get(date_str)
+        if day is None:
+            pair = self.periods(date_str)
+            period_list = [
+                {"name": p.get("name", ""), "text": p.get("detailedForecast", "")}
+                for p in (pair["day"], pair["night"]) if p
+            ]
+            alerts = [
+                (end, {
+                    "event": props.get("event", "Alert"),
+                    "headline": props.get("headline", ""),
+                    "severity": props.get("severity", "Unknown"),
+                    "text": props.get("description", ""),
+                    "expiresText": _until(end),
+                })
+                for _start, _end, end, props in self._windows_for(date_str)
+            ]
+            day = self._days[date_str] = (period_list, alerts, [row for _e, row in alerts])
+        period_list, alerts, alert_list = day
+        if now is None:
+            return period_list, alert_list
+        return period_list, [
+            row for end, row in alerts
+            if end is None or end.tzinfo is None or end > now
+        ]
+
+    def with_alerts(self, other):
+        """An index with this one's periods and other's alerts; parses nothing."""
+        index = copy.copy(other)
+        index._periods = self._periods
+        index._days = {}
+        return index
+
+
+def index_payload(payload):
+    """Attach a DayIndex to a fetch_nws_details() payload, under "index".
+
+    Returns the payload's index, building it only if it has none yet.
     """
+    index = payload.get("index")
+    if index is None:
+        index = payload["index"] = DayIndex(payload)
+    return index
+
+
+def merge_alerts(payload, update):
+    """A cached, indexed payload with the alerts of a fetch_nws_alerts() update.
+
+    The periods and their share of the DayIndex are reused as they are, so
+    folding in new alerts costs the GUI thread no parsing.
+    """
+    merged = dict(payload, alerts=update["alerts"], alerts_max_age=update["alerts_max_age"])
+    merged["index"] = index_payload(payload).with_alerts(index_payload(update))
+    return merged
+
+
+# --- Request/response steps, shared with aio_fetch.py ---
+# The blocking fetch below and the coroutine one differ only in how each
+# request travels; everything about what is asked and what an answer means
+# lives here.
+
+def alerts_params(lat, lon):
+    """Query parameters for ALERTS_URL at a point."""
+    return {"point": f"{lat},{lon}", "status": "actual"}
+
+
+def alerts_result(resp):
+    """(raw GeoJSON alert features, header lifetime) from an alerts response."""
+    resp.raise_for_status()
+    return resp.json().get("features", []), header_lifetime(resp.headers)
+
+
+def points_url(lat, lon):
     # NWS recommends 4 decimal places; longer coords can be rejected/truncated.
-    points = requests.get(
-        POINTS_URL.format(lat=round(lat, 4), lon=round(lon, 4)),
-        headers=_HEADERS,
-        timeout=15,
-    )
+    return POINTS_URL.format(lat=round(lat, 4), lon=round(lon, 4))
+
+
+def forecast_url_from_points(lat, lon, points):
+    """Remember a /points response's gridpoint; its forecast URL, or None.
+
+    None means the point is outside NWS coverage: a 404 (remembered, so it
+    isn't asked again), or a success without a forecast URL.
+    """
     if points.status_code == 404:
         # Outside NWS coverage (non-US location); not an error, just unavailable
-        return {"available": False, "periods": [], "alerts": []}
+        gridpoint_cache.store_outside(lat, lon)
+        return None
     points.raise_for_status()
-    forecast_url = points.json().get("properties", {}).get("forecast")
-    if not forecast_url:
+    properties = points.json().get("properties", {})
+    if not properties.get("forecast"):
         # Points endpoint succeeded but returned no forecast URL; treat as unavailable
-        return {"available": False, "periods": [], "alerts": []}
+        return None
+    return gridpoint_cache.store(lat, lon, properties)["forecast"]
+
+
+def grid_moved(lat, lon, forecast):
+    """True if a remembered forecast URL answered 404 or 3xx (fetched with
+    redirects off): the grid moved, so the mapping is dropped and the point
+    must go through /points again."""
+    if forecast.status_code == 404 or 300 <= forecast.status_code < 400:
+        gridpoint_cache.forget(lat, lon)
+        return True
+    return False
 
-    forecast = requests.get(forecast_url, headers=_HEADERS, timeout=15)
+
+def periods_result(forecast):
+    """(periods, header lifetime) from a forecast response."""
     forecast.raise_for_status()
     periods = forecast.json().get("properties", {}).get("periods", [])
+    return periods, header_lifetime(forecast.headers)
+
+
+def details(forecast=None, alerts=None):
+    """fetch_nws_details()'s payload from its two halves.
+
+    forecast and alerts are (list, header lifetime) pairs; forecast None
+    means the point is outside NWS coverage, and alerts is then ignored.
+    """
+    if forecast is None:
+        return {"available": False, "periods": [], "alerts": []}
+    periods, periods_max_age = forecast
+    alert_list, alerts_max_age = alerts
+    return {
+        "available": True,
+        "periods": periods,
+        "alerts": alert_list,
+        "periods_max_age": periods_max_age,
+        "alerts_max_age": alerts_max_age,
+    }
+
+
+def alerts_update(alerts):
+    """fetch_nws_alerts()'s update from an (alerts, header lifetime) pair."""
+    alert_list, alerts_max_age = alerts
+    return {"alerts": alert_list, "alerts_max_age": alerts_max_age}
+
+
+def known_outside(cached):
+    """True for a gridpoint_cache entry saying the point has no coverage."""
+    return cached is not None and bool(cached.get("outside"))
+
+
+# --- Blocking fetch ---
 
-    alerts_resp = requests.get(
-        ALERTS_URL,
-        headers=_HEADERS,
-        params={"point": f"{lat},{lon}", "status": "actual"},
-        timeout=15,
-    )
-    alerts_resp.raise_for_status()
-    alerts = alerts_resp.json().get("features", [])
+def _fetch_alerts(lat, lon):
+    return alerts_result(http_client.get(
+        ALERTS_URL, headers=_HEADERS, params=alerts_params(lat, lon), timeout=15
+    ))
 
-    return {"available": True, "periods": periods, "alerts": alerts}
+
+def _fetch_periods(lat, lon, cached):
+    """(periods, header lifetime) for a point, or None outside NWS coverage.
+
+    cached is the point's gridpoint_cache.lookup() entry (never an "outside"
+    one) or None.  With a remembered gridpoint the steady state is a single
+    request; see grid_moved() for when it falls back to /points.
+    """
+    if cached is not None:
+        forecast = http_client.get(
+            cached["forecast"], headers=_HEADERS, timeout=15, allow_redirects=False
+        )
+        if not grid_moved(lat, lon, forecast):
+            return periods_result(forecast)
+
+    points = http_client.get(points_url(lat, lon), headers=_HEADERS, timeout=15)
+    forecast_url = forecast_url_from_points(lat, lon, points)
+    if forecast_url is None:
+        return None
+    return periods_result(http_client.get(forecast_url, headers=_HEADERS, timeout=15))
+
+
+def fetch_nws_details(lat, lon):
+    """Fetch NWS day/night periods + active alerts for a point.
+
+    What: Requests /alerts/active alongside the /points -> forecast chain and
+          returns the combined result.
+    Why:  NWS is US-only; the points endpoint returns 404 for non-US
+          coordinates, so we use that as the availability signal rather than
+          raising an exception (the caller doesn't need to treat this as an
+          error).
+    How:  A point remembered as outside coverage (gridpoint_cache.py)
+          returns at once, without a request.  Otherwise the alerts query,
+          which only needs lat/lon, runs on a side thread while this one
+          fetches the forecast -- through the remembered gridpoint when there
+          is one, else via /points.  With a remembered gridpoint the whole
+          call costs one round trip of latency.  A 404 on /points →
+          available=False (outside NWS coverage); any other HTTP/network
+          failure raises so NwsWorker can surface it as an error state.
+          Every request sends the required User-Agent.
+    Returns {"available": bool, "periods": list, "alerts": list}; when
+    available, also "periods_max_age" / "alerts_max_age": how long each half
+    stays fresh per its response headers (None if they don't say), for
+    NwsCache.
+    """
+    cached = gridpoint_cache.lookup(lat, lon)
+    if known_outside(cached):
+        return details()
+    alerts_job = _side_requests.submit(_fetch_alerts, lat, lon)
+    try:
+        forecast = _fetch_periods(lat, lon, cached)
+    except BaseException:
+        alerts_job.cancel()
+        raise
+    if forecast is None:
+        # Whatever the alerts query returns (or raises) for a point NWS
+        # doesn't cover is irrelevant; don't wait for it.
+        alerts_job.cancel()
+        return details()
+    return details(forecast, alerts_job.result())
+
+
+def fetch_nws_alerts(lat, lon):
+    """Fetch only the active alerts for a point.
+
+    For a cached fetch_nws_details() payload whose periods are still fresh
+    but whose alerts have expired (NwsCache.to_fetch() == "alerts"): one
+    request instead of the whole /points -> forecast chain.  Returns
+    {"alerts": list, "alerts_max_age": seconds or None} -- no "periods" --
+    for merge_alerts() to fold into the cached payload.
+    """
+    return alerts_update(_fetch_alerts(lat, lon))
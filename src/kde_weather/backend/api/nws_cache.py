@@ -0,0 +1,176 @@
+"""In-memory cache of NWS detail payloads, bounded by TTL, entry count and size.
+
+What: maps a location key to the last fetch_nws_details() payload, with
+      separate expiry times for its forecast periods and its alerts.
+Why:  AppController kept every payload forever in a plain dict, so the 7-Day
+      panel could show alerts that had expired hours earlier, and memory grew
+      with every location visited.
+How:  each half of a payload expires on its own schedule -- NWS marks alert
+      responses fresh for seconds and forecasts for much longer -- taken from
+      the response's Cache-Control max-age or Expires header, or a fallback
+      when neither is sent.  to_fetch() says which half a refresh needs:
+      with the periods still fresh, only the alerts are fetched again
+      (one request instead of the whole /points -> forecast chain) and
+      put_alerts() folds them into the entry.  get() still returns an
+      expired entry, flagged stale, so the caller can paint it at once and
+      refresh in the background (stale-while-revalidate).  Entries are
+      evicted least recently used first once there are more than
+      max_entries of them or their approximate JSON size passes max_bytes.
+
+stats() reports hits (fresh), stale hits, misses and evictions.
+"""
+import json
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+
+from .forecast_cache import parse_max_age
+
+MAX_ENTRIES = 16
+MAX_BYTES = 4 * 1024 * 1024
+# Used when a response carries neither Cache-Control max-age nor Expires.
+PERIODS_TTL = 30 * 60    # NWS rewrites the narrative forecast a few times a day
+ALERTS_TTL = 5 * 60      # alerts are issued and cancelled at any time
+# An "unavailable" payload (outside NWS coverage) won't change; it only
+# expires so a location can't stay blank forever on a transient answer.
+UNAVAILABLE_TTL = 24 * 3600
+
+
+def header_lifetime(headers):
+    """Seconds a response stays fresh per its headers, or None if unstated.
+
+    Cache-Control max-age wins over Expires, as in HTTP; Expires is measured
+    from the response's own Date header when it has one, so a skewed local
+    clock doesn't matter.
+    """
+    max_age = parse_max_age(headers.get("Cache-Control"))
+    if max_age is not None:
+        return max_age
+    try:
+        expires = parsedate_to_datetime(headers["Expires"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    try:
+        base = parsedate_to_datetime(headers["Date"]).timestamp()
+    except (KeyError, TypeError, ValueError):
+        base = time.time()
+    return max(0, int(expires.timestamp() - base))
+
+
+def approx_size(payload):
+    """Rough bytes held by a payload: the length of its JSON encoding.
+
+    The attached DayIndex (see nws.index_payload) only references the
+    payload's own dicts, so it is left out of the count.
+    """
+    data = {k: v for k, v in payload.items() if k != "index"}
+    return len(json.dumps(data, separators=(",", ":")))
+
+
+class NwsCache:
+    def __init__(self, max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES,
+                 periods_ttl=PERIODS_TTL, alerts_ttl=ALERTS_TTL):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._periods_ttl = periods_ttl
+        self._alerts_ttl = alerts_ttl
+        # key -> (payload, periods_expire_at, alerts_expire_at, size); oldest first
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key, now=None):
+        """Return (payload, fresh) for key, or None on a miss.
+
+        fresh is False once either the periods or the alerts have expired;
+        the payload is still returned so the caller can show it while it
+        fetches a new one -- see to_fetch() for which half.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        now = time.time() if now is None else now
+        fresh = now < entry[1] and now < entry[2]
+        self._stats["hits" if fresh else "stale_hits"] += 1
+        return entry[0], fresh
+
+    def to_fetch(self, key, now=None):
+        """What a refresh of key must fetch, or None while it is all fresh.
+
+        "details" -- nothing is cached or the periods have expired (the full
+        fetch brings new alerts too) -- or "alerts" when only they have.
+        Touches neither LRU order nor stats.
+        """
+        entry = self._entries.get(key)
+        now = time.time() if now is None else now
+        if entry is None or now >= entry[1]:
+            return "details"
+        return "alerts" if now >= entry[2] else None
+
+    def is_fresh(self, key, now=None):
+        """True if key is cached and not expired; touches neither LRU nor stats."""
+        return self.to_fetch(key, now) is None
+
+    def peek(self, key):
+        """The cached payload for key, without touching LRU order or stats."""
+        entry = self._entries.get(key)
+        return entry[0] if entry is not None else None
+
+    def put(self, key, payload, now=None):
+        """Cache a fetch_nws_details() payload.
+
+        Its optional "periods_max_age" / "alerts_max_age" (seconds, from the
+        response headers) set the two lifetimes; missing ones fall back to
+        the configured TTLs.  An unavailable payload keeps UNAVAILABLE_TTL.
+        """
+        now = time.time() if now is None else now
+        if payload.get("available", True):
+            periods_ttl = payload.get("periods_max_age")
+            alerts_ttl = payload.get("alerts_max_age")
+        else:
+            periods_ttl = alerts_ttl = UNAVAILABLE_TTL
+        entry = (
+            payload,
+            now + (self._periods_ttl if periods_ttl is None else periods_ttl),
+            now + (self._alerts_ttl if alerts_ttl is None else alerts_ttl),
+            approx_size(payload),
+        )
+        self._store(key, entry)
+
+    def put_alerts(self, key, payload, now=None):
+        """Replace key's payload after an alerts-only refresh.
+
+        payload is the cached one with new alerts (nws.merge_alerts()); its
+        "alerts_max_age" restarts the alerts' lifetime while the periods
+        keep theirs.  Does nothing if key has been evicted meanwhile.
+        """
+        old = self._entries.get(key)
+        if old is None:
+            return
+        now = time.time() if now is None else now
+        alerts_ttl = payload.get("alerts_max_age")
+        self._store(key, (
+            payload,
+            old[1],
+            now + (self._alerts_ttl if alerts_ttl is None else alerts_ttl),
+            approx_size(payload),
+        ))
+
+    def _store(self, key, entry):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[3]
+        self._entries[key] = entry
+        self._bytes += entry[3]
+        # Never evict the entry just stored, even if it alone is over budget.
+        while len(self._entries) > 1 and (
+                len(self._entries) > self._max_entries or self._bytes > self._max_bytes):
+            _key, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted[3]
+            self._stats["evictions"] += 1
+
+    def stats(self):
+        """{"hits", "stale_hits", "misses", "evictions", "entries", "bytes"}."""
+        return dict(self._stats, entries=len(self._entries), bytes=self._bytes)
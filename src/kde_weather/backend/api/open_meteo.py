@@ -10,13 +10,23 @@ by enabled_elements because:
   1. The API response is small (~15 KB) either way
   2. It avoids re-fetching when the user toggles an element on
   3. The hourly data is also used to populate current conditions (index 0)
+
+Forecast responses go through the on-disk cache in forecast_cache.py, so a
+fresh entry costs no request and a stale one costs only a conditional GET.
+All requests share the keep-alive connection pool in http_client.py, and
+its per-host timeouts, retries and circuit breaker (resilience.py).
 """
 
-import requests
+from . import forecast_cache, http_client, resilience
+from ... import metrics
 
 FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
 GEOCODE_URL = "https://geocoding-api.open-meteo.com/v1/search"
 
+# How many matches the autocomplete dropdown asks for.  geocode_cache.py
+# also uses it: a response with fewer results than this is complete.
+GEOCODE_COUNT = 5
+
 # Every hourly field we might display as a chart.
 # These names are the Open-Meteo API parameter names.
 HOURLY_PARAMS = [
@@ -52,49 +62,152 @@ DAILY_PARAMS = [
 ]
 
 
+def forecast_params(lat: float, lon: float) -> dict:
+    """Query parameters for a forecast request at (lat, lon).
+
+    Units are set to US customary (°F, mph, inches) since this app targets
+    US users.  "timezone=auto" tells Open-Meteo to return times in the
+    location's local timezone rather than UTC.
+    """
+    return {
+        "latitude": lat,
+        "longitude": lon,
+        "hourly": ",".join(HOURLY_PARAMS),
+        "daily": ",".join(DAILY_PARAMS),
+        "temperature_unit": "fahrenheit",
+        "wind_speed_unit": "mph",
+        "precipitation_unit": "inch",
+        "timezone": "auto",
+        "forecast_days": 7,
+    }
+
+
+def cached_forecast(lat: float, lon: float) -> dict | None:
+    """Return the on-disk cache entry for (lat, lon), or None.
+
+    This is a local file read, cheap enough for the main thread -- the
+    controller uses it to paint immediately while a worker revalidates.
+    See forecast_cache.load() for the entry shape.
+    """
+    params = forecast_params(lat, lon)
+    return forecast_cache.load(forecast_cache.cache_key(lat, lon, params))
+
+
+def prepare_forecast(lat: float, lon: float):
+    """Cache lookup ahead of a forecast request: (key, entry, params, headers).
+
+    params and headers are None when the entry is fresh -- its body is the
+    answer and no request is needed.  Otherwise they are the query and the
+    conditional headers (If-None-Match / If-Modified-Since) to send.  Shared
+    by fetch_forecast() and aio_fetch.fetch_forecast_async(), which differ
+    only in how the request travels.
+    """
+    params = forecast_params(lat, lon)
+    key = forecast_cache.cache_key(lat, lon, params)
+    entry = forecast_cache.load(key)
+    if forecast_cache.is_fresh(entry):
+        metrics.count("forecast_cache.hit")
+        return key, entry, None, None
+    metrics.count("forecast_cache.miss")
+    return key, entry, params, forecast_cache.conditional_headers(entry)
+
+
+def stale_forecast(entry, error):
+    """The body to serve when the circuit is open (resilience.py).
+
+    Open-Meteo is known to be down: a stale copy beats an error, so error
+    is only raised when there is no entry at all.
+    """
+    if entry is None:
+        raise error
+    metrics.count("forecast_cache.stale_served")
+    return entry["body"]
+
+
+def finish_forecast(key, entry, resp) -> dict:
+    """The forecast body for a response to prepare_forecast()'s request.
+
+    resp is a requests or aio_http Response.  A 304 re-stamps the cached
+    entry and reuses its body; anything else is checked and stored.
+    """
+    if resp.status_code == 304 and entry is not None:
+        metrics.count("forecast_cache.revalidated")
+        return forecast_cache.revalidated(key, entry, resp.headers)["body"]
+    resp.raise_for_status()
+    data = resp.json()
+    forecast_cache.store(key, data, resp.headers)
+    return data
+
+
 def fetch_forecast(lat: float, lon: float) -> dict:
     """Fetch a 7-day forecast with hourly + daily data.
 
-    Returns the raw JSON dict from Open-Meteo.  Units are set to US
-    customary (°F, mph, inches) since this app targets US users.
-    The "timezone=auto" parameter tells Open-Meteo to return times in the
-    location's local timezone rather than UTC.
+    Returns the raw JSON dict from Open-Meteo.  A fresh cache entry is
+    returned without touching the network; a stale one is revalidated with
+    If-None-Match / If-Modified-Since, and a 304 reuses the cached body.
+    While the host's circuit is open (resilience.py) a stale entry is
+    returned as-is instead of failing.
     """
-    resp = requests.get(
-        FORECAST_URL,
-        params={
-            "latitude": lat,
-            "longitude": lon,
-            "hourly": ",".join(HOURLY_PARAMS),
-            "daily": ",".join(DAILY_PARAMS),
-            "temperature_unit": "fahrenheit",
-            "wind_speed_unit": "mph",
-            "precipitation_unit": "inch",
-            "timezone": "auto",
-            "forecast_days": 7,
-        },
-        timeout=15,
-    )
+    key, entry, params, headers = prepare_forecast(lat, lon)
+    if params is None:
+        return entry["body"]
+    try:
+        resp = http_client.get(FORECAST_URL, params=params, headers=headers, timeout=15)
+    except resilience.CircuitOpenError as e:
+        return stale_forecast(entry, e)
+    return finish_forecast(key, entry, resp)
+
+
+def fetch_forecast_batch(coords: list[tuple[float, float]]) -> list[dict]:
+    """Fetch forecasts for several locations in ONE request.
+
+    Open-Meteo accepts comma-separated latitude/longitude lists and returns
+    a JSON list with one result per coordinate, in request order (or a bare
+    dict when there is only one).  Each result is written to the on-disk
+    cache under its own per-location key so single-location lookups hit it.
+
+    Only Cache-Control is carried into the per-location entries: an ETag or
+    Last-Modified describes the combined body, so it can't validate one
+    location's slice of it.
+    """
+    if not coords:
+        return []
+    params = forecast_params(0.0, 0.0)
+    params["latitude"] = ",".join(str(lat) for lat, _lon in coords)
+    params["longitude"] = ",".join(str(lon) for _lat, lon in coords)
+    resp = http_client.get(FORECAST_URL, params=params, timeout=15)
     resp.raise_for_status()
-    return resp.json()
+    data = resp.json()
+    results = data if isinstance(data, list) else [data]
+    if len(results) != len(coords):
+        raise ValueError(
+            f"Open-Meteo returned {len(results)} results for {len(coords)} locations"
+        )
+
+    headers = {"Cache-Control": resp.headers.get("Cache-Control")}
+    for (lat, lon), body in zip(coords, results):
+        key = forecast_cache.cache_key(lat, lon, forecast_params(lat, lon))
+        forecast_cache.store(key, body, headers)
+    return results
 
 
-def fetch_geocode(name: str, count: int = 5) -> list[dict]:
+def fetch_geocode(name: str, count: int = GEOCODE_COUNT) -> list[dict]:
     """Search for cities by name, returning up to `count` results.
 
     Results include latitude, longitude, admin1 (state/region), and
     country for display in the autocomplete dropdown.
     """
-    resp = requests.get(
-        GEOCODE_URL,
-        params={
-            "name": name,
-            "count": count,
-            "language": "en",
-            "format": "json",
-        },
-        timeout=10,
-    )
+    resp = http_client.get(GEOCODE_URL, params=geocode_params(name, count), timeout=10)
     resp.raise_for_status()
     data = resp.json()
     return data.get("results", [])
+
+
+def geocode_params(name: str, count: int = GEOCODE_COUNT) -> dict:
+    """Query parameters for a geocode search (also used by aio_fetch)."""
+    return {
+        "name": name,
+        "count": count,
+        "language": "en",
+        "format": "json",
+    }
@@ -0,0 +1,160 @@
+"""Per-host health: adaptive timeouts, retry backoff and a circuit breaker.
+
+What: one HostHealth per API host (api.open-meteo.com, api.weather.gov,
+      geocoding-api.open-meteo.com), shared by every request to it from
+      either engine -- http_client.get() and aio_http.StreamTransport.
+Why:  with fixed 10-15 s timeouts, a host that was slow or down made every
+      worker wait the full timeout, and every refresh tick and keystroke
+      piled another waiting thread onto it.
+How:  * Adaptive timeout: the last LATENCY_WINDOW successful latencies are
+        kept; once there are MIN_SAMPLES, a request's timeout is
+        TIMEOUT_FACTOR x their p95 (plus a small floor), capped by the
+        caller's own timeout.  A healthy host answers in well under a
+        second, so a stalled request is abandoned in seconds, not 15.
+      * Retry: connection errors, timeouts, 429 and 5xx are retried up to
+        RETRIES times (GETs are idempotent) after a "full jitter" backoff,
+        a random wait in [0, BACKOFF_BASE * 2^attempt].
+      * Circuit breaker: FAILURE_THRESHOLD consecutive failures open the
+        circuit; while open, requests fail at once with CircuitOpenError
+        (open_meteo serves its cache instead).  After the cool-down one
+        probe request is let through (half-open): success closes the
+        circuit, failure re-opens it with the cool-down doubled, up to
+        MAX_COOLDOWN.
+
+stats() reports each host's circuit state, failure streak and p50/p95 latency.
+"""
+import random
+import threading
+import time
+from collections import deque
+
+from ... import metrics
+from ...metrics import percentile, ranked
+
+LATENCY_WINDOW = 50
+MIN_SAMPLES = 5
+TIMEOUT_FACTOR = 4
+TIMEOUT_FLOOR = 2.0          # seconds added on top, for handshakes/jitter
+RETRIES = 2
+BACKOFF_BASE = 0.5
+FAILURE_THRESHOLD = 5
+COOLDOWN = 15.0
+MAX_COOLDOWN = 300.0
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+
+class CircuitOpenError(Exception):
+    """A request was refused without trying: its host's circuit is open."""
+
+
+def backoff(attempt):
+    """Seconds to wait before retry number attempt + 1 (full jitter)."""
+    return random.uniform(0, BACKOFF_BASE * 2 ** attempt)
+
+
+def is_retryable_status(status):
+    return status == 429 or status >= 500
+
+
+class HostHealth:
+    def __init__(self, host, clock=time.monotonic):
+        self.host = host
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self._failures = 0            # consecutive
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._cooldown = COOLDOWN
+        self._probing = False         # the half-open probe is in flight
+
+    def acquire(self):
+        """Permission to send a request; raises CircuitOpenError if refused."""
+        with self._lock:
+            if self._state == CLOSED:
+                return
+            remaining = self._opened_at + self._cooldown - self._clock()
+            if self._state == OPEN and remaining <= 0:
+                self._state = HALF_OPEN
+                self._probing = False
+            if self._state == HALF_OPEN and not self._probing:
+                self._probing = True  # this request is the probe
+                return
+            metrics.count(f"resilience.{self.host}.refused")
+            raise CircuitOpenError(
+                f"{self.host} is unavailable; retrying in {max(1, round(remaining))} s"
+            )
+
+    def timeout(self, ceiling):
+        """Timeout for the next request, never more than the caller's ceiling."""
+        with self._lock:
+            if len(self._latencies) < MIN_SAMPLES:
+                return ceiling
+            p95 = percentile(self._latencies, 95)
+        return min(ceiling, TIMEOUT_FACTOR * p95 + TIMEOUT_FLOOR)
+
+    def success(self, latency):
+        with self._lock:
+            self._latencies.append(latency)
+            self._failures = 0
+            self._state = CLOSED
+            self._probing = False
+            self._cooldown = COOLDOWN
+
+    def failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN:
+                # The probe failed: back off harder before the next one.
+                self._cooldown = min(self._cooldown * 2, MAX_COOLDOWN)
+                self._open()
+            elif self._state == CLOSED and self._failures >= FAILURE_THRESHOLD:
+                self._open()
+
+    def release(self):
+        """Give up the half-open probe slot without a verdict (cancelled)."""
+        with self._lock:
+            self._probing = False
+
+    def _open(self):
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._probing = False
+
+    def stats(self):
+        with self._lock:
+            lat = sorted(self._latencies)
+            state, failures = self._state, self._failures
+        return {
+            "state": state,
+            "failures": failures,
+            "p50_s": round(ranked(lat, 50), 3) if lat else None,
+            "p95_s": round(ranked(lat, 95), 3) if lat else None,
+            "samples": len(lat),
+        }
+
+
+_hosts_lock = threading.Lock()
+_hosts = {}
+
+
+def host(name):
+    """The shared HostHealth for a host name (created on first use)."""
+    with _hosts_lock:
+        health = _hosts.get(name)
+        if health is None:
+            health = _hosts[name] = HostHealth(name)
+        return health
+
+
+def stats():
+    with _hosts_lock:
+        hosts = dict(_hosts)
+    return {name: h.stats() for name, h in hosts.items()}
+
+
+def reset():
+    """Forget every host's history (tests)."""
+    with _hosts_lock:
+        _hosts.clear()
@@ -1,40 +1,60 @@
 """
-QThread workers for non-blocking API calls.
-
-We use the "worker object" pattern instead of subclassing QThread:
-  1. Create a QObject worker with a run() slot
-  2. Move it to a QThread
-  3. Connect thread.started -> worker.run
-  4. Worker emits finished/error signals back to the main thread
+Background workers for non-blocking API calls, run on a shared thread pool.
+
+Each request is a small QObject "worker" with a blocking run() method and
+finished/error signals.  WorkerPool runs workers on a fixed set of
+long-lived QThreadPool threads:
+  1. AppController creates a worker on the main thread and connects its
+     signals to main-thread slots
+  2. WorkerPool.submit(worker, priority) queues it
+  3. A pool thread calls worker.run(), which does the HTTP call
+  4. The worker emits finished/error from the pool thread; because the worker
+     QObject itself still lives on the main thread, Qt queues the emission
+     and the connected slots run on the main thread
+
+Why a pool and not one QThread per request: creating and tearing down an OS
+thread for every debounced geocode keystroke is wasted work, and a user
+typing fast or refreshing many locations could have any number running at
+once.  The pool caps concurrency at max_threads, orders queued jobs by
+priority (active forecast > NWS > geocode > background prefetch), and bounds
+the queue -- when it is full the lowest-priority queued job is dropped.
+
+IMPORTANT: a worker must stay referenced until its signals have been
+delivered, or the queued emissions are lost with it.  WorkerPool holds every
+running worker until its finished/error signal reaches the main thread.
+"""
 
-This keeps the HTTP call off the main thread so the UI stays responsive.
+import heapq
+from itertools import count
 
-IMPORTANT: The caller must hold references to both the thread AND the
-worker object.  If Python GC's the worker while the thread is running,
-the app segfaults.  See run_in_thread() return value and how
-AppController stores both in _forecast_thread/_forecast_worker.
-"""
+from PySide6.QtCore import QObject, QThreadPool, Signal, Slot
 
-from PySide6.QtCore import QObject, QThread, Signal, Slot
+from .open_meteo import fetch_forecast_batch, fetch_geocode
+from .nws import fetch_nws_alerts, fetch_nws_details, index_payload
 
-from .open_meteo import fetch_forecast, fetch_geocode
-from .nws import fetch_nws_details
+# Job priorities for WorkerPool.submit(); higher runs first.
+PRIORITY_FORECAST = 30   # the active location's forecast -- what the user sees
+PRIORITY_NWS = 20        # 7-Day detail panel the user just clicked
+PRIORITY_GEOCODE = 10    # search-as-you-type results
+PRIORITY_PREFETCH = 0    # opportunistic background work
 
 
-class ForecastWorker(QObject):
-    finished = Signal(dict)  # Emits the full API response dict
-    error = Signal(str)      # Emits the exception message on failure
+class BatchForecastWorker(QObject):
+    finished = Signal(list)  # Emits [(lat, lon, response dict), ...]
+    error = Signal(str)
+    dropped = Signal()
 
-    def __init__(self, lat, lon):
+    def __init__(self, coords):
         super().__init__()
-        self._lat = lat
-        self._lon = lon
+        self._coords = list(coords)
 
     @Slot()
     def run(self):
         try:
-            data = fetch_forecast(self._lat, self._lon)
-            self.finished.emit(data)
+            results = fetch_forecast_batch(self._coords)
+            self.finished.emit(
+                [(lat, lon, data) for (lat, lon), data in zip(self._coords, results)]
+            )
         except Exception as e:
             self.error.emit(str(e))
 
@@ -42,6 +62,7 @@ class ForecastWorker(QObject):
 class GeocodeWorker(QObject):
     finished = Signal(list)  # Emits list of geocode result dicts
     error = Signal(str)
+    dropped = Signal()
 
     def __init__(self, query):
         super().__init__()
@@ -57,46 +78,106 @@ class GeocodeWorker(QObject):
 
 
 class NwsWorker(QObject):
-    finished = Signal(dict)  # Emits {"available", "periods", "alerts"}
+    # Emits {"available", "periods", "alerts", "index", ...}, or with
+    # alerts_only {"alerts", "alerts_max_age", "index"}.  object, not dict:
+    # the payload reaches the main thread as the same Python dict, DayIndex
+    # included, with no QVariantMap conversion.
+    finished = Signal(object)
     error = Signal(str)      # Emits the exception message on failure
+    dropped = Signal()       # Evicted from the pool queue before it ran
 
-    def __init__(self, lat, lon):
+    def __init__(self, lat, lon, alerts_only=False):
         super().__init__()
         self._lat = lat
         self._lon = lon
+        # Only the alerts expired: emit a fetch_nws_alerts() update instead.
+        self._fetch = fetch_nws_alerts if alerts_only else fetch_nws_details
 
     @Slot()
     def run(self):
         try:
-            data = fetch_nws_details(self._lat, self._lon)
+            data = self._fetch(self._lat, self._lon)
+            # Parse and index it here, off the GUI thread.
+            index_payload(data)
             self.finished.emit(data)
         except Exception as e:
             self.error.emit(str(e))
 
 
-def run_in_thread(worker):
-    """Move a worker QObject to a new QThread and start it.
-
-    Returns (thread, worker) -- the caller MUST store both references
-    to prevent premature garbage collection (see AppController._active).
+class WorkerPool(QObject):
+    """Fixed pool of long-lived threads running workers by priority.
 
-    How the thread stops:
-      - worker.finished / worker.error -> thread.quit()
-        thread.quit() is a QObject slot and thread-safe, so emitting from the
-        worker thread queues it correctly; the thread's event loop then exits.
-      - Once exec() returns, the thread emits finished() on the main thread,
-        which the caller uses to drop its references and join the thread.
-
-    Why not the old approach: the previous code connected a plain Python
-    closure that called thread.wait().  A non-QObject functor connects as a
-    DirectConnection, so that ran INSIDE the worker thread -- and wait()ing on
-    your own thread is a no-op, so the thread was never actually joined.
+    max_threads bounds concurrent requests; max_queued bounds how many can
+    wait behind them.  The wait queue is a heap kept here on the main thread
+    rather than inside QThreadPool, so a queued job can be evicted (or the
+    queue cleared on shutdown) without racing a pool thread that is about to
+    pick it up.  Results are still delivered on the main thread through each
+    worker's own signals.
     """
-    thread = QThread()
-    worker.moveToThread(thread)
-    thread.started.connect(worker.run)
-    # Stop the thread's event loop once the work is done (success or failure).
-    worker.finished.connect(thread.quit)
-    worker.error.connect(thread.quit)
-    thread.start()
-    return thread, worker
+
+    def __init__(self, max_threads=4, max_queued=16, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_threads)
+        # Never retire idle threads: the whole point is to keep them warm.
+        self._pool.setExpiryTimeout(-1)
+        self._max_threads = max_threads
+        self._max_queued = max_queued
+        self._seq = count()
+        self._queue = []    # heap of (-priority, seq, worker) waiting for a thread
+        self._running = []  # workers handed to a thread, held until released
+
+    def submit(self, worker, priority=PRIORITY_FORECAST):
+        """Queue worker.run() on the pool.  Returns False if it was dropped.
+
+        When the queue is full, the lowest-priority (then oldest) queued job
+        is evicted unless it outranks the new one, in which case the new job
+        itself is dropped.  Either way the loser emits `dropped`.  Evicting
+        the oldest among equals means a burst of keystrokes keeps the latest
+        geocode queries, which are the ones the user still cares about.
+        """
+        # Released on the main thread once the result has been delivered.
+        # The lambda's context object is the worker, which lives on the main
+        # thread, so these connections are queued like the caller's own.
+        worker.finished.connect(lambda *_args, w=worker: self._release(w))
+        worker.error.connect(lambda *_args, w=worker: self._release(w))
+
+        if len(self._queue) >= self._max_queued:
+            weakest = min(self._queue, key=lambda e: (-e[0], e[1]))
+            if -weakest[0] > priority:
+                worker.dropped.emit()
+                return False
+            self._queue.remove(weakest)
+            heapq.heapify(self._queue)
+            weakest[2].dropped.emit()
+
+        heapq.heappush(self._queue, (-priority, next(self._seq), worker))
+        self._dispatch()
+        return True
+
+    def _dispatch(self):
+        """Hand queued workers to idle threads, highest priority first."""
+        while self._queue and len(self._running) < self._max_threads:
+            neg_priority, _seq, worker = heapq.heappop(self._queue)
+            self._running.append(worker)
+            self._pool.start(worker.run, -neg_priority)
+
+    def _release(self, worker):
+        """Forget a finished worker and start the next queued one."""
+        if worker in self._running:
+            self._running.remove(worker)
+        self._dispatch()
+
+    def pending(self):
+        """Number of submitted jobs not yet finished (queued + running)."""
+        return len(self._queue) + len(self._running)
+
+    def shutdown(self, msecs=3000):
+        """Discard queued jobs and wait up to msecs for running ones.
+
+        Returns True if every thread went idle in time.  A pool thread can't
+        be killed mid-request, so on timeout the caller simply moves on; the
+        blocking call still ends at its own socket timeout.
+        """
+        self._queue = []
+        return self._pool.waitForDone(msecs)
@@ -10,27 +10,51 @@ through this object:
   - app.geocodeModel     (GeocodeModel)
   - app.currentConditions (CurrentConditions)
   - app.dayDetail        (DayDetail QObject -- 7-Day NWS detail panel)
-  - app.refresh()        (trigger forecast fetch)
+  - app.refresh()        (trigger forecast fetch for the active location)
+  - app.refreshAll()     (one batched fetch for every saved location)
   - app.searchCity(q)    (trigger geocode search)
   - app.loading / app.error / app.lastUpdate (UI state)
+  - app.clock            (header date/time, updated on the minute tick)
+  - app.metrics          (MetricsView -- debug overlay, `--metrics` only)
 
 Data flow:
-  1. User triggers refresh (button, timer, or location change)
-  2. refresh() spawns a ForecastWorker on a background QThread
-  3. Worker calls Open-Meteo API (blocking HTTP, but off main thread)
-  4. Worker emits finished(dict) which is delivered to main thread
-     via Qt's queued connection (automatic for cross-thread signals)
+  1. User triggers refresh (button, scheduler, or location change)
+  2. refresh() paints the location's snapshot immediately (from memory, or
+     the on-disk cache on first use).  Whatever is stale -- the forecast,
+     the NWS detail, or both -- goes to the RefreshOrchestrator, which
+     fetches them side by side on the asyncio I/O thread.  The refresh
+     scheduler (scheduler.py) instead calls refreshAll(), which fetches
+     every stale saved location in one batched request (a WorkerPool
+     worker) so switching locations is served from memory.
+  3. The requests run off the main thread (coroutines on the I/O loop, or
+     blocking HTTP on a pool thread)
+  4. Results are delivered to the main thread via Qt's queued connection
+     (automatic for cross-thread signals)
   5. _on_forecast() updates all three data models
   6. QML reacts to model signals and repaints
 """
 
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 
-from PySide6.QtCore import QObject, QTimer, Signal, Slot, Property
+from PySide6.QtCore import QObject, Signal, Slot, Property
 
+from .. import metrics, startup_profile
 from .settings import Settings
-from .api.worker import ForecastWorker, GeocodeWorker, NwsWorker, run_in_thread
-from .api.nws import periods_for_date, alerts_for_date, format_expires
+from .inflight import InFlight
+from .orchestrator import RefreshOrchestrator
+from .scheduler import RefreshScheduler
+from .metrics_view import MetricsView
+from .api.worker import (
+    BatchForecastWorker, GeocodeWorker, NwsWorker, WorkerPool,
+    PRIORITY_FORECAST, PRIORITY_GEOCODE, PRIORITY_NWS, PRIORITY_PREFETCH,
+)
+from .api.open_meteo import GEOCODE_COUNT, cached_forecast
+from .api import forecast_cache, http_client, resilience
+from .api.geocode_cache import GeocodeCache
+from .api import gazetteer
+from .api.nws import index_payload, merge_alerts
+from .api.nws_cache import NwsCache
 from .models.day_detail import DayDetail
 from .models.hourly_model import HourlyModel
 from .models.daily_model import DailyModel
@@ -39,15 +63,30 @@ from .models.geocode_model import GeocodeModel
 from .models.current_conditions import CurrentConditions
 
 
+# Fixed English names, as the QML header used: strftime's %A/%b follow the
+# process locale, and the rest of the UI is English.
+_DAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+           "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def clock_text(now):
+    """Header date/time, e.g. "Saturday, Oct 17  \u2022  3:04 PM"."""
+    return (f"{_DAYS[now.weekday()]}, {_MONTHS[now.month - 1]} {now.day}  \u2022  "
+            f"{now.hour % 12 or 12}:{now:%M} {'PM' if now.hour >= 12 else 'AM'}")
+
+
 class AppController(QObject):
     loadingChanged = Signal()
     errorChanged = Signal()
     lastUpdateChanged = Signal()
+    clockChanged = Signal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
 
         self._settings = Settings(self)
+        startup_profile.mark("settings load")
         self._hourly_model = HourlyModel(self)
         self._daily_model = DailyModel(self)
         self._location_model = LocationModel(self)
@@ -55,29 +94,65 @@ class AppController(QObject):
         self._current = CurrentConditions(self)
 
         # NWS day-detail state for the 7-Day tab (app.dayDetail), plus a
-        # per-location in-memory cache of the (one-shot) NWS fetch result.
+        # bounded per-location cache of NWS fetch results, keyed by (lat, lon).
         self._day_detail = DayDetail(self)
-        self._nws_cache = {}  # keyed by (lat, lon); never invalidated, panel collapses on location change
+        self._nws_cache = NwsCache()
+
+        # Latest forecast per saved location, keyed by (lat, lon), in the same
+        # shape as an on-disk cache entry ({"body", "fetched_at", "max_age"}).
+        # Filled by every fetch and by the batched refresh, so switching
+        # locations repopulates the models without a round trip.
+        self._snapshots = {}
+
+        # Recent geocode responses, so repeated or narrowing searches are
+        # answered locally on the same event-loop turn.
+        self._geocode_cache = GeocodeCache()
+        # Optional offline city index (None unless the user installed one).
+        # Opened on the first search rather than at startup -- searching is
+        # never needed before the first frame.
+        self._gazetteer = None
+        self._gazetteer_checked = False
 
         self._loading = False
         self._error = ""
         self._last_update = ""
-
-        # Every in-flight (thread, worker) pair lives here.  We must hold
-        # references to BOTH until the thread has fully stopped, or Python's GC
-        # destroys a running QThread -> qFatal -> SIGABRT.  Using a list (not a
-        # single attribute per kind) means a rapid second refresh can't drop the
-        # first request's thread while it is still running -- each pair is
-        # removed only by _reap(), after its thread emits finished().
-        self._active = []
-
-        # Auto-refresh timer -- restarts whenever the interval changes
-        self._refresh_timer = QTimer(self)
-        self._refresh_timer.timeout.connect(self.refresh)
-        self._update_timer_interval()
+        self._clock = clock_text(datetime.now())
+        self._hourly_data = {}  # raw hourly block of the forecast on screen
+
+        # Every background request runs on this fixed pool of long-lived
+        # threads.  The pool holds each worker until its result has been
+        # delivered, so nothing here needs to keep per-request references.
+        self._pool = WorkerPool(parent=self)
+        # Coalesces duplicate requests and drops superseded responses.
+        self._inflight = InFlight()
+        # asyncio I/O thread for cancellable, deadline-bound requests
+        # (api/io_loop.py), created by _io_loop() on first use.
+        self._io = None
+        # Fans refresh() out to the forecast and NWS providers at once.
+        self._refresher = RefreshOrchestrator(self._io_loop, self)
+        self._refresher.ready.connect(self._on_provider_ready)
+        self._refresher.failed.connect(self._on_provider_failed)
+
+        # Background refreshes, timed to upstream's update cadence and the
+        # window's visibility, plus the minute tick that drives the header
+        # clock and slides the hourly window forward at each new hour from
+        # data we already hold.
+        self._scheduler = RefreshScheduler(self._settings.refreshIntervalMinutes, self)
+        self._scheduler.due.connect(self.refreshAll)
+        self._scheduler.minute.connect(self._on_minute)
+        self._scheduler.start()
+
+        # Runtime metrics (--metrics): app.metrics for the overlay, plus the
+        # stats the caches and HTTP layers already keep, read at snapshot time.
+        self._metrics = MetricsView(self)
+        metrics.add_source("nws_cache", self._nws_cache.stats)
+        metrics.add_source("http_pool", http_client.pool_stats)
+        metrics.add_source("io_transport", self._transport_stats)
+        metrics.add_source("resilience", resilience.stats)
+        metrics.add_source("scheduler", self._scheduler_stats)
 
         # React to settings changes
-        self._settings.refreshIntervalChanged.connect(self._update_timer_interval)
+        self._settings.refreshIntervalChanged.connect(self._update_refresh_interval)
         self._settings.locationsChanged.connect(self._sync_location_model)
         self._settings.activeLocationIndexChanged.connect(self.refresh)
         # Collapse the day-detail panel when the active location changes.
@@ -86,17 +161,67 @@ class AppController(QObject):
         # Initialize location model from saved settings
         self._sync_location_model()
 
-        # If a location was saved from a previous session, fetch data now
+        # If a location was saved from a previous session, fetch data now --
+        # the active one first, then the rest in the background.
         if self._settings.activeLocation is not None:
             self.refresh()
+            self.refreshAll(PRIORITY_PREFETCH)
 
-    def _update_timer_interval(self):
-        mins = self._settings.refreshIntervalMinutes
-        self._refresh_timer.start(mins * 60 * 1000)
+    def _update_refresh_interval(self):
+        self._scheduler.set_interval_minutes(self._settings.refreshIntervalMinutes)
+
+    def watch_window(self, window):
+        """Follow the main window (main.py, before the event loop starts).
+
+        The scheduler tracks its visibility, and no refresh round launches
+        until its first frame is on screen: the first round loads asyncio
+        and ssl, which would otherwise land ahead of the first paint.
+        """
+        self._scheduler.watch(window)
+        self._refresher.hold_until(window.frameSwapped)
+
+    def _transport_stats(self):
+        return dict(getattr(self._io.transport, "stats", {})) if self._io else {}
+
+    def _scheduler_stats(self):
+        due_at = self._scheduler.due_at()
+        return {
+            "exposed": self._scheduler.exposed(),
+            "period_s": self._scheduler.period(),
+            "due_in_s": round(due_at - time.time(), 1) if due_at else None,
+        }
+
+    def _on_minute(self):
+        now = datetime.now()
+        text = clock_text(now)
+        if text != self._clock:
+            self._clock = text
+            self.clockChanged.emit()
+        # Local time, not epoch // 3600: zones with half-hour offsets exist.
+        # advance() is a no-op except in the first tick of a new hour (or
+        # the first after the window was hidden across one).
+        if self._hourly_model.advance(now):
+            self._current.update_from_hourly(self._hourly_data, self._hourly_model.start_idx)
+
+    def _io_loop(self):
+        """The controller's IoLoop, created on first use.
+
+        Imported here rather than at module level: asyncio (and ssl) are a
+        noticeable share of startup and nothing before the first frame
+        needs them.
+        """
+        if self._io is None:
+            from .api.io_loop import IoLoop
+            self._io = IoLoop()
+        return self._io
 
     def _sync_location_model(self):
         """Push the settings location list into the QML-facing model."""
         self._location_model.update(self._settings.locations)
+        # Forget snapshots of locations that were removed.
+        saved = {(loc["lat"], loc["lon"]) for loc in self._settings.locations}
+        self._snapshots = {k: v for k, v in self._snapshots.items() if k in saved}
+        self._scheduler.forget(saved)
 
     # --- Properties exposed to QML ---
     # These are constant=True because the model *objects* never change --
@@ -130,6 +255,10 @@ class AppController(QObject):
     def dayDetail(self):
         return self._day_detail
 
+    @Property(QObject, constant=True)
+    def metrics(self):
+        return self._metrics
+
     @Property(bool, notify=loadingChanged)
     def loading(self):
         return self._loading
@@ -138,6 +267,10 @@ class AppController(QObject):
     def error(self):
         return self._error
 
+    @Property(str, notify=clockChanged)
+    def clock(self):
+        return self._clock
+
     @Property(str, notify=lastUpdateChanged)
     def lastUpdate(self):
         return self._last_update
@@ -146,36 +279,165 @@ class AppController(QObject):
 
     @Slot()
     def refresh(self):
-        """Fetch fresh forecast data for the active location."""
+        """Fetch fresh forecast and NWS data for the active location.
+
+        Stale-while-revalidate: a cached forecast on disk is pushed into the
+        models right away (a local file read), so the window is never empty
+        while the network request runs.  A still-fresh entry skips the
+        request entirely, and so does a refreshAll() batch already in flight
+        for this location, whose result is joined instead.  Whatever does
+        need fetching -- the forecast, the NWS detail (or just its alerts),
+        or both -- goes to the orchestrator as one round, so the two
+        providers run side by side under one deadline.
+        """
         loc = self._settings.activeLocation
         if loc is None:
             return
 
-        self._loading = True
-        self._error = ""
+        key = (loc["lat"], loc["lon"])
+        providers = []
+        cached = self._snapshot(key)
+        if cached is not None:
+            self._apply_forecast(cached["body"], cached["fetched_at"])
+        if cached is not None and forecast_cache.is_fresh(cached):
+            # Nothing to fetch, but any request still in flight (for the
+            # previously active location) must not overwrite this.
+            self._inflight.supersede("forecast")
+        else:
+            self._loading = True
+            self._error = ""
+            self.loadingChanged.emit()
+            self.errorChanged.emit()
+            if any(key in batch for batch in self._inflight.pending_keys("batch")):
+                # A refreshAll() batch in flight already covers this location
+                # and _on_batch() applies it -- join it rather than fetch the
+                # same forecast twice.  Whatever single request is still out
+                # (for the previously active location) mustn't land after it.
+                self._inflight.supersede("forecast")
+            # Already being fetched? Its result is now current; don't repeat it.
+            elif self._inflight.begin("forecast", key):
+                providers.append("forecast")
+
+        part = self._nws_cache.to_fetch(key)
+        if part is not None and self._inflight.begin("nws", key):
+            providers.append("nws" if part == "details" else "nws_alerts")
+        if providers:
+            self._refresher.start(key, providers)
+
+    def _on_provider_ready(self, provider, key, result):
+        if provider == "forecast":
+            self._on_forecast(key, result)
+        elif provider in ("nws", "nws_alerts"):
+            self._on_nws(key, result)
+
+    def _on_provider_failed(self, provider, key, msg):
+        if provider == "forecast":
+            self._on_forecast_error(key, msg)
+        elif provider in ("nws", "nws_alerts"):
+            self._on_nws_error(msg, key)
+
+    def _on_forecast(self, key, data: dict):
+        """Handle successful API response -- update all data models."""
+        self._remember(key, data)
+        self._prefetch_nws(key)
+        if not self._inflight.finish("forecast", key):
+            return  # superseded by a newer refresh while in flight
+        self._apply_forecast(data)
+
+    def _snapshot(self, key):
+        """Latest known forecast entry for a location: memory, then disk."""
+        snap = self._snapshots.get(key)
+        if snap is None:
+            snap = cached_forecast(*key)
+            if snap is not None:
+                self._snapshots[key] = snap
+        return snap
+
+    def _remember(self, key, data):
+        # max_age None -> the cache's default freshness window applies.
+        self._snapshots[key] = {"body": data, "fetched_at": time.time(), "max_age": None}
+        self._scheduler.observe(key, data)
+
+    @Slot()
+    def refreshAll(self, priority=PRIORITY_FORECAST):
+        """Refresh every saved location's forecast in one batched request.
+
+        Locations whose snapshot is still fresh, or that already have a
+        request in flight, are skipped.  Results land in the per-location
+        snapshots; the active location's also goes straight to the models.
+        """
+        active = self._settings.activeLocation
+        active_key = (active["lat"], active["lon"]) if active else None
+        coords = []
+        for loc in self._settings.locations:
+            key = (loc["lat"], loc["lon"])
+            if key in coords or self._inflight.is_pending("forecast", key):
+                continue
+            if forecast_cache.is_fresh(self._snapshot(key)):
+                continue
+            coords.append(key)
+        if not coords:
+            return
+
+        batch_key = tuple(coords)
+        if not self._inflight.begin("batch", batch_key):
+            return
+        if active_key in coords:
+            self._loading = True
+            self.loadingChanged.emit()
+
+        worker = BatchForecastWorker(coords)
+        worker.finished.connect(lambda results, b=batch_key: self._on_batch(b, results))
+        worker.error.connect(lambda msg, b=batch_key: self._on_batch_error(b, msg))
+        worker.dropped.connect(lambda b=batch_key: self._on_batch_error(b, ""))
+        self._pool.submit(worker, priority)
+
+    def _on_batch(self, batch_key, results):
+        self._inflight.finish("batch", batch_key)
+        for lat, lon, data in results:
+            self._remember((lat, lon), data)
+            self._prefetch_nws((lat, lon))
+        loc = self._settings.activeLocation
+        key = (loc["lat"], loc["lon"]) if loc else None
+        if key in batch_key:
+            # Fresher than anything a single-location request still in
+            # flight could bring back, so that one no longer matters.
+            self._inflight.supersede("forecast")
+            self._apply_forecast(self._snapshots[key]["body"])
+
+    def _on_batch_error(self, batch_key, msg):
+        self._inflight.finish("batch", batch_key)
+        loc = self._settings.activeLocation
+        if loc is None or (loc["lat"], loc["lon"]) not in batch_key:
+            return  # only background locations failed; nothing on screen changes
+        self._loading = False
+        self._error = msg
         self.loadingChanged.emit()
         self.errorChanged.emit()
 
-        worker = ForecastWorker(loc["lat"], loc["lon"])
-        worker.finished.connect(self._on_forecast)
-        worker.error.connect(self._on_forecast_error)
-        self._spawn(worker)
+    def _apply_forecast(self, data: dict, fetched_at=None):
+        """Push a forecast response into every data model.
 
-    def _on_forecast(self, data: dict):
-        """Handle successful API response -- update all data models."""
+        fetched_at (epoch seconds) labels "Updated ..." with when the data
+        was actually fetched, which for a cached entry isn't now.
+        """
         hourly = data.get("hourly", {})
         daily = data.get("daily", {})
 
+        self._hourly_data = hourly
         self._hourly_model.update(hourly)
         self._daily_model.update(daily)
         self._current.update_from_hourly(hourly, self._hourly_model.start_idx)
 
+        stamp = datetime.fromtimestamp(fetched_at) if fetched_at else datetime.now()
         self._loading = False
-        self._last_update = datetime.now().strftime("%I:%M %p")
+        self._last_update = stamp.strftime("%I:%M %p")
         self.loadingChanged.emit()
         self.lastUpdateChanged.emit()
 
-    def _on_forecast_error(self, msg: str):
+    def _on_forecast_error(self, key, msg: str):
+        if not self._inflight.finish("forecast", key):
+            return
         self._loading = False
         self._error = msg
         self.loadingChanged.emit()
@@ -185,18 +447,47 @@ class AppController(QObject):
     def searchCity(self, query):
         """Trigger a geocode search.  Called by LocationSearchBar's debounce timer."""
         if len(query) < 2:
+            self._inflight.supersede("geocode")
             self._geocode_model.clear()
             return
 
-        worker = GeocodeWorker(query)
-        worker.finished.connect(self._on_geocode)
-        worker.error.connect(self._on_geocode_error)
-        self._spawn(worker)
+        cached = self._geocode_cache.lookup(query)
+        metrics.count("geocode_cache.hit" if cached is not None else "geocode_cache.miss")
+        if cached is None and self._local_gazetteer() is not None:
+            # Sub-millisecond mmap lookup; fall through to the network only
+            # when the local index knows no place by that name.
+            cached = self._gazetteer.search(query, GEOCODE_COUNT) or None
+            metrics.count("gazetteer.hit" if cached is not None else "gazetteer.miss")
+        if cached is not None:
+            # Answered locally; a slower in-flight query must not replace it.
+            self._inflight.supersede("geocode")
+            self._geocode_model.update(cached)
+            return
 
-    def _on_geocode(self, results: list):
-        self._geocode_model.update(results)
+        if not self._inflight.begin("geocode", query):
+            return
 
-    def _on_geocode_error(self, msg: str):
+        worker = GeocodeWorker(query)
+        worker.finished.connect(lambda results, q=query: self._on_geocode(q, results))
+        worker.error.connect(lambda msg, q=query: self._on_geocode_error(q, msg))
+        worker.dropped.connect(lambda q=query: self._inflight.finish("geocode", q))
+        self._pool.submit(worker, PRIORITY_GEOCODE)
+
+    def _local_gazetteer(self):
+        if not self._gazetteer_checked:
+            self._gazetteer_checked = True
+            self._gazetteer = gazetteer.open_default()
+        return self._gazetteer
+
+    def _on_geocode(self, query, results: list):
+        self._geocode_cache.store(query, results, GEOCODE_COUNT)
+        # Responses can arrive out of order; only the newest query's counts.
+        if self._inflight.finish("geocode", query):
+            self._geocode_model.update(results)
+
+    def _on_geocode_error(self, query, msg: str):
+        if not self._inflight.finish("geocode", query):
+            return
         self._error = msg
         self.errorChanged.emit()
 
@@ -238,7 +529,9 @@ class AppController(QObject):
 
         Clicking the already-open day collapses it. Otherwise we show the day
         and either serve its detail from the per-location cache or kick off a
-        single background NWS fetch (the result covers every day).
+        single background NWS fetch (the result covers every day).  An expired
+        cache entry is still shown at once -- minus alerts that have since
+        ended -- while a fetch refreshes it in the background.
         """
         if date_str == self._day_detail.selectedDate:
             self._day_detail.clear()
@@ -252,110 +545,114 @@ class AppController(QObject):
         key = (loc["lat"], loc["lon"])
         cached = self._nws_cache.get(key)
         if cached is not None:
-            self._populate_detail(date_str, cached)
+            payload, fresh = cached
+            self._populate_detail(date_str, payload, stale=not fresh)
+            if not fresh:
+                self._fetch_nws(key)
             return
 
         self._day_detail.set_loading()
-        worker = NwsWorker(loc["lat"], loc["lon"])
-        worker.finished.connect(
-            lambda payload, k=key, d=date_str: self._on_nws(k, d, payload)
-        )
+        self._fetch_nws(key)
+
+    def _fetch_nws(self, key, priority=PRIORITY_NWS):
+        """Start the NWS fetch for a location unless one is already running.
+
+        Only the alerts are fetched when the cached periods are still fresh.
+        """
+        # One fetch covers every day, so clicking another day while it's in
+        # flight just waits for the same request.
+        if not self._inflight.begin("nws", key):
+            return
+        worker = NwsWorker(*key, alerts_only=self._nws_cache.to_fetch(key) == "alerts")
+        worker.finished.connect(lambda payload, k=key: self._on_nws(k, payload))
         worker.error.connect(lambda msg, k=key: self._on_nws_error(msg, k))
-        self._spawn(worker)
+        worker.dropped.connect(lambda k=key: self._inflight.finish("nws", k))
+        self._pool.submit(worker, priority)
 
-    def _on_nws(self, key, date_str, payload):
-        """Cache a completed NWS fetch and populate the panel if still relevant."""
-        self._nws_cache[key] = payload
+    def _prefetch_nws(self, key):
+        """Warm the NWS cache after a forecast refresh, at background priority.
+
+        Makes the first day click for a location come from memory instead of
+        a spinner.  A location outside NWS coverage is cached as unavailable
+        for a day (and remembered on disk by gridpoint_cache), so it isn't
+        asked about again on every refresh.
+        """
+        if self._nws_cache.to_fetch(key) is not None:
+            self._fetch_nws(key, PRIORITY_PREFETCH)
+
+    def _on_nws(self, key, payload):
+        """Cache a completed NWS fetch and populate the panel if still relevant.
+
+        Even a superseded result is cached -- it's still valid data for that
+        location -- but only the active location's selected day is shown.
+        An alerts-only update is folded into the cached periods.
+        """
+        self._inflight.finish("nws", key)
+        if "periods" in payload:
+            self._nws_cache.put(key, payload)
+        else:
+            cached = self._nws_cache.peek(key)
+            if cached is None:
+                return  # evicted meanwhile; the next refresh fetches it all
+            payload = merge_alerts(cached, payload)
+            self._nws_cache.put_alerts(key, payload)
         loc = self._settings.activeLocation
         if loc is None or (loc["lat"], loc["lon"]) != key:
             return  # active location changed while the request was in flight
-        if self._day_detail.selectedDate == date_str:
+        date_str = self._day_detail.selectedDate
+        if date_str:
             self._populate_detail(date_str, payload)
 
     def _on_nws_error(self, msg: str, key):
+        self._inflight.finish("nws", key)
         # Ignore a failure whose location is no longer active, mirroring the
         # guard in _on_nws so a stale error can't overwrite the current panel.
         loc = self._settings.activeLocation
         if loc is None or (loc["lat"], loc["lon"]) != key:
             return
+        if not self._day_detail.selectedDate or self._nws_cache.peek(key) is not None:
+            return  # a background fetch failed; keep whatever is shown
         self._day_detail.set_error(msg)
 
-    def _populate_detail(self, date_str, payload):
-        """Fill DayDetail from a cached NWS payload for the given date."""
+    def _populate_detail(self, date_str, payload, stale=False):
+        """Fill DayDetail from a cached NWS payload for the given date.
+
+        The rows come from the payload's DayIndex, which NwsWorker built off
+        the GUI thread and which memoizes each day, so clicking through the
+        days parses nothing.  For a stale payload, alerts whose own end time
+        has passed are left out rather than shown until the refresh lands.
+        """
         if not payload.get("available", False):
             self._day_detail.set_unavailable()
             return
 
-        selected = periods_for_date(payload["periods"], date_str)
-        period_list = []
-        for period in (selected["day"], selected["night"]):
-            if period:
-                period_list.append({
-                    "name": period.get("name", ""),
-                    "text": period.get("detailedForecast", ""),
-                })
-
-        alert_list = []
-        for props in alerts_for_date(payload["alerts"], date_str):
-            end = props.get("expires") or props.get("ends")
-            alert_list.append({
-                "event": props.get("event", "Alert"),
-                "headline": props.get("headline", ""),
-                "severity": props.get("severity", "Unknown"),
-                "text": props.get("description", ""),
-                "expiresText": format_expires(end),
-            })
-
+        now = datetime.now(timezone.utc) if stale else None
+        period_list, alert_list = index_payload(payload).detail(date_str, now)
         self._day_detail.set_data(period_list, alert_list)
 
-    # --- Background thread lifecycle ---
-
-    def _spawn(self, worker):
-        """Start a worker on its own thread and track it until it finishes.
-
-        We keep the (thread, worker) pair in self._active so neither is GC'd
-        while running, and reap it once the thread has fully stopped.
-        """
-        thread, worker = run_in_thread(worker)
-        self._active.append((thread, worker))
-        # thread.finished is emitted on the main thread once exec() returns,
-        # so _reap runs where it's safe to drop the references and join.
-        thread.finished.connect(lambda t=thread: self._reap(t))
-
-    def _reap(self, thread):
-        """Drop references to a thread that has finished running.
-
-        Called on the main thread via thread.finished.  The thread is no
-        longer running, so removing the last reference (and letting GC delete
-        the QThread) is safe -- this is what avoids the "destroyed while
-        running" abort without ever blocking the event loop.
-        """
-        thread.wait()  # returns immediately; just guarantees a clean join
-        self._active = [(t, w) for (t, w) in self._active if t is not thread]
-
     # --- Shutdown ---
 
     def shutdown(self):
-        """Stop all background threads before the app tears down.
-
-        What: quit + join every active worker QThread (and stop the timer).
-        Why:  a QThread destroyed while still running makes Qt call qFatal()
-              ("QThread: Destroyed while thread is still running") -> SIGABRT.
-              That happens if the user quits while an HTTP request is in-flight,
-              because main.py's `del controller` then GC's a running QThread.
-        How:  ask each thread's event loop to quit, then wait() to join it.
-              The worker's run() is a blocking requests.get(), so quit() only
-              takes effect once that call returns; we bound the wait and fall
-              back to terminate() so shutdown can't hang on a stalled network.
+        """Stop all background work before the app tears down.
+
+        What: stop the scheduler, cancel async requests, drop queued requests
+              and join the pool threads, then write any settings change
+              still waiting on its debounce.
+        Why:  a worker still running when main.py's `del controller` tears the
+              objects down would emit into deleted receivers; Qt's pool also
+              blocks in its destructor until its threads are idle.
+        How:  WorkerPool.shutdown() discards everything not yet started and
+              waits, bounded to 3s, for the running requests.  Those are
+              blocking requests.get() calls that can't be interrupted, so on
+              timeout we move on and they end at their own socket timeout.
+              Requests on the I/O loop are simply cancelled, at once.
         """
-        self._refresh_timer.stop()
-        # Copy the list: _reap() mutates self._active as threads finish.
-        for thread, _worker in list(self._active):
-            if not thread.isRunning():
-                continue
-            thread.quit()
-            # Join, bounded to 3s. requests has its own 10-15s timeout, but we
-            # don't want quitting the app to block that long on a hung socket.
-            if not thread.wait(3000):
-                thread.terminate()  # last resort; we're exiting anyway
-                thread.wait()
+        self._scheduler.stop()
+        self._refresher.cancel_all()
+        if self._io is not None:
+            self._io.shutdown()
+        self._pool.shutdown(3000)
+        self._settings.flush()
+        if self._gazetteer is not None:
+            self._gazetteer.close()
+            self._gazetteer = None
@@ -0,0 +1,59 @@
+"""
+Bookkeeping for in-flight requests: coalescing + latest-wins.
+
+AppController has several triggers that can ask for the same data at once
+(timer tick, location switch, addGeocodedLocation, addManualLocation -- which
+also fires activeLocationIndexChanged), and debounced geocode queries whose
+responses can arrive out of order.  Without this, every trigger spawned its
+own worker and every response reset the models, even superseded ones.
+
+Two rules, applied per request *kind* ("forecast", "geocode", "nws"):
+  1. Coalescing: a request whose identity (kind + key) is already in flight
+     doesn't start a second worker -- the caller attaches to the existing one.
+  2. Latest wins: each begin() bumps the kind's generation counter.  A
+     response is only applied if its request still carries the newest
+     generation; anything older was superseded while in flight and is
+     dropped before it reaches the models.
+
+Attaching to an in-flight request re-stamps it with the new generation, so
+switching A -> B -> A while A's fetch is still running makes that original
+fetch current again instead of discarding it.
+"""
+
+
+class InFlight:
+    def __init__(self):
+        self._generation = {}  # kind -> latest generation number
+        self._pending = {}     # (kind, key) -> generation that request answers
+
+    def begin(self, kind, key):
+        """Register interest in (kind, key).
+
+        Returns True if the caller must start a worker, False if an identical
+        request is already in flight (the caller just waits for it).
+        """
+        gen = self._generation.get(kind, 0) + 1
+        self._generation[kind] = gen
+        is_new = (kind, key) not in self._pending
+        self._pending[(kind, key)] = gen
+        return is_new
+
+    def supersede(self, kind):
+        """Invalidate every in-flight request of a kind without starting one.
+
+        Used when the current answer came from somewhere else (e.g. a fresh
+        cache entry) or was cleared, so late responses must not overwrite it.
+        """
+        self._generation[kind] = self._generation.get(kind, 0) + 1
+
+    def finish(self, kind, key):
+        """Mark (kind, key) done; True if its response is still the latest."""
+        gen = self._pending.pop((kind, key), None)
+        return gen is not None and gen == self._generation.get(kind)
+
+    def is_pending(self, kind, key):
+        return (kind, key) in self._pending
+
+    def pending_keys(self, kind):
+        """Keys of every in-flight request of a kind (e.g. the batches)."""
+        return [key for k, key in self._pending if k == kind]
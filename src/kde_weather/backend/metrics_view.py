@@ -0,0 +1,80 @@
+"""
+Qt side of kde_weather/metrics.py: app.metrics and the SIGUSR1 dump.
+
+What: MetricsView, exposed to QML as app.metrics for the debug overlay
+      (MetricsOverlay.qml), and dump_on_sigusr1(), which writes a snapshot
+      whenever the process gets SIGUSR1.
+Why:  a running session's numbers should be readable without quitting it:
+      on screen, or from a shell with `kill -USR1 <pid>`.
+How:  the overlay polls summary() once a second while it is shown; nothing
+      is pushed.  A Python signal handler only runs when the interpreter
+      next gets control, which inside Qt's event loop may be never, so the
+      signal is routed through signal.set_wakeup_fd() into a socket that a
+      QSocketNotifier watches -- no polling timer, no extra wakeups.
+"""
+
+import signal
+import socket
+
+from PySide6.QtCore import QObject, QSocketNotifier, Property, Slot
+
+from .. import metrics
+
+
+class MetricsView(QObject):
+    @Property(bool, constant=True)
+    def enabled(self):
+        return metrics.active()
+
+    @Slot(result="QVariantMap")
+    def snapshot(self):
+        return metrics.snapshot() or {}
+
+    @Slot(result=str)
+    def summary(self):
+        """Plain-text digest of the snapshot for the overlay."""
+        snap = metrics.snapshot()
+        if snap is None:
+            return ""
+        lines = [f"uptime {snap['uptime_s']:.0f} s"]
+        for name, rate in snap["hit_rates"].items():
+            lines.append(f"{name} hit rate  {'-' if rate is None else f'{rate:.0%}'}")
+        for name, h in snap["histograms"].items():
+            if name.endswith("_s"):
+                lines.append(f"{name}  n={h['count']}  p50={h['p50'] * 1000:.1f} ms  "
+                             f"p95={h['p95'] * 1000:.1f} ms  max={h['max'] * 1000:.1f} ms")
+            else:
+                lines.append(f"{name}  n={h['count']}  p50={h['p50']:.0f}  max={h['max']:.0f}")
+        for name, value in snap["counters"].items():
+            lines.append(f"{name}  {value}")
+        return "\n".join(lines)
+
+
+def dump_on_sigusr1(parent, path=None):
+    """Dump a snapshot to path (or stdout) on every SIGUSR1.
+
+    Returns the QSocketNotifier (owned by parent), or None where SIGUSR1
+    doesn't exist.
+    """
+    if not hasattr(signal, "SIGUSR1"):
+        return None
+    receive, send = socket.socketpair()
+    send.setblocking(False)
+    receive.setblocking(False)
+    signal.set_wakeup_fd(send.fileno())
+    # The handler itself does nothing; the wakeup byte does the work.
+    signal.signal(signal.SIGUSR1, lambda *_args: None)
+
+    def drain():
+        try:
+            data = receive.recv(64)
+        except BlockingIOError:
+            return
+        if signal.SIGUSR1 in data:
+            metrics.dump(path)
+
+    notifier = QSocketNotifier(receive.fileno(), QSocketNotifier.Read, parent)
+    notifier.activated.connect(drain)
+    # Keep both ends alive as long as the notifier.
+    notifier._sockets = (receive, send)
+    return notifier
@@ -0,0 +1,87 @@
+"""
+Axis layout for WeatherChart.qml, computed in Python once per window.
+
+Formerly each chart's updateChart() worked this out in JavaScript on every
+dataVersion bump -- min/max over every point, a "nice" tick interval, the
+6-hour x-axis snapping and the alternating day bands -- ten times over.
+HourlyModel.chartLayout() now calls these once per chart per window change
+and hands QML the finished numbers.
+
+Y axis: snapped to a clean interval so labels land on round numbers (10°F
+steps, 10% steps, ...), with at least one interval of range, and an
+optional floor (clamp_min) so e.g. wind never shows a negative axis.
+
+X axis: the min is snapped back to the previous 6-hour local-time boundary
+(midnight, 6am, noon, 6pm) before the first point, and the max forward to
+the first boundary at or past the last point, so every tick is a clean
+clock mark like "Fri 6 PM".
+
+Day bands: one per calendar day inside the x range, alternating "even",
+which WeatherChart shades with a faint tint to show day transitions.
+"""
+
+import math
+from datetime import datetime, timedelta
+
+SIX_HOURS_MS = 6 * 3600 * 1000
+DAY_MS = 24 * 3600 * 1000
+
+
+def nice_interval(span):
+    """Step size giving ~5 ticks over span, rounded to 1/2/5 x 10^n."""
+    if span <= 0:
+        return 1
+    raw = span / 5
+    exp = math.floor(math.log10(raw))
+    frac = raw / 10 ** exp
+    nice = 1 if frac < 1.5 else 2 if frac < 3 else 5 if frac < 7 else 10
+    return nice * 10 ** exp
+
+
+def y_axis(values, clamp_min=-1e9):
+    """{"yMin", "yMax", "yTickCount"} for an iterable of y values."""
+    lo, hi = min(values), max(values)
+    interval = nice_interval(hi - lo)
+    axis_min = math.floor(lo / interval) * interval
+    axis_max = math.ceil(hi / interval) * interval
+    # Ensure at least one interval of headroom on each side
+    if axis_min == axis_max:
+        axis_min -= interval
+        axis_max += interval
+    axis_min = max(axis_min, clamp_min)
+    return {
+        "yMin": axis_min,
+        "yMax": axis_max,
+        "yTickCount": round((axis_max - axis_min) / interval) + 1,
+    }
+
+
+def x_axis(start_ms, end_ms):
+    """{"xMinMs", "xMaxMs", "xTickCount", "dayBands"} for a data span (epoch ms)."""
+    start = datetime.fromtimestamp(start_ms / 1000)
+    snap = start.replace(hour=start.hour // 6 * 6, minute=0, second=0, microsecond=0)
+    snap_ms = snap.timestamp() * 1000
+    # Ceil so the final tick is always at or beyond the last point.
+    intervals = max(1, math.ceil((end_ms - snap_ms) / SIX_HOURS_MS))
+    axis_max_ms = snap_ms + intervals * SIX_HOURS_MS
+
+    midnight_ms = (snap.replace(hour=0) + timedelta(days=1)).timestamp() * 1000
+    if midnight_ms >= axis_max_ms:
+        # Everything falls within a single calendar day
+        bands = [{"startMs": snap_ms, "endMs": axis_max_ms, "even": True}]
+    else:
+        bands = [{"startMs": snap_ms, "endMs": midnight_ms, "even": True}]
+        band_start = midnight_ms
+        while band_start < axis_max_ms:
+            bands.append({
+                "startMs": band_start,
+                "endMs": min(band_start + DAY_MS, axis_max_ms),
+                "even": len(bands) % 2 == 0,
+            })
+            band_start += DAY_MS
+    return {
+        "xMinMs": snap_ms,
+        "xMaxMs": axis_max_ms,
+        "xTickCount": intervals + 1,
+        "dayBands": bands,
+    }
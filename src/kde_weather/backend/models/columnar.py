@@ -0,0 +1,124 @@
+"""
+Columnar storage shared by HourlyModel and DailyModel.
+
+Open-Meteo already returns data column-wise ({"temperature_2m": [...], ...}),
+so instead of pivoting it into one Python dict per row we keep it that way:
+one contiguous array per field.  Numeric fields are array('d') with NaN
+standing in for a missing (null) value; text fields (ISO times, sunrise,
+sunset) are tuples of str.
+
+A ColumnStore is built once per update() and never mutated afterwards, so a
+model refresh is just swapping the store reference.  Models precompute a
+role -> column-index table once per class (see role_columns()), which makes
+data() a pair of list/array indexes with no per-call dict building.
+
+Rows are cheap views (RowView) over the columns rather than materialized
+dicts, for code that still wants row-shaped access.
+
+Slicing (store[a:b]) and changed_roles() are what row_diff.replace_rows()
+needs to move a model between two stores incrementally.
+"""
+
+from array import array
+
+_NAN = float("nan")
+
+
+def role_columns(keys, fields):
+    """Map each Qt role in keys [(role, api_key), ...] to its column index."""
+    index = {name: i for i, name in enumerate(fields)}
+    return {role: index[key] for role, key in keys}
+
+
+def changed_roles(old, new, role_cols):
+    """row_diff changed_roles() callback comparing two ColumnStores.
+
+    role_cols is a model's role -> column index table.  Missing (NaN) equals
+    missing, so a null that stays null isn't reported as a change.
+    """
+    pairs = [(role, old._columns[c], new._columns[c]) for role, c in role_cols.items()]
+
+    def diff(i, j):
+        return tuple(
+            role for role, a, b in pairs
+            if a[i] != b[j] and (a[i] == a[i] or b[j] == b[j])
+        )
+    return diff
+
+
+class ColumnStore:
+    def __init__(self, fields, text_fields=(), columns=None, length=0):
+        self.fields = tuple(fields)
+        self.text_fields = frozenset(text_fields)
+        self._index = {name: i for i, name in enumerate(self.fields)}
+        self._columns = columns if columns is not None else [
+            () if f in self.text_fields else array("d") for f in self.fields
+        ]
+        self._length = length
+
+    @classmethod
+    def from_api(cls, fields, text_fields, data, start=0, stop=None):
+        """Build a store from Open-Meteo column arrays, sliced to [start, stop).
+
+        Length follows data["time"]; columns shorter than that are padded
+        with missing values so every column has the same length.
+        """
+        times = data.get("time", [])
+        stop = len(times) if stop is None else min(stop, len(times))
+        start = min(start, stop)
+        length = stop - start
+        columns = []
+        for f in fields:
+            vals = data.get(f, [])[start:stop]
+            pad = length - len(vals)
+            if f in text_fields:
+                columns.append(tuple(vals) + ("",) * pad)
+            else:
+                columns.append(array(
+                    "d", [_NAN if v is None else v for v in vals] + [_NAN] * pad
+                ))
+        return cls(fields, text_fields, columns, length)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, rows):
+        """Row slice: store[a:b] is a new ColumnStore over those rows."""
+        start, stop, _ = rows.indices(self._length)
+        stop = max(start, stop)
+        return ColumnStore(self.fields, self.text_fields,
+                           [c[start:stop] for c in self._columns], stop - start)
+
+    def column(self, name):
+        """The raw column (array('d') or tuple) for a field name."""
+        return self._columns[self._index[name]]
+
+    def value(self, row, col):
+        """Value at (row, column index); None for missing numeric values."""
+        v = self._columns[col][row]
+        # NaN is the only value not equal to itself
+        return None if v != v else v
+
+    def get(self, row, name):
+        return self.value(row, self._index[name])
+
+    def row(self, i):
+        return RowView(self, i)
+
+
+class RowView:
+    """Read-only dict-like view of one row; no per-row storage of its own."""
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store, row):
+        self._store = store
+        self._row = row
+
+    def get(self, name, default=None):
+        if name not in self._store._index:
+            return default
+        return self._store.get(self._row, name)
+
+    def __getitem__(self, name):
+        return self._store.get(self._row, name)
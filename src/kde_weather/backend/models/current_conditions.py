@@ -14,6 +14,8 @@ update together (one API call refreshes everything at once), and having
 
 from PySide6.QtCore import QObject, Signal, Property
 
+from ... import metrics
+
 
 class CurrentConditions(QObject):
     changed = Signal()
@@ -74,6 +76,7 @@ class CurrentConditions(QObject):
     def cloudCover(self):
         return self._cloud_cover
 
+    @metrics.timed("current_conditions.update_s")
     def update_from_hourly(self, hourly: dict, start_idx: int = 0):
         """Extract values at start_idx from each hourly array for current conditions.
 
@@ -6,11 +6,23 @@ wind max, weather code, and sunrise/sunset times.  Used by DailyView.qml's
 Repeater to render DayCard components.
 
 The _KEYS table centralizes the (role, api_key) mapping so we don't
-repeat it across roleNames(), data(), and update().
+repeat it across roleNames(), data(), and update().  Rows are stored
+column-wise (see columnar.py); _ROLE_COLUMNS turns a role into a column
+index once per class, so data() is a direct lookup.
+
+update() diffs against the current days instead of resetting (see
+row_diff.py), so a refresh that moves a few numbers only updates those
+DayCard bindings rather than rebuilding the whole strip.
 """
 
 from PySide6.QtCore import QAbstractListModel, Qt, QModelIndex
 
+from ... import metrics
+from .columnar import ColumnStore, changed_roles, role_columns
+from .row_diff import replace_rows, window_shift
+
+_TEXT_FIELDS = ("time", "sunrise", "sunset")
+
 
 class DailyModel(QAbstractListModel):
     DateRole = Qt.UserRole + 1
@@ -46,9 +58,12 @@ class DailyModel(QAbstractListModel):
         (SunsetRole, "sunset"),
     ]
 
+    _FIELDS = tuple(key for _, key in _KEYS)
+    _ROLE_COLUMNS = role_columns(_KEYS, _FIELDS)
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._rows = []
+        self._store = ColumnStore(self._FIELDS, _TEXT_FIELDS)
 
     def roleNames(self):
         """Map role enums to QML property names for delegate access."""
@@ -71,30 +86,33 @@ class DailyModel(QAbstractListModel):
         return names
 
     def rowCount(self, parent=QModelIndex()):
-        return len(self._rows)
+        return len(self._store)
 
     def data(self, index, role=Qt.DisplayRole):
-        if not index.isValid() or index.row() >= len(self._rows):
+        col = self._ROLE_COLUMNS.get(role)
+        if col is None or not index.isValid():
+            return None
+        row = index.row()
+        if row >= len(self._store):
             return None
-        row = self._rows[index.row()]
-        for r, key in self._KEYS:
-            if role == r:
-                return row.get(key)
-        return None
+        return self._store.value(row, col)
 
+    @metrics.timed("daily_model.update_s")
     def update(self, daily_data: dict):
-        """Replace all rows with fresh API daily data.
+        """Move to fresh API daily data.
 
         Open-Meteo returns daily arrays keyed by parameter name, all the
-        same length.  We pivot them into per-day row dicts for the model.
+        same length, which become the store's columns as-is.  Days that
+        dropped off the front are removed, new days appended, and changed
+        values signalled per cell.
         """
-        self.beginResetModel()
-        times = daily_data.get("time", [])
-        self._rows = []
-        for i in range(len(times)):
-            row = {}
-            for _, key in self._KEYS:
-                vals = daily_data.get(key, [])
-                row[key] = vals[i] if i < len(vals) else None
-            self._rows.append(row)
-        self.endResetModel()
+        store = ColumnStore.from_api(self._FIELDS, _TEXT_FIELDS, daily_data)
+        old = self._store
+        replace_rows(
+            self, old, store, self._assign,
+            changed_roles(old, store, self._ROLE_COLUMNS),
+            window_shift(old.column("time"), store.column("time")),
+        )
+
+    def _assign(self, store):
+        self._store = store
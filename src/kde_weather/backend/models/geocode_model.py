@@ -9,10 +9,24 @@ called, which reads the raw result dict via get() and saves it.
 The DisplayRole builds a "City, State, Country" string for the dropdown --
 Open-Meteo's geocoding API returns these as separate fields (name, admin1,
 country) so we join them here.
+
+Results are swapped in with row_diff.replace_rows() rather than a reset,
+so refining a query only touches the dropdown rows that actually changed.
 """
 
 from PySide6.QtCore import QAbstractListModel, Qt, QModelIndex
 
+from .row_diff import dict_roles, replace_rows
+
+
+def _display(r):
+    parts = [r.get("name", "")]
+    if r.get("admin1"):
+        parts.append(r["admin1"])
+    if r.get("country"):
+        parts.append(r["country"])
+    return ", ".join(parts)
+
 
 class GeocodeModel(QAbstractListModel):
     NameRole = Qt.UserRole + 1
@@ -22,6 +36,16 @@ class GeocodeModel(QAbstractListModel):
     LonRole = Qt.UserRole + 5
     DisplayRole = Qt.UserRole + 6
 
+    # role -> value data() reports for a result dict
+    _GETTERS = {
+        NameRole: lambda r: r.get("name", ""),
+        AdminRole: lambda r: r.get("admin1", ""),
+        CountryRole: lambda r: r.get("country", ""),
+        LatRole: lambda r: r.get("latitude", 0.0),
+        LonRole: lambda r: r.get("longitude", 0.0),
+        DisplayRole: _display,
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._results = []
@@ -42,36 +66,19 @@ class GeocodeModel(QAbstractListModel):
     def data(self, index, role=Qt.DisplayRole):
         if not index.isValid() or index.row() >= len(self._results):
             return None
-        r = self._results[index.row()]
-        if role == self.NameRole:
-            return r.get("name", "")
-        if role == self.AdminRole:
-            return r.get("admin1", "")
-        if role == self.CountryRole:
-            return r.get("country", "")
-        if role == self.LatRole:
-            return r.get("latitude", 0.0)
-        if role == self.LonRole:
-            return r.get("longitude", 0.0)
-        if role == self.DisplayRole:
-            parts = [r.get("name", "")]
-            if r.get("admin1"):
-                parts.append(r["admin1"])
-            if r.get("country"):
-                parts.append(r["country"])
-            return ", ".join(parts)
-        return None
+        get = self._GETTERS.get(role)
+        return get(self._results[index.row()]) if get else None
 
     def update(self, results: list):
-        self.beginResetModel()
-        self._results = list(results)
-        self.endResetModel()
+        old, new = self._results, list(results)
+        replace_rows(self, old, new, self._assign, dict_roles(old, new, self._GETTERS))
 
     def clear(self):
         """Empty the results, e.g. after the user selects a result."""
-        self.beginResetModel()
-        self._results = []
-        self.endResetModel()
+        self.update([])
+
+    def _assign(self, results):
+        self._results = results
 
     def get(self, index: int) -> dict | None:
         """Return the raw API result dict at index for saving to settings."""
@@ -4,25 +4,79 @@ QAbstractListModel for 48-hour hourly forecast data.
 This model serves two purposes:
   1. Standard list model for any QML ListView/Repeater that wants row-level
      access via role names (e.g. model.temperature, model.humidity)
-  2. Chart data provider via seriesData() -- returns pre-formatted [{x, y}]
-     arrays that WeatherChart.qml can feed directly to a SplineSeries
+  2. Chart data provider: feedSeries() loads a WeatherChart's SplineSeries
+     in one native QXYSeries.replace() call, and chartLayout() returns its
+     precomputed axes and day bands (see chart_axes.py).  seriesData()
+     returns the same points as a plain [{x, y}] array, which the tests and
+     tests/benchmark.py read.
 
 The 48-hour window is a deliberate cap.  Open-Meteo returns 168 hours
 (7 days) of hourly data, but beyond 48 hours the hourly view gets too
 wide and the daily view is more useful.
 
+The full horizon is kept, though: the window is a slice of it starting at
+start_idx (the first hour >= now).  When the clock crosses an hour,
+advance() slides the window forward locally -- one row off the front, one
+appended -- so "now" stays correct between network refreshes.
+AppController calls it from its minute tick (scheduler.py).
+
 dataVersion / dataVersionChanged:
   QML declarative bindings can't detect when a Slot method like
   seriesData() would return different results.  We increment dataVersion
   after each update() so QML can bind to it as a dependency trigger --
-  when it changes, HourlyView.qml imperatively re-calls seriesData()
-  for each chart.  This is the standard workaround for "imperative data
+  when it changes, HourlyView.qml imperatively tells each chart to
+  re-feed itself.  This is the standard workaround for "imperative data
   in a declarative binding world" in Qt Quick.
+
+Storage is columnar (see columnar.py): one typed array per field, with the
+role -> column table built once for the class, so data() allocates nothing.
+
+update() doesn't reset the model: the hours that slid out of the window are
+removed, new hours are appended, and only cells whose values moved get a
+dataChanged (see row_diff.py).  A refresh that changes nothing leaves
+dataVersion alone, so the charts aren't redrawn either.
+
+Chart x values (epoch ms) are parsed from the ISO times once per update()
+into their own column.  Series, QPointF lists and axis layouts are memoized
+until the window changes, so re-feeding a chart does no parsing or per-point
+work in Python or JavaScript.
 """
 
-from datetime import datetime, timezone
+from array import array
+from datetime import datetime
+
+from PySide6.QtCharts import QXYSeries
+from PySide6.QtCore import (
+    QAbstractListModel, QModelIndex, QObject, QPointF, Qt, Slot, Signal, Property,
+)
+
+from ... import metrics
+from . import chart_axes
+from .columnar import ColumnStore, changed_roles, role_columns
+from .row_diff import replace_rows, window_shift
+
+# Column order of the store; "time" is the only text column.
+_FIELDS = (
+    "time", "temperature_2m", "apparent_temperature", "relative_humidity_2m",
+    "precipitation_probability", "rain", "snowfall", "snow_depth",
+    "cloud_cover", "wind_speed_10m", "wind_gusts_10m",
+    "wind_direction_10m", "weather_code",
+)
+_TEXT_FIELDS = ("time",)
 
-from PySide6.QtCore import QAbstractListModel, Qt, QModelIndex, Slot, Signal, Property
+# QML-friendly series names used by seriesData() -> Open-Meteo API key.
+_SERIES_KEYS = {
+    "temperature": "temperature_2m",
+    "apparentTemperature": "apparent_temperature",
+    "humidity": "relative_humidity_2m",
+    "precipProbability": "precipitation_probability",
+    "rain": "rain",
+    "snowfall": "snowfall",
+    "snowDepth": "snow_depth",
+    "cloudCover": "cloud_cover",
+    "windSpeed": "wind_speed_10m",
+    "windGusts": "wind_gusts_10m",
+}
 
 
 class HourlyModel(QAbstractListModel):
@@ -43,9 +97,34 @@ class HourlyModel(QAbstractListModel):
     WindDirRole = Qt.UserRole + 12
     WeatherCodeRole = Qt.UserRole + 13
 
+    # Single source of truth: (Qt role, Open-Meteo API key)
+    _KEYS = [
+        (TimeRole, "time"),
+        (TempRole, "temperature_2m"),
+        (ApparentTempRole, "apparent_temperature"),
+        (HumidityRole, "relative_humidity_2m"),
+        (PrecipProbRole, "precipitation_probability"),
+        (RainRole, "rain"),
+        (SnowfallRole, "snowfall"),
+        (SnowDepthRole, "snow_depth"),
+        (CloudCoverRole, "cloud_cover"),
+        (WindSpeedRole, "wind_speed_10m"),
+        (WindGustsRole, "wind_gusts_10m"),
+        (WindDirRole, "wind_direction_10m"),
+        (WeatherCodeRole, "weather_code"),
+    ]
+    _ROLE_COLUMNS = role_columns(_KEYS, _FIELDS)
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._rows = []
+        self._horizon = ColumnStore(_FIELDS, _TEXT_FIELDS)  # every hour the API sent
+        self._horizon_ms = array("d")  # epoch ms per horizon hour, parsed once per update()
+        self._store = self._horizon    # the visible 48-hour slice of _horizon
+        self._epoch_ms = array("d")    # x value per visible row
+        self._series_cache = {}        # series key -> [{x, y}], cleared when the window changes
+        self._point_cache = {}         # series key -> [QPointF], likewise
+        self._layout_cache = {}        # (tuple(keys), clamp_min) -> axis layout, likewise
+        self._x_layout_cache = {}      # (first_ms, last_ms) -> x axis + day bands, likewise
         self._data_version = 0
         self.start_idx = 0  # index into raw API arrays for the current hour
 
@@ -72,110 +151,163 @@ class HourlyModel(QAbstractListModel):
         }
 
     def rowCount(self, parent=QModelIndex()):
-        return len(self._rows)
+        return len(self._store)
 
     def data(self, index, role=Qt.DisplayRole):
-        if not index.isValid() or index.row() >= len(self._rows):
+        col = self._ROLE_COLUMNS.get(role)
+        if col is None or not index.isValid():
             return None
-        row = self._rows[index.row()]
-        # Map Qt role enum -> Open-Meteo API key name
-        role_map = {
-            self.TimeRole: "time",
-            self.TempRole: "temperature_2m",
-            self.ApparentTempRole: "apparent_temperature",
-            self.HumidityRole: "relative_humidity_2m",
-            self.PrecipProbRole: "precipitation_probability",
-            self.RainRole: "rain",
-            self.SnowfallRole: "snowfall",
-            self.SnowDepthRole: "snow_depth",
-            self.CloudCoverRole: "cloud_cover",
-            self.WindSpeedRole: "wind_speed_10m",
-            self.WindGustsRole: "wind_gusts_10m",
-            self.WindDirRole: "wind_direction_10m",
-            self.WeatherCodeRole: "weather_code",
-        }
-        key = role_map.get(role)
-        if key:
-            return row.get(key)
-        return None
+        row = index.row()
+        if row >= len(self._store):
+            return None
+        return self._store.value(row, col)
 
+    @metrics.timed("hourly_model.update_s")
     def update(self, hourly_data: dict):
-        """Replace all rows with fresh API data, 48 hours starting from now.
+        """Move to fresh API data, 48 hours starting from now.
 
         Open-Meteo returns data from local midnight, so we skip past-hours
         and show 48 hours of forecast beginning at the current hour.
         Called from AppController._on_forecast() on the main thread.
         """
-        self.beginResetModel()
-        times = hourly_data.get("time", [])
-
-        # Find first time slot >= current hour so the chart's left edge is "now"
-        now_hour = datetime.now().replace(minute=0, second=0, microsecond=0)
-        self.start_idx = 0
-        for idx, t in enumerate(times):
-            try:
-                if datetime.fromisoformat(t) >= now_hour:
-                    self.start_idx = idx
-                    break
-            except (ValueError, TypeError):
-                pass
-
-        count = min(len(times) - self.start_idx, 48)
-        self._rows = []
-        for i in range(self.start_idx, self.start_idx + count):
-            row = {"time": times[i]}
-            for key in [
-                "temperature_2m", "apparent_temperature", "relative_humidity_2m",
-                "precipitation_probability", "rain", "snowfall", "snow_depth",
-                "cloud_cover", "wind_speed_10m", "wind_gusts_10m",
-                "wind_direction_10m", "weather_code",
-            ]:
-                vals = hourly_data.get(key, [])
-                row[key] = vals[i] if i < len(vals) else None
-            self._rows.append(row)
-        self.endResetModel()
+        self._horizon = ColumnStore.from_api(_FIELDS, _TEXT_FIELDS, hourly_data)
+        self._horizon_ms = _epoch_ms(self._horizon.column("time"))
+        self._show(self._current_start())
+
+    def advance(self, now=None):
+        """Slide the window to the hour containing now, without new data.
+
+        Returns True if start_idx moved (the caller then refreshes anything
+        else keyed on it, e.g. CurrentConditions).
+        """
+        start_idx = self._current_start(now)
+        if start_idx == self.start_idx:
+            return False
+        self._show(start_idx)
+        return True
+
+    def _current_start(self, now=None):
+        """Index of the first horizon hour >= the current hour (0 if none)."""
+        now = datetime.now() if now is None else now
+        now_ms = now.replace(minute=0, second=0, microsecond=0).timestamp() * 1000
+        # Unparseable times are 0.0 and so never match.
+        for idx, ms in enumerate(self._horizon_ms):
+            if ms >= now_ms:
+                return idx
+        return 0
+
+    def _show(self, start_idx):
+        # Slice the new window before touching the model, so the signals
+        # below only cover swapping references.
+        store = self._horizon[start_idx:start_idx + 48]
+        old = self._store
+        self.start_idx = start_idx
+        changed = replace_rows(
+            self, old, store, self._assign,
+            changed_roles(old, store, self._ROLE_COLUMNS),
+            window_shift(old.column("time"), store.column("time")),
+        )
+        if not changed:
+            return
+        self._epoch_ms = self._horizon_ms[start_idx:start_idx + 48]
+        self._series_cache = {}
+        self._point_cache = {}
+        self._layout_cache = {}
+        self._x_layout_cache = {}
         # Bump version so QML knows to re-fetch chart series data
         self._data_version += 1
         self.dataVersionChanged.emit()
 
+    def _assign(self, store):
+        self._store = store
+
+    def row(self, i):
+        """Dict-like view of row i (see columnar.RowView)."""
+        return self._store.row(i)
+
     @Slot(str, result=list)
+    @metrics.timed("hourly_model.series_data_s")
     def seriesData(self, key):
-        """Return [{x: hourIndex, y: value}, ...] for a given weather element.
+        """Return [{x: epochMs, y: value}, ...] for a given weather element.
 
         The key uses QML-friendly camelCase names (e.g. "windSpeed") which
-        we map back to API names internally.  This format is consumed
-        directly by WeatherChart.qml's updateChart() function to populate
-        SplineSeries point-by-point.
+        we map back to API names internally.  Missing (null) values are
+        skipped.  The result is memoized until the window changes.
         """
-        role_key_map = {
-            "temperature": "temperature_2m",
-            "apparentTemperature": "apparent_temperature",
-            "humidity": "relative_humidity_2m",
-            "precipProbability": "precipitation_probability",
-            "rain": "rain",
-            "snowfall": "snowfall",
-            "snowDepth": "snow_depth",
-            "cloudCover": "cloud_cover",
-            "windSpeed": "wind_speed_10m",
-            "windGusts": "wind_gusts_10m",
-        }
-        api_key = role_key_map.get(key, key)
-        result = []
-        for row in self._rows:
-            val = row.get(api_key)
-            if val is not None:
-                time_str = row.get("time", "")
-                try:
-                    # Open-Meteo returns local time strings; .timestamp() treats
-                    # naive datetimes as local time, matching the system clock.
-                    # DateTimeAxis in QML expects milliseconds since Unix epoch.
-                    x_ms = int(datetime.fromisoformat(time_str).timestamp() * 1000)
-                except (ValueError, TypeError):
-                    x_ms = 0
-                result.append({"x": x_ms, "y": float(val)})
-        return result
+        series = self._series_cache.get(key)
+        if series is not None:
+            return series
+        api_key = _SERIES_KEYS.get(key, key)
+        if api_key not in _FIELDS or api_key in _TEXT_FIELDS:
+            return []
+        series = [
+            {"x": x_ms, "y": val}
+            for x_ms, val in zip(self._epoch_ms, self._store.column(api_key))
+            if val == val  # NaN = missing
+        ]
+        self._series_cache[key] = series
+        return series
+
+    @Slot(QObject, str, result=int)
+    @metrics.timed("hourly_model.feed_series_s")
+    def feedSeries(self, series, key):
+        """Replace all points of a QML SplineSeries with the series for key.
+
+        One QXYSeries.replace() call instead of a JavaScript append() per
+        point.  Returns the number of points (0 clears the series).
+        """
+        if not isinstance(series, QXYSeries):
+            return 0
+        points = self._point_cache.get(key)
+        if points is None:
+            points = [QPointF(p["x"], p["y"]) for p in self.seriesData(key)]
+            self._point_cache[key] = points
+        series.replace(points)
+        return len(points)
+
+    @Slot(list, float, result="QVariantMap")
+    def chartLayout(self, keys, clampMin):
+        """Axis ranges, tick counts and day bands for a chart showing keys.
+
+        The y range covers every listed series (floored at clampMin); the x
+        range and day bands follow the first series.  Returns {} when the
+        first series has no points, so the chart keeps its previous axes.
+        """
+        memo_key = (tuple(keys), clampMin)
+        layout = self._layout_cache.get(memo_key)
+        if layout is not None:
+            return layout
+        primary = self.seriesData(keys[0]) if keys else []
+        if not primary:
+            return {}
+        ys = [p["y"] for key in keys for p in self.seriesData(key)]
+        layout = chart_axes.y_axis(ys, clampMin)
+        span = (primary[0]["x"], primary[-1]["x"])
+        x_layout = self._x_layout_cache.get(span)
+        if x_layout is None:
+            # Charts without gaps share one span, so this runs once per window.
+            x_layout = self._x_layout_cache[span] = chart_axes.x_axis(*span)
+        layout.update(x_layout)
+        self._layout_cache[memo_key] = layout
+        return layout
 
     @Slot(result=list)
     def timeLabels(self):
         """Return ISO time strings for x-axis labeling."""
-        return [row.get("time", "") for row in self._rows]
+        return list(self._store.column("time"))
+
+
+def _epoch_ms(times):
+    """Parse local ISO times to epoch milliseconds (0.0 if unparseable).
+
+    Open-Meteo returns local time strings; .timestamp() treats naive
+    datetimes as local time, matching the system clock.  DateTimeAxis in
+    QML expects milliseconds since the Unix epoch.
+    """
+    out = array("d")
+    for t in times:
+        try:
+            out.append(datetime.fromisoformat(t).timestamp() * 1000)
+        except (ValueError, TypeError):
+            out.append(0.0)
+    return out
@@ -5,16 +5,29 @@ This is a read-only mirror of Settings.locations -- the controller calls
 update() whenever Settings.locationsChanged fires.  We need a separate
 model (rather than exposing the settings list directly) because QML's
 ComboBox and Repeater require a proper QAbstractItemModel with roleNames.
+
+update() diffs against the current rows (see row_diff.py) instead of
+resetting, so adding or renaming one location doesn't rebuild every
+delegate.
 """
 
 from PySide6.QtCore import QAbstractListModel, Qt, QModelIndex
 
+from .row_diff import dict_roles, replace_rows
+
 
 class LocationModel(QAbstractListModel):
     NameRole = Qt.UserRole + 1
     LatRole = Qt.UserRole + 2
     LonRole = Qt.UserRole + 3
 
+    # role -> value data() reports for a location dict
+    _GETTERS = {
+        NameRole: lambda loc: loc.get("name", ""),
+        LatRole: lambda loc: loc.get("lat", 0.0),
+        LonRole: lambda loc: loc.get("lon", 0.0),
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._locations = []
@@ -32,17 +45,13 @@ class LocationModel(QAbstractListModel):
     def data(self, index, role=Qt.DisplayRole):
         if not index.isValid() or index.row() >= len(self._locations):
             return None
-        loc = self._locations[index.row()]
-        if role == self.NameRole:
-            return loc.get("name", "")
-        if role == self.LatRole:
-            return loc.get("lat", 0.0)
-        if role == self.LonRole:
-            return loc.get("lon", 0.0)
-        return None
+        get = self._GETTERS.get(role)
+        return get(self._locations[index.row()]) if get else None
 
     def update(self, locations: list):
-        """Replace all rows.  Called by AppController._sync_location_model."""
-        self.beginResetModel()
-        self._locations = list(locations)
-        self.endResetModel()
+        """Sync to the saved list.  Called by AppController._sync_location_model."""
+        old, new = self._locations, list(locations)
+        replace_rows(self, old, new, self._assign, dict_roles(old, new, self._GETTERS))
+
+    def _assign(self, locations):
+        self._locations = locations
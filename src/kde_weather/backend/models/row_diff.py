@@ -0,0 +1,101 @@
+"""
+Incremental row replacement for the list models, instead of a model reset.
+
+beginResetModel()/endResetModel() makes every view drop and rebuild all of
+its delegates -- the 7-day card strip, the hourly bindings, the location
+ComboBox -- even when a 30-minute refresh only moved a few numbers.  This
+module moves a model from its old rows to its new ones with the minimal
+signals instead:
+
+  1. rowsRemoved for old rows that fall off the front of the window
+     (the hourly/daily window moving forward in time),
+  2. rowsRemoved / rowsInserted for the difference in length at the end,
+  3. dataChanged for the rows both sides share, grouped into runs of
+     consecutive rows with the same changed roles, carrying exactly those
+     roles.
+
+Rows are paired positionally after the front shift: old[shift + i] <-> new[i].
+Delegates of unchanged rows are never touched.
+
+Old and new data only need len() and slicing (a list, or a ColumnStore);
+the model hands over an assign() callback that swaps its backing data at
+each step, so data() is consistent with whatever signal was just emitted.
+"""
+
+from PySide6.QtCore import QModelIndex
+
+
+def window_shift(old_keys, new_keys):
+    """How many leading old rows the new window dropped.
+
+    old_keys/new_keys are the rows' identities (e.g. ISO times).  If the new
+    window starts inside the old one, that's the offset of its first row;
+    otherwise (different location, empty side, moved backwards) 0, which
+    pairs rows positionally.
+    """
+    if not old_keys or not new_keys:
+        return 0
+    try:
+        return list(old_keys).index(new_keys[0])
+    except ValueError:
+        return 0
+
+
+def replace_rows(model, old, new, assign, changed_roles, shift=0):
+    """Move model from old to new rows without a reset.
+
+    changed_roles(i, j) returns the roles that differ between old row i and
+    new row j.  Returns True if anything was signalled at all, so callers
+    can skip follow-up work (e.g. a dataVersion bump) for a no-op refresh.
+    """
+    shift = min(shift, len(old))
+    shared = min(len(old) - shift, len(new))
+
+    # Diff against the untouched old data before any structural change.
+    runs = []  # [first, last, roles]
+    for j in range(shared):
+        roles = changed_roles(shift + j, j)
+        if not roles:
+            continue
+        if runs and runs[-1][1] == j - 1 and runs[-1][2] == roles:
+            runs[-1][1] = j
+        else:
+            runs.append([j, j, roles])
+
+    parent = QModelIndex()
+    changed = bool(runs)
+    if shift:
+        model.beginRemoveRows(parent, 0, shift - 1)
+        assign(old[shift:])
+        model.endRemoveRows()
+        changed = True
+    if len(old) - shift > shared:
+        model.beginRemoveRows(parent, shared, len(old) - shift - 1)
+        assign(old[shift:shift + shared])
+        model.endRemoveRows()
+        changed = True
+    if len(new) > shared:
+        model.beginInsertRows(parent, shared, len(new) - 1)
+        assign(new)
+        model.endInsertRows()
+        changed = True
+    else:
+        assign(new)
+
+    for first, last, roles in runs:
+        model.dataChanged.emit(model.index(first), model.index(last), list(roles))
+    return changed
+
+
+def dict_roles(old, new, getters):
+    """changed_roles() for list-of-dict models.
+
+    getters maps each role to a function of the row dict returning the
+    value data() would report for it.
+    """
+    def changed_roles(i, j):
+        a, b = old[i], new[j]
+        if a == b:
+            return ()
+        return tuple(role for role, get in getters.items() if get(a) != get(b))
+    return changed_roles
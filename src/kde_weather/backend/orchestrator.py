@@ -0,0 +1,158 @@
+"""
+Fan-out refresh of every provider for one location, under one deadline.
+
+What: RefreshOrchestrator.start(key, providers) requests the Open-Meteo
+      forecast and the NWS detail for a location at the same time, on the
+      asyncio I/O loop, and reports each result through ready/failed.
+Why:  the two used to be fetched at unrelated times -- the NWS detail only
+      on a day click -- each behind its own 15 s socket timeout.  Now they
+      share one latency budget, and neither provider waits for the other:
+      a slow api.weather.gov never holds back the charts, and a slow
+      Open-Meteo never holds back the alerts.
+How:  every request of a round gets the same deadline (REFRESH_BUDGET_S).
+      Results that arrive before the round's first-paint deadline
+      (FIRST_PAINT_MS after launch) are held and published together, in one
+      event-loop turn, when the deadline passes or the last provider
+      answers -- so a fast network gives one combined repaint.  Anything
+      later is published the moment it arrives; the list models apply it
+      with row diffs (row_diff.py), never a reset.
+
+asyncio and the async fetch code are imported when the first round
+launches, not when this module is imported: they are a noticeable share of
+startup, and the first paint comes from the on-disk cache anyway.  The app
+holds its orchestrator (hold_until()) until the window's first frame is on
+screen, so the startup round -- which always includes NWS, whose cache is
+in memory only -- launches after that frame, not before it.
+"""
+
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
+
+FIRST_PAINT_MS = 300
+REFRESH_BUDGET_S = 10
+
+# Longest hold_until() waits for its signal: a window that starts hidden
+# may not swap a frame for a long time, and the data shouldn't wait on it.
+HOLD_MAX_MS = 2000
+
+# Provider name -> coroutine function(transport, lat, lon).  Filled from
+# aio_fetch on first use; tests may assign their own dict beforehand.
+PROVIDERS = None
+
+
+def _providers():
+    global PROVIDERS
+    if PROVIDERS is None:
+        from .api import aio_fetch
+        PROVIDERS = {
+            "forecast": aio_fetch.fetch_forecast_async,
+            "nws": aio_fetch.fetch_nws_details_async,
+            "nws_alerts": aio_fetch.fetch_nws_alerts_async,
+        }
+    return PROVIDERS
+
+
+class _Round:
+    def __init__(self, key, providers):
+        self.key = key
+        self.pending = set(providers)
+        self.held = []        # (provider, ok, value) awaiting the first paint
+        self.painted = False
+        self.requests = []    # AsyncRequests, held until they report
+
+
+class RefreshOrchestrator(QObject):
+    ready = Signal(str, object, object)  # provider, location key, result
+    failed = Signal(str, object, str)    # provider, location key, message ("" = cancelled)
+
+    def __init__(self, io_loop, parent=None):
+        """io_loop: a callable returning the IoLoop to run requests on."""
+        super().__init__(parent)
+        self._io_loop = io_loop
+        self._rounds = []
+        self._held = False
+        self._waiting = []    # rounds started while held
+
+    def start(self, key, providers):
+        """Fetch every named provider for key (a (lat, lon) tuple) at once."""
+        rnd = _Round(key, providers)
+        self._rounds.append(rnd)
+        QTimer.singleShot(0, self, lambda r=rnd: self._launch(r))
+
+    def hold_until(self, signal, timeout_ms=HOLD_MAX_MS):
+        """Launch no round until signal fires, or timeout_ms at the latest.
+
+        Rounds started meanwhile wait and launch together on release; their
+        first-paint deadlines count from then.
+        """
+        self._held = True
+        signal.connect(self._release, Qt.SingleShotConnection)
+        QTimer.singleShot(timeout_ms, self, self._release)
+
+    def _release(self):
+        if not self._held:
+            return
+        self._held = False
+        waiting, self._waiting = self._waiting, []
+        for rnd in waiting:
+            self._launch(rnd)
+
+    def pending(self):
+        """Number of provider requests not yet reported."""
+        return sum(len(r.pending) for r in self._rounds)
+
+    def cancel_all(self):
+        """Cancel every request in flight; nothing more is reported."""
+        rounds, self._rounds = self._rounds, []
+        self._waiting = []
+        for rnd in rounds:
+            for request in rnd.requests:
+                request.cancel()
+
+    def _launch(self, rnd):
+        if rnd not in self._rounds:
+            return  # cancelled before it started
+        if self._held:
+            self._waiting.append(rnd)
+            return
+        from .api.io_loop import AsyncRequest
+
+        providers = _providers()
+        io = self._io_loop()
+        for name in sorted(rnd.pending):
+            request = AsyncRequest(io, providers[name], *rnd.key, deadline=REFRESH_BUDGET_S)
+            request.finished.connect(lambda v, r=rnd, n=name: self._arrived(r, n, True, v))
+            request.error.connect(lambda msg, r=rnd, n=name: self._arrived(r, n, False, msg))
+            request.cancelled.connect(lambda r=rnd, n=name: self._arrived(r, n, False, ""))
+            rnd.requests.append(request)
+            request.start()
+        QTimer.singleShot(FIRST_PAINT_MS, self, lambda r=rnd: self._paint(r))
+
+    def _arrived(self, rnd, name, ok, value):
+        if rnd not in self._rounds:
+            return
+        rnd.pending.discard(name)
+        if not rnd.painted:
+            rnd.held.append((name, ok, value))
+            if not rnd.pending:
+                self._paint(rnd)  # everyone answered before the deadline
+            return
+        if not rnd.pending:
+            self._rounds.remove(rnd)
+        self._publish(rnd.key, name, ok, value)
+
+    def _paint(self, rnd):
+        """First paint: publish everything that has arrived so far."""
+        if rnd.painted or rnd not in self._rounds:
+            return
+        rnd.painted = True
+        held, rnd.held = rnd.held, []
+        for name, ok, value in held:
+            self._publish(rnd.key, name, ok, value)
+        if not rnd.pending:
+            self._rounds.remove(rnd)
+
+    def _publish(self, key, name, ok, value):
+        if ok:
+            self.ready.emit(name, key, value)
+        else:
+            self.failed.emit(name, key, value)
@@ -0,0 +1,235 @@
+"""
+Background refresh scheduling and the app's minute tick, on one timer.
+
+What: RefreshScheduler emits `due` when the saved locations should be
+      refreshed in the background and `minute` at the top of every minute
+      (the header clock and the hour rollover hang off it).
+Why:  a fixed 15/30/60-minute QTimer refreshed whether or not the window
+      could be seen and whether or not upstream had published anything
+      new, and the header clock ran a second timer of its own in QML.  On
+      a laptop left running all day, most of those wakeups and requests
+      bought nothing.
+How:  * Cadence: every fetched forecast is hashed (content_digest) per
+        location.  CadenceTracker notes when a location's hash changes and
+        takes the median gap between changes as upstream's update period.
+        Once known, a refresh is pushed back to just after the next
+        expected change (CHANGE_SLACK_S), never earlier than the user's
+        interval and never later than MAX_INTERVAL_S.
+      * Visibility: watch() follows the window's expose events.  While it
+        isn't exposed (minimized, hidden, on another virtual desktop) the
+        minute tick stops and each background refresh doubles the interval,
+        up to MAX_HIDDEN_INTERVAL_S.  When it is exposed again, the minute
+        tick fires at once and, if a refresh is overdue, so does `due`.
+      * One single-shot timer, re-armed from the wall clock after every
+        fire for whichever comes first -- the next minute boundary (while
+        exposed) or the next refresh -- so it can't drift, and catches up
+        straight after a suspend.
+"""
+
+import hashlib
+import json
+import math
+import statistics
+import time
+from collections import deque
+
+from PySide6.QtCore import QEvent, QObject, QTimer, Qt, Signal
+
+# Fire the minute tick a little after the boundary, so "now" has
+# definitely crossed it even with coarse timer wakeups.
+MINUTE_SLACK_MS = 500
+# Upstream publishes a little after its nominal time; refresh this long
+# after an expected change rather than racing it.
+CHANGE_SLACK_S = 2 * 60
+# Upper bound on the gap between background refreshes while visible, however
+# slow the learned cadence.
+MAX_INTERVAL_S = 3 * 3600
+# Upper bound on the backed-off interval while the window isn't exposed.
+MAX_HIDDEN_INTERVAL_S = 6 * 3600
+# Learned update periods are clamped to this range.
+MIN_PERIOD_S = 10 * 60
+MAX_PERIOD_S = 6 * 3600
+# Change times kept per location, and gaps needed before trusting a period.
+CHANGE_HISTORY = 8
+MIN_GAPS = 2
+
+
+def content_digest(body):
+    """Hash of a forecast's data, ignoring per-response noise.
+
+    Only the hourly and daily blocks count: generationtime_ms and friends
+    differ on every response even when the forecast itself hasn't changed.
+    """
+    data = json.dumps([body.get("hourly"), body.get("daily")], sort_keys=True,
+                      separators=(",", ":"))
+    return hashlib.blake2b(data.encode(), digest_size=16).hexdigest()
+
+
+class CadenceTracker:
+    """Learns how often upstream's forecast changes, from observed digests."""
+
+    def __init__(self):
+        self._digests = {}   # location key -> last digest seen
+        self._changes = {}   # location key -> deque of change times
+
+    def observe(self, key, digest, now):
+        """Record a fetch; returns True if the content differs from the last one."""
+        previous = self._digests.get(key)
+        self._digests[key] = digest
+        if previous == digest:
+            return False
+        if previous is not None:
+            # The first sighting of a location isn't a change we can time.
+            self._changes.setdefault(key, deque(maxlen=CHANGE_HISTORY)).append(now)
+        return True
+
+    def period(self):
+        """Median seconds between changes, or None until there's enough history."""
+        gaps = []
+        for times in self._changes.values():
+            times = list(times)
+            gaps += [b - a for a, b in zip(times, times[1:])]
+        if len(gaps) < MIN_GAPS:
+            return None
+        return min(max(statistics.median(gaps), MIN_PERIOD_S), MAX_PERIOD_S)
+
+    def next_change(self, after):
+        """When the first change after `after` is expected, or None if unknown."""
+        period = self.period()
+        if period is None:
+            return None
+        last = max(times[-1] for times in self._changes.values() if times)
+        steps = max(0, math.floor((after - last) / period)) + 1
+        return last + steps * period
+
+    def forget(self, keep):
+        """Drop locations not in keep (removed from the saved list)."""
+        self._digests = {k: v for k, v in self._digests.items() if k in keep}
+        self._changes = {k: v for k, v in self._changes.items() if k in keep}
+
+
+class RefreshScheduler(QObject):
+    minute = Signal()  # top of every minute while the window is exposed
+    due = Signal()     # time for a background refresh
+
+    def __init__(self, interval_minutes, parent=None, clock=time.time):
+        super().__init__(parent)
+        self._clock = clock
+        self._interval_s = interval_minutes * 60
+        self._cadence = CadenceTracker()
+        self._exposed = True
+        self._hidden_streak = 0        # background refreshes since hidden
+        self._last_refresh = clock()   # the controller refreshes at startup
+        self._due_at = None
+        self._running = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._fire)
+
+    # --- Control ---
+
+    def start(self):
+        self._running = True
+        self._due_at = self._plan()
+        self._arm()
+
+    def stop(self):
+        self._running = False
+        self._timer.stop()
+
+    def set_interval_minutes(self, minutes):
+        self._interval_s = minutes * 60
+        self._replan()
+
+    def observe(self, key, body):
+        """Record a fetched forecast for key; reschedules if it changed."""
+        if self._cadence.observe(key, content_digest(body), self._clock()):
+            self._replan()
+
+    def forget(self, keep):
+        self._cadence.forget(keep)
+
+    def watch(self, window):
+        """Follow a QWindow's exposure (expose events and visibility)."""
+        window.installEventFilter(self)
+        window.visibilityChanged.connect(lambda _v, w=window: self.set_exposed(w.isExposed()))
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Expose:
+            self.set_exposed(obj.isExposed())
+        return False
+
+    def set_exposed(self, exposed):
+        if exposed == self._exposed:
+            return
+        self._exposed = exposed
+        if exposed:
+            self._hidden_streak = 0
+            self.minute.emit()  # the clock and hourly window may be behind
+            self._due_at = self._plan()
+            if self._clock() >= self._due_at:
+                self._trigger()
+        else:
+            self._due_at = self._plan()
+        if self._running:
+            self._arm()
+
+    # --- State, for the controller and tests ---
+
+    def exposed(self):
+        return self._exposed
+
+    def due_at(self):
+        """Epoch seconds of the next background refresh."""
+        return self._due_at
+
+    def period(self):
+        """Learned upstream update period in seconds, or None."""
+        return self._cadence.period()
+
+    # --- Internals ---
+
+    def _plan(self):
+        interval = self._interval_s
+        if not self._exposed:
+            backed_off = interval * 2 ** (self._hidden_streak + 1)
+            interval = max(interval, min(backed_off, MAX_HIDDEN_INTERVAL_S))
+        due = self._last_refresh + interval
+        change = self._cadence.next_change(self._last_refresh)
+        if change is not None:
+            latest = self._last_refresh + max(interval, MAX_INTERVAL_S)
+            due = min(max(due, change + CHANGE_SLACK_S), latest)
+        return due
+
+    def _replan(self):
+        self._due_at = self._plan()
+        if self._running:
+            self._arm()
+
+    def _arm(self):
+        now = self._clock()
+        delay_s = self._due_at - now
+        if self._exposed:
+            to_minute = 60 - now % 60 + MINUTE_SLACK_MS / 1000
+            delay_s = min(delay_s, to_minute)
+            self._timer.setTimerType(Qt.PreciseTimer)
+        else:
+            # Nothing visible depends on the exact moment; let the OS batch it.
+            self._timer.setTimerType(Qt.VeryCoarseTimer)
+        self._timer.start(max(0, int(delay_s * 1000)))
+
+    def _fire(self):
+        if self._exposed:
+            self.minute.emit()
+        # Coarse timers may fire up to a second early.
+        if self._clock() + 1 >= self._due_at:
+            self._trigger()
+        self._arm()
+
+    def _trigger(self):
+        self._last_refresh = self._clock()
+        if not self._exposed:
+            self._hidden_streak += 1
+        self._due_at = self._plan()
+        self.due.emit()
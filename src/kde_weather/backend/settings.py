@@ -2,8 +2,20 @@
 Persistent settings stored as JSON at ~/.config/kde-weather/settings.json.
 
 Exposes all settings as Qt properties with change signals so QML can bind
-directly to them.  Saves to disk on every mutation -- the file is small
-(< 1 KB) so there's no need for batching or debouncing writes.
+directly to them.
+
+Saving: every mutation marks the settings dirty and (re)starts a short
+debounce timer, so a burst of changes -- rapid chart toggles, a script
+editing many locations -- becomes one write.  When the timer fires, the
+data is serialized on the GUI thread (it's < 1 KB) and the file I/O runs
+on a single background writer thread, so a slow disk never stalls the UI.
+Each write is atomic (atomic.write_atomic(): temp file + fsync + rename),
+so a crash mid-write leaves the previous file intact instead of a
+truncated one.
+
+`with settings.batch():` holds saving until the block ends, and flush()
+writes anything pending synchronously -- AppController.shutdown() calls it
+so nothing is lost on quit.
 
 The enabled_elements map uses Open-Meteo API parameter names as keys
 (e.g. "temperature_2m") so we can directly correlate which chart panels
@@ -11,13 +23,20 @@ to show and which API fields to request without any translation layer.
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 
-from PySide6.QtCore import QObject, Signal, Slot, Property
+from PySide6.QtCore import QObject, QTimer, Signal, Slot, Property
+
+from ..atomic import write_atomic
 
 CONFIG_DIR = Path.home() / ".config" / "kde-weather"
 CONFIG_FILE = CONFIG_DIR / "settings.json"
 
+# Changes closer together than this are written once.
+SAVE_DELAY_MS = 500
+
 # Default config for first launch.  Rain/snow off by default since they're
 # zero most of the time and just add visual clutter.
 DEFAULTS = {
@@ -50,6 +69,15 @@ class Settings(QObject):
         self._data = dict(DEFAULTS)
         self._load()
 
+        self._dirty = False       # changed since the last snapshot was written
+        self._batch_depth = 0     # > 0 inside batch(): don't start the timer
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._write_async)
+        # One thread, so writes land in the order they were snapshotted.
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="settings-writer")
+
     def _load(self):
         """Load saved settings from disk, merging with defaults.
 
@@ -71,9 +99,40 @@ class Settings(QObject):
                 pass  # Corrupt/unreadable file -- fall back to defaults
 
     def _save(self):
-        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(self._data, f, indent=2)
+        """Mark settings changed; the write happens after SAVE_DELAY_MS."""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self._save_timer.start()
+
+    @contextmanager
+    def batch(self):
+        """Group several mutations into one write: `with settings.batch(): ...`"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._save_timer.start()
+
+    def _snapshot(self):
+        self._dirty = False
+        return json.dumps(self._data, indent=2)
+
+    def _write_async(self):
+        if self._dirty:
+            # An unwritable config dir just means running on the in-memory
+            # settings; write_atomic() reports it rather than raising.
+            self._writer.submit(write_atomic, CONFIG_FILE, self._snapshot())
+
+    def flush(self):
+        """Write pending changes now and wait for every write to finish."""
+        self._save_timer.stop()
+        text = self._snapshot() if self._dirty else None
+        # Drain the writer first so an older snapshot can't land after ours.
+        self._writer.submit(lambda: None).result()
+        if text is not None:
+            write_atomic(CONFIG_FILE, text)
 
     # --- Locations ---
 
@@ -157,3 +216,4 @@ class Settings(QObject):
     @Slot(str, result=bool)
     def isElementEnabled(self, key):
         return self._data["enabled_elements"].get(key, False)
+
@@ -6,17 +6,35 @@ palette, then boots the QML UI.  We use Fusion (Qt's cross-platform style)
 instead of the native KDE/Breeze widget style because it lets us set an
 exact palette without fighting the platform theme plugin -- Breeze-the-
 style applies its own palette and ignores ours.
+
+Command-line options (anything else is passed on to Qt):
+  --profile-startup[=FILE]  print a startup phase/import timeline, optionally
+                            also as JSON in FILE (see startup_profile.py)
+  --precompile-qml          compile every QML file into Qt's on-disk cache and
+                            exit, so the next launch skips parsing (install.sh)
+  --metrics[=FILE]          collect runtime metrics (metrics.py), show the F12
+                            overlay, and dump them as JSON -- to FILE, or
+                            stdout -- at exit and on SIGUSR1
 """
 
 import sys
 from pathlib import Path
 
-from PySide6.QtCore import QUrl
+# Started before the heavy imports below so a profiled run can time them.
+from . import metrics, startup_profile
+startup_profile.start_from_env()
+
+from PySide6.QtCore import QTimer, QUrl
 from PySide6.QtGui import QColor, QPalette, QFont
 from PySide6.QtWidgets import QApplication
-from PySide6.QtQml import QQmlApplicationEngine
+from PySide6.QtQml import QQmlApplicationEngine, QQmlComponent, QQmlEngine
 
 from .backend.app_controller import AppController
+from .backend.metrics_view import dump_on_sigusr1
+
+startup_profile.mark("imports")
+
+QML_DIR = Path(__file__).parent / "qml"
 
 
 def build_breeze_dark_palette():
@@ -45,29 +63,93 @@ def build_breeze_dark_palette():
     return p
 
 
+def precompile_qml(qml_dir=QML_DIR):
+    """Compile every QML file into the on-disk cache without showing anything.
+
+    Qt keeps compiled QML in the per-user cache directory of the running
+    application (~/.cache/kde-weather/KDE Weather/qmlcache), so this must
+    run with the app's own name and organization -- i.e. from main().
+    Returns the number of files that failed to compile.
+    """
+    engine = QQmlEngine()
+    engine.addImportPath(str(qml_dir))
+    failed = 0
+    for path in sorted(qml_dir.rglob("*.qml")):
+        component = QQmlComponent(engine, QUrl.fromLocalFile(str(path)),
+                                  QQmlComponent.PreferSynchronous)
+        if component.isError():
+            failed += 1
+            for err in component.errors():
+                print(err.toString(), file=sys.stderr)
+    return failed
+
+
+def _take_option(argv, name):
+    """Remove --name / --name=value from argv; return value, True, or None."""
+    for i, arg in enumerate(argv):
+        if arg == name:
+            del argv[i]
+            return True
+        if arg.startswith(name + "="):
+            del argv[i]
+            return arg.split("=", 1)[1]
+    return None
+
+
 def main():
-    app = QApplication(sys.argv)
+    argv = list(sys.argv)
+    profile = _take_option(argv, "--profile-startup")
+    if profile is not None:
+        sys.exit(startup_profile.run(argv[1:], None if profile is True else profile))
+    precompile = _take_option(argv, "--precompile-qml")
+    metrics_option = _take_option(argv, "--metrics")
+    metrics_path = None if metrics_option in (None, True) else metrics_option
+    if metrics_option is not None:
+        # Before anything is constructed, so every source registers.
+        metrics.enable()
+
+    app = QApplication(argv)
     app.setApplicationName("KDE Weather")
     app.setOrganizationName("kde-weather")
     app.setStyle("Fusion")
     app.setPalette(build_breeze_dark_palette())
+    startup_profile.mark("QApplication")
+
+    if precompile:
+        failed = precompile_qml()
+        print(f"precompiled QML ({failed} failed)" if failed else "precompiled QML")
+        sys.exit(1 if failed else 0)
+
+    if metrics.active():
+        dump_on_sigusr1(app, metrics_path)
 
     controller = AppController()
+    startup_profile.mark("controller construction")
 
     engine = QQmlApplicationEngine()
     # Expose the controller to QML as "app" -- every QML file accesses
     # models, settings, and actions through this single context property.
     engine.rootContext().setContextProperty("app", controller)
 
-    qml_dir = Path(__file__).parent / "qml"
     # Add qml/ as an import path so QML can resolve "theme", "components",
     # and "views" as local module imports.
-    engine.addImportPath(str(qml_dir))
-    engine.load(QUrl.fromLocalFile(str(qml_dir / "main.qml")))
+    engine.addImportPath(str(QML_DIR))
+    engine.load(QUrl.fromLocalFile(str(QML_DIR / "main.qml")))
 
     if not engine.rootObjects():
         print("Error: Failed to load QML", file=sys.stderr)
         sys.exit(1)
+    startup_profile.mark("QML compile and load")
+
+    # Background refreshes back off while the window can't be seen.
+    controller.watch_window(engine.rootObjects()[0])
+
+    if startup_profile.active():
+        # A profiled run ends as soon as the first frame is on screen.
+        def first_frame():
+            startup_profile.finish()
+            QTimer.singleShot(0, app.quit)
+        engine.rootObjects()[0].frameSwapped.connect(first_frame)
 
     ret = app.exec()
 
@@ -76,6 +158,7 @@ def main():
     # is still running; letting `del controller` below GC it would make Qt
     # abort with "QThread: Destroyed while thread is still running".
     controller.shutdown()
+    metrics.dump(metrics_path)
 
     # PySide6 crashes on shutdown if Python's GC destroys Qt objects in the
     # wrong order (engine refs QML objects that ref the controller).  We
@@ -0,0 +1,218 @@
+"""
+Runtime metrics for `kde-weather --metrics`: counters and latency histograms.
+
+What: a process-wide registry of named counters (requests, cache hits and
+      misses, retries) and histograms (connect time, time to first byte,
+      body bytes, JSON decode, model updates, seriesData calls), plus
+      "sources" -- callables whose dicts (nws_cache.stats(),
+      http_client.pool_stats(), resilience.stats(), ...) are read at
+      snapshot time.  snapshot() returns all of it as one JSON-able dict.
+Why:  there was no way to see where time goes in a real session, and
+      tuning without numbers is guesswork.
+How:  enable() creates the registry; until then there is none, and every
+      entry point -- count(), observe(), start()/stop(), the timed()
+      wrapper -- is one global lookup and a return.  The instrumentation
+      can therefore stay in hot paths permanently.  Histograms keep count,
+      sum, min and max exactly and percentiles over the last RESERVOIR
+      samples.  Everything is guarded by one lock: samples arrive from
+      pool threads and the I/O thread as well as the main thread.
+
+Names are dotted, subsystem first: "http.<host>.ttfb_s",
+"forecast_cache.hit", "hourly_model.update_s".  Durations end in _s.
+
+    kde-weather --metrics                  JSON on stdout at exit / SIGUSR1
+    kde-weather --metrics=metrics.json     ...written to a file instead
+"""
+
+import functools
+import json
+import math
+import sys
+import threading
+import time
+from collections import deque
+
+# Recent samples kept per histogram for percentiles.
+RESERVOIR = 512
+
+_registry = None  # the active Registry, or None when metrics are off
+
+
+def percentile(values, p):
+    """Nearest-rank percentile of a non-empty sequence (p in 0..100).
+
+    Also used by resilience.py for its latency windows.
+    """
+    return ranked(sorted(values), p)
+
+
+def ranked(ordered, p):
+    """percentile() of an already sorted list, for picking several at once."""
+    rank = math.ceil(p * len(ordered) / 100) - 1
+    return ordered[max(0, min(len(ordered) - 1, rank))]
+
+
+class _Histogram:
+    __slots__ = ("count", "total", "low", "high", "recent")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.low = float("inf")
+        self.high = float("-inf")
+        self.recent = deque(maxlen=RESERVOIR)
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        self.low = min(self.low, value)
+        self.high = max(self.high, value)
+        self.recent.append(value)
+
+    def summary(self):
+        ordered = sorted(self.recent)
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "min": round(self.low, 6),
+            "max": round(self.high, 6),
+            "mean": round(self.total / self.count, 6),
+            "p50": round(ranked(ordered, 50), 6),
+            "p95": round(ranked(ordered, 95), 6),
+            "p99": round(ranked(ordered, 99), 6),
+        }
+
+
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._counters = {}
+        self._histograms = {}
+        self._sources = {}
+
+    def count(self, name, n=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def observe(self, name, value):
+        with self._lock:
+            hist = self._histograms.get(name)
+            if hist is None:
+                hist = self._histograms[name] = _Histogram()
+            hist.add(value)
+
+    def add_source(self, name, fn):
+        with self._lock:
+            self._sources[name] = fn
+
+    def snapshot(self):
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {k: h.summary() for k, h in self._histograms.items()}
+            sources = dict(self._sources)
+        snap = {
+            "uptime_s": round(time.monotonic() - self._started, 3),
+            "counters": dict(sorted(counters.items())),
+            "hit_rates": _hit_rates(counters),
+            "histograms": dict(sorted(histograms.items())),
+        }
+        for name, fn in sorted(sources.items()):
+            try:
+                snap[name] = fn()
+            except Exception as e:  # a broken source mustn't lose the rest
+                snap[name] = {"error": str(e)}
+        return snap
+
+
+def _hit_rates(counters):
+    """{"<prefix>": hits / (hits + misses)} for every "<prefix>.hit" counter."""
+    rates = {}
+    for name, hits in counters.items():
+        if name.endswith(".hit"):
+            prefix = name[:-len(".hit")]
+            total = hits + counters.get(prefix + ".miss", 0)
+            rates[prefix] = round(hits / total, 4) if total else None
+    return dict(sorted(rates.items()))
+
+
+def enable():
+    """Start collecting (idempotent); returns the Registry."""
+    global _registry
+    if _registry is None:
+        _registry = Registry()
+    return _registry
+
+
+def disable():
+    """Stop collecting and drop everything collected (tests)."""
+    global _registry
+    _registry = None
+
+
+def active():
+    return _registry is not None
+
+
+def count(name, n=1):
+    """Add n to a counter.  No-op unless metrics are on."""
+    if _registry is not None:
+        _registry.count(name, n)
+
+
+def observe(name, value):
+    """Add a sample to a histogram.  No-op unless metrics are on."""
+    if _registry is not None:
+        _registry.observe(name, value)
+
+
+def start():
+    """A start time for stop(), or None when metrics are off."""
+    return time.perf_counter() if _registry is not None else None
+
+
+def stop(name, started):
+    """Record the seconds since start() in histogram name."""
+    if started is not None and _registry is not None:
+        _registry.observe(name, time.perf_counter() - started)
+
+
+def timed(name):
+    """Decorator: record each call's duration in histogram name."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _registry is None:
+                return fn(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _registry.observe(name, time.perf_counter() - started)
+        return wrapper
+    return decorate
+
+
+def add_source(name, fn):
+    """Include fn()'s dict under name in every snapshot.  No-op unless on."""
+    if _registry is not None:
+        _registry.add_source(name, fn)
+
+
+def snapshot():
+    """Everything collected so far, or None when metrics are off."""
+    return _registry.snapshot() if _registry is not None else None
+
+
+def dump(path=None):
+    """Write snapshot() as JSON to path (replacing it), or a line on stdout."""
+    snap = snapshot()
+    if snap is None:
+        return
+    if path is None:
+        sys.stdout.write(json.dumps(snap) + "\n")
+        sys.stdout.flush()
+        return
+    with open(path, "w") as f:
+        json.dump(snap, f, indent=2)
+        f.write("\n")
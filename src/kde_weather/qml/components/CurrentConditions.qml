@@ -14,27 +14,9 @@ Rectangle {
     height: 140
 
     property var conditions: app.currentConditions
-    property string currentDateTime: ""
-
-    // Update the displayed date/time every minute
-    Timer {
-        interval: 60000
-        repeat: true
-        running: true
-        triggeredOnStart: true
-        onTriggered: {
-            var now = new Date();
-            var days = ["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"];
-            var months = ["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"];
-            var h = now.getHours();
-            var ampm = h >= 12 ? "PM" : "AM";
-            h = h % 12 || 12;
-            var min = now.getMinutes().toString().padStart(2, "0");
-            root.currentDateTime = days[now.getDay()] + ", "
-                + months[now.getMonth()] + " " + now.getDate()
-                + "  \u2022  " + h + ":" + min + " " + ampm;
-        }
-    }
+    // Date/time, updated by the app's minute tick (scheduler.py) -- no
+    // QML timer of its own, so there is one wakeup per minute, not two.
+    property string currentDateTime: app.clock
 
     RowLayout {
         anchors.fill: parent
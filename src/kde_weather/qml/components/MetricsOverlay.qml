@@ -0,0 +1,33 @@
+import QtQuick
+import "../theme"
+
+// Debug overlay for `kde-weather --metrics`: a live digest of app.metrics
+// (see metrics.py).  Only loaded when metrics are on; F12 hides/shows it.
+// Polls once a second while visible -- the registry never pushes.
+
+Rectangle {
+    id: root
+    color: "#cc141618"
+    radius: Theme.radiusMedium
+    border.color: Theme.border
+    width: Math.min(label.implicitWidth + 2 * Theme.spacingLarge, parent ? parent.width * 0.6 : 600)
+    height: Math.min(label.implicitHeight + 2 * Theme.spacingLarge, parent ? parent.height * 0.8 : 500)
+    clip: true
+
+    Text {
+        id: label
+        x: Theme.spacingLarge
+        y: Theme.spacingLarge
+        font.family: "monospace"
+        font.pixelSize: Theme.fontAxisLabel
+        color: Theme.textSecondary
+        text: app.metrics.summary()
+    }
+
+    Timer {
+        interval: 1000
+        repeat: true
+        running: root.visible
+        onTriggered: label.text = app.metrics.summary()
+    }
+}
@@ -278,6 +278,23 @@ ApplicationWindow {
         }
     }
 
+    // --- Metrics overlay (kde-weather --metrics only; F12 toggles) ---
+    Loader {
+        id: metricsOverlay
+        active: app.metrics.enabled
+        anchors.right: parent.right
+        anchors.bottom: parent.bottom
+        anchors.margins: Theme.spacingLarge
+        z: 10
+        sourceComponent: MetricsOverlay {}
+    }
+
+    Shortcut {
+        sequence: "F12"
+        enabled: app.metrics.enabled
+        onActivated: metricsOverlay.visible = !metricsOverlay.visible
+    }
+
     // --- Settings drawer (slides from right) ---
     Drawer {
         id: settingsDrawer
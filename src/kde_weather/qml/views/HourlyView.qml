@@ -7,15 +7,23 @@ import "../components"
 // Scrollable stack of hourly weather charts (one per enabled element).
 //
 // The central challenge here is reactivity: QML declarative bindings can't
-// detect when hourlyModel.seriesData("temperature") would return new data
+// detect when hourlyModel.feedSeries(...) would load new data
 // because it's an imperative Slot call, not a property.  We solve this with
 // the dataVersion pattern:
 //
 //   1. Python's HourlyModel bumps dataVersion after each update()
 //   2. QML binds to hourlyModel.dataVersion (a Q_PROPERTY with notify)
-//   3. onDataVersionChanged triggers refreshCharts() which imperatively
-//      pushes fresh data into each chart's seriesData property
-//   4. WeatherChart reacts to onSeriesDataChanged and redraws
+//   3. Each WeatherChart binds to it too, and on a change calls its own
+//      updateChart() -- if it is in view (see below)
+//   4. WeatherChart pulls its series by key straight from the model in one
+//      native call per series, plus precomputed axes (chartLayout())
+//
+// Charts are heavy (each ChartView has its own scene, axes and fonts), so
+// each one sits in a Loader that is only active while its element is
+// enabled in settings: disabled charts are never created, and turning one
+// off destroys it.  Created charts that are scrolled away (or on a hidden
+// tab) don't redraw on refresh; they remember they're stale and update
+// once when they come back into view.
 //
 // Charts that share related data (e.g. Temperature + Feels Like) are
 // combined into a single chart with primary + secondary series.  If the
@@ -29,8 +37,6 @@ ScrollView {
 
     property var hourlyModel: app.hourlyModel
     property var enabledElements: app.settings.enabledElements
-    // Tracks model data freshness -- see module comment above
-    property int dataVersion: hourlyModel.dataVersion
 
     contentWidth: availableWidth
 
@@ -53,55 +59,69 @@ ScrollView {
         contentItem.contentY = Math.min(Math.max(0, maxY), contentItem.contentY + chartPageHeight)
     }
 
-    function refreshCharts() {
-        tempChart.seriesData = hourlyModel.seriesData("temperature");
-        tempChart.secondaryData = hourlyModel.seriesData("apparentTemperature");
-        feelsLikeChart.seriesData = hourlyModel.seriesData("apparentTemperature");
-        windChart.seriesData = hourlyModel.seriesData("windSpeed");
-        windChart.secondaryData = hourlyModel.seriesData("windGusts");
-        gustChart.seriesData = hourlyModel.seriesData("windGusts");
-        humidityChart.seriesData = hourlyModel.seriesData("humidity");
-        cloudChart.seriesData = hourlyModel.seriesData("cloudCover");
-        precipChart.seriesData = hourlyModel.seriesData("precipProbability");
-        rainChart.seriesData = hourlyModel.seriesData("rain");
-        snowfallChart.seriesData = hourlyModel.seriesData("snowfall");
-        snowDepthChart.seriesData = hourlyModel.seriesData("snowDepth");
+    // True while item is on screen, or within one chart page of it so a
+    // chart about to scroll in is already drawn.  Charts only take new data
+    // while this holds (see WeatherChart.inView).
+    function inViewport(item) {
+        // width stays 0 until the layout has placed the item; before that
+        // every chart sits at y = 0 and would look on-screen.
+        if (!root.visible || !item.visible || item.width <= 0) return false;
+        var top = contentItem.contentY - chartPageHeight;
+        var bottom = contentItem.contentY + root.height + chartPageHeight;
+        return item.y + item.height > top && item.y < bottom;
     }
 
-    onDataVersionChanged: refreshCharts()
-
     ColumnLayout {
-            id: chartsColumn
-            width: root.availableWidth
-            spacing: Theme.spacingMedium
-
-            // Temperature + Feels Like combined (when temp is on)
-            WeatherChart {
-                id: tempChart
-                Layout.fillWidth: true
-                visible: root.enabledElements["temperature_2m"] || false
+        id: chartsColumn
+        width: root.availableWidth
+        spacing: Theme.spacingMedium
+
+        // Temperature + Feels Like combined (when temp is on)
+        Loader {
+            id: tempChart
+            Layout.fillWidth: true
+            active: root.enabledElements["temperature_2m"] || false
+            visible: active
+            sourceComponent: WeatherChart {
+                provider: root.hourlyModel
+                inView: root.inViewport(tempChart)
+                seriesKey: "temperature"
+                secondaryKey: "apparentTemperature"
                 title: "Temperature"
                 unit: "\u00b0F"
                 lineColor: Theme.chartTemp
                 secondaryTitle: "Feels Like"
                 secondaryColor: Theme.chartFeelsLike
             }
+        }
 
-            // Feels Like standalone (only when temp is off but feels-like is on)
-            WeatherChart {
-                id: feelsLikeChart
-                Layout.fillWidth: true
-                visible: !(root.enabledElements["temperature_2m"] || false) && (root.enabledElements["apparent_temperature"] || false)
+        // Feels Like standalone (only when temp is off but feels-like is on)
+        Loader {
+            id: feelsLikeChart
+            Layout.fillWidth: true
+            active: !(root.enabledElements["temperature_2m"] || false) && (root.enabledElements["apparent_temperature"] || false)
+            visible: active
+            sourceComponent: WeatherChart {
+                provider: root.hourlyModel
+                inView: root.inViewport(feelsLikeChart)
+                seriesKey: "apparentTemperature"
                 title: "Feels Like"
                 unit: "\u00b0F"
                 lineColor: Theme.chartFeelsLike
             }
+        }
 
-            // Wind Speed + Gusts combined
-            WeatherChart {
-                id: windChart
-                Layout.fillWidth: true
-                visible: root.enabledElements["wind_speed_10m"] || false
+        // Wind Speed + Gusts combined
+        Loader {
+            id: windChart
+            Layout.fillWidth: true
+            active: root.enabledElements["wind_speed_10m"] || false
+            visible: active
+            sourceComponent: WeatherChart {
+                provider: root.hourlyModel
+                inView: root.inViewport(windChart)
+                seriesKey: "windSpeed"
+                secondaryKey: "windGusts"
                 title: "Wind Speed"
                 unit: "mph"
                 lineColor: Theme.chartWindSpeed
@@ -109,74 +129,117 @@ ScrollView {
                 secondaryColor: Theme.chartWindGusts
                 clampMin: 0
             }
+        }
 
-            // Gusts standalone
-            WeatherChart {
-                id: gustChart
-                Layout.fillWidth: true
-                visible: !(root.enabledElements["wind_speed_10m"] || false) && (root.enabledElements["wind_gusts_10m"] || false)
+        // Gusts standalone
+        Loader {
+            id: gustChart
+            Layout.fillWidth: true
+            active: !(root.enabledElements["wind_speed_10m"] || false) && (root.enabledElements["wind_gusts_10m"] || false)
+            visible: active
+            sourceComponent: WeatherChart {
+                provider: root.hourlyModel
+                inView: root.inViewport(gustChart)
+                seriesKey: "windGusts"
                 title: "Wind Gusts"
                 unit: "mph"
                 lineColor: Theme.chartWindGusts
                 clampMin: 0
             }
+        }
 
-            WeatherChart {
-                id: humidityChart
-                Layout.fillWidth: true
-                visible: root.enabledElements["relative_humidity_2m"] || false
+        Loader {
+            id: humidityChart
+            Layout.fillWidth: true
+            active: root.enabledElements["relative_humidity_2m"] || false
+            visible: active
+            sourceComponent: WeatherChart {
+                provider: root.hourlyModel
+                inView: root.inViewport(humidityChart)
+                seriesKey: "humidity"
                 title: "Humidity"
                 unit: "%"
                 lineColor: Theme.chartHumidity
             }
+        }
 
-            WeatherChart {
-                id: cloudChart
-                Layout.fillWidth: true
-                visible: root.enabledElements["cloud_cover"] || false
+        Loader {
+            id: cloudChart
+            Layout.fillWidth: true
+            active: root.enabledElements["cloud_cover"] || false
+            visible: active
+            sourceComponent: WeatherChart {
+                provider: root.hourlyModel
+                inView: root.inViewport(cloudChart)
+                seriesKey: "cloudCover"
                 title: "Cloud Cover"
                 unit: "%"
                 lineColor: Theme.chartCloudCover
             }
+        }
 
-            WeatherChart {
-                id: precipChart
-                Layout.fillWidth: true
-                visible: root.enabledElements["precipitation_probability"] || false
+        Loader {
+            id: precipChart
+            Layout.fillWidth: true
+            active: root.enabledElements["precipitation_probability"] || false
+            visible: active
+            sourceComponent: WeatherChart {
+                provider: root.hourlyModel
+                inView: root.inViewport(precipChart)
+                seriesKey: "precipProbability"
                 title: "Precipitation Probability"
                 unit: "%"
                 lineColor: Theme.chartPrecipProb
             }
+        }
 
-            WeatherChart {
-                id: rainChart
-                Layout.fillWidth: true
-                visible: root.enabledElements["rain"] || false
+        Loader {
+            id: rainChart
+            Layout.fillWidth: true
+            active: root.enabledElements["rain"] || false
+            visible: active
+            sourceComponent: WeatherChart {
+                provider: root.hourlyModel
+                inView: root.inViewport(rainChart)
+                seriesKey: "rain"
                 title: "Rain"
                 unit: "in"
                 lineColor: Theme.chartRain
             }
+        }
 
-            // "Snowfall" = inches of new snow that fell during each hour
-            // (a rate from Open-Meteo's snowfall field, converted to inches/hr)
-            WeatherChart {
-                id: snowfallChart
-                Layout.fillWidth: true
-                visible: root.enabledElements["snowfall"] || false
+        // "Snowfall" = inches of new snow that fell during each hour
+        // (a rate from Open-Meteo's snowfall field, converted to inches/hr)
+        Loader {
+            id: snowfallChart
+            Layout.fillWidth: true
+            active: root.enabledElements["snowfall"] || false
+            visible: active
+            sourceComponent: WeatherChart {
+                provider: root.hourlyModel
+                inView: root.inViewport(snowfallChart)
+                seriesKey: "snowfall"
                 title: "Snowfall \u2014 new snow per hour"
                 unit: "in/hr"
                 lineColor: Theme.chartSnowfall
             }
+        }
 
-            // "Snow Depth" = total inches of snow currently on the ground
-            // (the accumulation / snowpack at each hour, Open-Meteo snow_depth)
-            WeatherChart {
-                id: snowDepthChart
-                Layout.fillWidth: true
-                visible: root.enabledElements["snow_depth"] || false
+        // "Snow Depth" = total inches of snow currently on the ground
+        // (the accumulation / snowpack at each hour, Open-Meteo snow_depth)
+        Loader {
+            id: snowDepthChart
+            Layout.fillWidth: true
+            active: root.enabledElements["snow_depth"] || false
+            visible: active
+            sourceComponent: WeatherChart {
+                provider: root.hourlyModel
+                inView: root.inViewport(snowDepthChart)
+                seriesKey: "snowDepth"
                 title: "Snow Depth \u2014 total on ground"
                 unit: "in"
                 lineColor: Theme.chartSnowDepth
             }
         }
+    }
 }
@@ -0,0 +1,161 @@
+"""
+Startup profiling for `kde-weather --profile-startup`.
+
+What: a phase timeline of one cold start -- interpreter start, imports,
+      QApplication, settings load, controller construction, QML compile and
+      load, first frame swapped -- plus per-module import times in the same
+      form as `python -X importtime`, as JSON.
+Why:  to see where time goes before the window shows anything, and to
+      check that deferred imports stay deferred.
+How:  the command re-runs the app in a child process with `-X importtime`
+      and KDE_WEATHER_PROFILE pointing at a temp file.  The child records
+      mark()s along the way, writes them out when the first frame is
+      swapped, and quits.  The parent parses the child's importtime stderr,
+      merges both, prints the timeline and optionally writes the JSON.
+
+When profiling is off, mark() is a single global lookup and return, so
+the calls can stay in the startup path permanently.
+
+    kde-weather --profile-startup                 human-readable timeline
+    kde-weather --profile-startup=startup.json    ...and the JSON report
+"""
+
+import json
+import os
+import re
+import sys
+import time
+
+ENV_OUTPUT = "KDE_WEATHER_PROFILE"        # child: where to write its phases
+ENV_SPAWNED = "KDE_WEATHER_PROFILE_T0"    # child: wall time the parent spawned it
+
+_IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$")
+
+_timeline = None  # the active _Timeline in a profiled child, else None
+
+
+class _Timeline:
+    def __init__(self, output, spawned_at):
+        self.output = output
+        self._t0 = time.perf_counter()
+        # Time between the parent's spawn and this module's import is the
+        # interpreter's own startup (plus whatever imported us).
+        self._offset = max(0.0, time.time() - spawned_at) if spawned_at else 0.0
+        self.phases = [("interpreter start", self._offset)]
+
+    def mark(self, phase):
+        self.phases.append((phase, self._offset + time.perf_counter() - self._t0))
+
+    def write(self):
+        with open(self.output, "w") as f:
+            json.dump([{"phase": p, "at_s": round(t, 6)} for p, t in self.phases], f)
+
+
+def start_from_env():
+    """In a profiled child, start recording; returns True if profiling."""
+    global _timeline
+    output = os.environ.get(ENV_OUTPUT)
+    if output and _timeline is None:
+        spawned = os.environ.get(ENV_SPAWNED)
+        _timeline = _Timeline(output, float(spawned) if spawned else None)
+    return _timeline is not None
+
+
+def active():
+    return _timeline is not None
+
+
+def mark(phase):
+    """Record that phase just finished.  No-op unless profiling."""
+    if _timeline is not None:
+        _timeline.mark(phase)
+
+
+def finish(phase="first frame swapped"):
+    """Record the final phase and write the child's report (once)."""
+    global _timeline
+    if _timeline is not None:
+        _timeline.mark(phase)
+        _timeline.write()
+        _timeline = None
+
+
+def parse_importtime(text):
+    """Parse `-X importtime` stderr into a list of per-module dicts.
+
+    Each entry: {"module", "self_us", "cumulative_us", "depth"}, in the
+    order Python printed them (children before their parent).  Lines that
+    aren't importtime output (app logging, the header) are skipped.
+    """
+    imports = []
+    for line in text.splitlines():
+        m = _IMPORT_LINE.match(line)
+        if m is None:
+            continue
+        self_us, cumulative_us, indent, module = m.groups()
+        imports.append({
+            "module": module,
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+            "depth": len(indent) // 2,
+        })
+    return imports
+
+
+def format_report(phases, imports, top=15):
+    """Human-readable timeline plus the slowest top-level imports."""
+    lines = ["Startup timeline (seconds since launch):"]
+    prev = 0.0
+    for entry in phases:
+        at = entry["at_s"]
+        lines.append(f"  {at:8.3f}  +{at - prev:7.3f}  {entry['phase']}")
+        prev = at
+    roots = sorted((i for i in imports if i["depth"] == 0),
+                   key=lambda i: i["cumulative_us"], reverse=True)[:top]
+    if roots:
+        lines.append("")
+        lines.append("Slowest top-level imports (cumulative ms):")
+        for i in roots:
+            lines.append(f"  {i['cumulative_us'] / 1000:8.1f}  {i['module']}")
+    return "\n".join(lines)
+
+
+def run(args, json_path=None):
+    """Profile one start of the app; args are the remaining CLI arguments."""
+    # Only the parent needs these; keep them off the profiled child's path.
+    import subprocess
+    import tempfile
+
+    fd, phase_file = tempfile.mkstemp(prefix="kde-weather-profile-", suffix=".json")
+    os.close(fd)
+    env = dict(os.environ)
+    env[ENV_OUTPUT] = phase_file
+    env[ENV_SPAWNED] = repr(time.time())
+    try:
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "kde_weather.main", *args],
+            env=env, stderr=subprocess.PIPE, text=True,
+        )
+        try:
+            with open(phase_file) as f:
+                phases = json.load(f)
+        except (OSError, ValueError):
+            phases = []
+    finally:
+        os.unlink(phase_file)
+
+    imports = parse_importtime(proc.stderr)
+    if not phases:
+        # Never reached the first frame; show why.
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:"):
+                print(line, file=sys.stderr)
+        print("startup profile: the app exited before its first frame", file=sys.stderr)
+        return proc.returncode or 1
+
+    print(format_report(phases, imports))
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump({"phases": phases, "imports": imports}, f, indent=1)
+        print(f"\nwrote {json_path}")
+    return 0
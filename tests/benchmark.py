@@ -0,0 +1,287 @@
+#!/usr/bin/env python
+"""Micro-benchmarks for the model and NWS hot paths, with a regression guard.
+
+No framework, no network; run from the repo root:
+    PYTHONPATH=src python tests/benchmark.py              # print timings
+    PYTHONPATH=src python tests/benchmark.py --save       # ...and write the baseline
+    PYTHONPATH=src python tests/benchmark.py --compare    # exit 1 on a regression
+
+Options: --baseline FILE (default tests/bench_baseline.json), --tolerance
+FRACTION (default: the baseline's own, else TOLERANCE), -k SUBSTRING to run
+only matching cases, --quick to run every case once (a smoke test, used by
+test_benchmark.py).
+
+Payloads are synthetic: Open-Meteo forecasts at 48, 168 and 384 hour (16-day)
+horizons, and an NWS payload with a week of periods and ALERT_COUNT alerts.
+Each case is timed timeit-style: the loop count grows until one batch takes
+MIN_BATCH_S, then the best of REPEATS batches is kept, per call.  Timings
+depend on the machine, so the baseline does too -- it is git-ignored; save
+one before a change and compare after it, on the same machine.
+
+Not a test_*.py file, so pytest and the test runs leave it alone.  PySide6
+6.12.0 is excluded: see HANDOFF.md, Known Issues.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+SRC = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, SRC)
+
+BASELINE = os.path.join(os.path.dirname(__file__), "bench_baseline.json")
+TOLERANCE = 0.25      # a case regresses when it gets >25% slower
+MIN_BATCH_S = 0.05
+REPEATS = 5
+HORIZONS = (48, 168, 384)
+ALERT_COUNT = 200
+
+
+# --- Synthetic payloads ---
+
+def open_meteo_payload(hours, shift=0.0):
+    """An Open-Meteo forecast of `hours` hourly rows, starting two hours ago.
+
+    shift offsets every value, so two payloads differ in every cell the way
+    consecutive refreshes do.
+    """
+    from kde_weather.backend.api.open_meteo import DAILY_PARAMS, HOURLY_PARAMS
+
+    start = datetime.now().replace(minute=0, second=0, microsecond=0) - timedelta(hours=2)
+    hourly = {"time": [(start + timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M")
+                       for i in range(hours)]}
+    for n, name in enumerate(HOURLY_PARAMS):
+        if name == "weather_code":
+            hourly[name] = [(i // 6 + int(shift)) % 4 for i in range(hours)]
+        else:
+            hourly[name] = [round(50 + 20 * math.sin(i / 7 + n) + shift, 1) for i in range(hours)]
+    days = math.ceil(hours / 24)
+    first = start.date()
+    daily = {"time": [(first + timedelta(days=d)).isoformat() for d in range(days)]}
+    for n, name in enumerate(DAILY_PARAMS):
+        if name in ("sunrise", "sunset"):
+            hour = 7 if name == "sunrise" else 19
+            daily[name] = [f"{first + timedelta(days=d)}T{hour:02d}:{d % 60:02d}" for d in range(days)]
+        elif name == "weather_code":
+            daily[name] = [(d + int(shift)) % 4 for d in range(days)]
+        else:
+            daily[name] = [round(40 + 10 * math.cos(d + n) + shift, 1) for d in range(days)]
+    return {"hourly": hourly, "daily": daily, "generationtime_ms": 0.5}
+
+
+def nws_payload(alert_count=ALERT_COUNT):
+    """A week of day/night NWS periods and alert_count overlapping alerts."""
+    tz = timezone(timedelta(hours=-4))
+    first = datetime.now(tz).replace(hour=6, minute=0, second=0, microsecond=0)
+    periods = []
+    for i in range(14):
+        start = first + timedelta(hours=12 * i)
+        periods.append({
+            "number": i + 1, "name": f"Period {i + 1}", "isDaytime": i % 2 == 0,
+            "startTime": start.isoformat(), "endTime": (start + timedelta(hours=12)).isoformat(),
+            "temperature": 60 + i, "shortForecast": "Sunny",
+            "detailedForecast": "Sunny, with a high near 70. " * 3,
+        })
+    alerts = []
+    for i in range(alert_count):
+        effective = first + timedelta(hours=5 * i % (7 * 24))
+        alerts.append({"properties": {
+            "event": f"Advisory {i}", "severity": ("Minor", "Moderate", "Severe")[i % 3],
+            "headline": f"Advisory {i} in effect", "description": "Details. " * 20,
+            "effective": effective.isoformat(),
+            "expires": (effective + timedelta(hours=6 + i % 30)).isoformat(),
+        }})
+    dates = [(first + timedelta(days=d)).strftime("%Y-%m-%d") for d in range(7)]
+    return {"available": True, "periods": periods, "alerts": alerts}, dates
+
+
+# --- Cases ---
+
+def build_cases():
+    """[(name, fn)] -- each fn is one timed call, with any setup done here."""
+    from PySide6.QtCore import QModelIndex
+
+    from kde_weather.backend.api import nws
+    from kde_weather.backend.app_controller import AppController
+    from kde_weather.backend.models.daily_model import DailyModel
+    from kde_weather.backend.models.hourly_model import _SERIES_KEYS, HourlyModel
+
+    cases = []
+    for hours in HORIZONS:
+        a, b = open_meteo_payload(hours), open_meteo_payload(hours, shift=0.5)
+
+        model = HourlyModel()
+        flip = [a["hourly"], b["hourly"]]
+
+        def update(model=model, flip=flip):
+            flip.reverse()  # alternate payloads so every call changes rows
+            model.update(flip[0])
+        cases.append((f"hourly_model.update[{hours}h]", update))
+
+        series_model = HourlyModel()
+        series_model.update(a["hourly"])
+
+        def series_all(model=series_model):
+            model._series_cache = {}  # measure the work, not the memo
+            for key in _SERIES_KEYS:
+                model.seriesData(key)
+        cases.append((f"hourly_model.series_data_all[{hours}h]", series_all))
+
+        daily = DailyModel()
+        daily.update(a["daily"])
+        roles = list(daily.roleNames())
+        indexes = [daily.index(row, 0) for row in range(daily.rowCount(QModelIndex()))]
+
+        def data_all(model=daily, roles=roles, indexes=indexes):
+            for index in indexes:
+                for role in roles:
+                    model.data(index, role)
+        cases.append((f"daily_model.data_all_roles[{len(indexes)}d]", data_all))
+
+    payload, dates = nws_payload()
+    periods, alerts = payload["periods"], payload["alerts"]
+    expires = [a["properties"]["expires"] for a in alerts]
+    cases += [
+        ("nws.periods_for_date[7d]",
+         lambda: [nws.periods_for_date(periods, d) for d in dates]),
+        (f"nws.alerts_for_date[7d x {len(alerts)}]",
+         lambda: [nws.alerts_for_date(alerts, d) for d in dates]),
+        (f"nws.format_expires[{len(expires)}]",
+         lambda: [nws.format_expires(ts) for ts in expires]),
+    ]
+
+    ctrl = AppController()
+
+    def populate_cold():
+        payload.pop("index", None)  # a freshly fetched payload: no DayIndex yet
+        for d in dates:
+            ctrl._populate_detail(d, payload)
+
+    def populate_warm():
+        for d in dates:
+            ctrl._populate_detail(d, payload)
+
+    cases += [
+        (f"controller.populate_detail_cold[7d x {len(alerts)}]", populate_cold),
+        (f"controller.populate_detail_warm[7d x {len(alerts)}]", populate_warm),
+    ]
+    return cases, ctrl
+
+
+def measure(fn, quick=False):
+    """Best seconds per call of fn()."""
+    if quick:
+        fn()
+        return 0.0
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - started
+        if elapsed >= MIN_BATCH_S:
+            break
+        loops *= 2 if elapsed == 0 else max(2, min(10, math.ceil(MIN_BATCH_S / elapsed)))
+    best = elapsed
+    for _ in range(REPEATS - 1):
+        started = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        best = min(best, time.perf_counter() - started)
+    return best / loops
+
+
+def compare(results, baseline, tolerance):
+    """[(name, current_us, baseline_us or None, ratio or None, regressed)]."""
+    rows = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        ratio = current / base if base else None
+        rows.append((name, current, base, ratio, ratio is not None and ratio > 1 + tolerance))
+    return rows
+
+
+# --- CLI ---
+
+def _isolate():
+    """Offscreen Qt and a throwaway $HOME: no real settings, caches or network."""
+    home = tempfile.mkdtemp(prefix="kde-weather-bench-")
+    os.environ["HOME"] = home
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return home
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--save", action="store_true", help="write the baseline")
+    parser.add_argument("--compare", action="store_true", help="fail on regressions")
+    parser.add_argument("--tolerance", type=float, default=None)
+    parser.add_argument("-k", dest="only", default="", help="run cases containing this")
+    parser.add_argument("--quick", action="store_true", help="run each case once")
+    args = parser.parse_args(argv)
+
+    home = _isolate()
+    try:
+        from PySide6.QtCore import QCoreApplication
+        app = QCoreApplication([])
+
+        cases, ctrl = build_cases()
+        results = {}
+        for name, fn in cases:
+            if args.only in name:
+                results[name] = round(measure(fn, args.quick) * 1e6, 3)  # microseconds
+        ctrl.shutdown()
+        del ctrl, app
+    finally:
+        shutil.rmtree(home, True)
+
+    if args.quick:
+        print(f"ran {len(results)} cases once")
+        return 0
+
+    status = 0
+    if args.compare:
+        with open(args.baseline) as f:
+            saved = json.load(f)
+        tolerance = args.tolerance if args.tolerance is not None else saved.get("tolerance", TOLERANCE)
+        rows = compare(results, saved["results"], tolerance)
+        print(f"{'case':<48} {'now us':>11} {'base us':>11} {'ratio':>7}")
+        for name, current, base, ratio, regressed in rows:
+            base_text = f"{base:11.2f}" if base else f"{'(new)':>11}"
+            ratio_text = f"{ratio:7.2f}" if ratio else f"{'':>7}"
+            print(f"{name:<48} {current:11.2f} {base_text} {ratio_text}"
+                  + ("  REGRESSED" if regressed else ""))
+        regressions = [r for r in rows if r[4]]
+        if regressions:
+            print(f"\n{len(regressions)} of {len(rows)} cases regressed beyond {tolerance:.0%}")
+            status = 1
+        else:
+            print(f"\nNo regressions beyond {tolerance:.0%}")
+    else:
+        print(f"{'case':<48} {'us/call':>11}")
+        for name, current in results.items():
+            print(f"{name:<48} {current:11.2f}")
+
+    if args.save:
+        with open(args.baseline, "w") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "saved_at": datetime.now().isoformat(timespec="seconds"),
+                "tolerance": args.tolerance if args.tolerance is not None else TOLERANCE,
+                "results": results,
+            }, f, indent=2)
+            f.write("\n")
+        print(f"baseline written to {args.baseline}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
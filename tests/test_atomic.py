@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+"""Tests for atomic.write_atomic(), the crash-safe file replacement.
+
+No framework; run directly:
+    PYTHONPATH=src python tests/test_atomic.py
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from kde_weather.atomic import write_atomic
+
+
+def test_replaces_and_creates_parents_without_leftovers():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "a" / "b" / "file.json"
+        assert write_atomic(path, "one") is True
+        assert write_atomic(path, "two") is True
+        assert path.read_text() == "two"
+        assert os.listdir(path.parent) == ["file.json"], os.listdir(path.parent)
+
+
+def test_failure_leaves_the_old_file_and_no_temp():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "file.json"
+        write_atomic(path, "old")
+        # A directory where the temp file's parent should be: mkdir fails.
+        blocked = Path(tmp) / "blocked"
+        blocked.write_text("")
+        assert write_atomic(blocked / "file.json", "new") is False
+        # Replacing a directory with a file fails after the temp is written.
+        (Path(tmp) / "dir").mkdir()
+        assert write_atomic(Path(tmp) / "dir", "new") is False
+        assert path.read_text() == "old"
+        assert sorted(os.listdir(tmp)) == ["blocked", "dir", "file.json"], os.listdir(tmp)
+
+
+def _run():
+    tests = [v for k, v in sorted(globals().items())
+             if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"[PASS] {t.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {t.__name__}: {e}")
+    if failed:
+        print(f"\n{failed} of {len(tests)} failed")
+        sys.exit(1)
+    print(f"\nAll {len(tests)} passed")
+
+
+if __name__ == "__main__":
+    _run()
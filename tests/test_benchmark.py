@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""Tests for the micro-benchmark runner (tests/benchmark.py).
+
+compare() is plain Python; the runner itself is exercised in a subprocess:
+every case once (--quick), then one cheap case against a baseline it can't
+possibly meet, which must fail the run.
+
+    PYTHONPATH=src python tests/test_benchmark.py
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import benchmark
+
+SCRIPT = os.path.abspath(benchmark.__file__)
+
+
+def _bench(*args):
+    env = dict(os.environ)
+    env["QT_QPA_PLATFORM"] = "offscreen"
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (benchmark.SRC, env.get("PYTHONPATH", "")) if p)
+    return subprocess.run([sys.executable, SCRIPT, *args], env=env,
+                          capture_output=True, text=True, timeout=180)
+
+
+def test_compare_flags_only_regressions_beyond_tolerance():
+    rows = benchmark.compare(
+        {"fast": 90.0, "slower": 120.0, "regressed": 130.0, "new": 5.0},
+        {"fast": 100.0, "slower": 100.0, "regressed": 100.0, "gone": 1.0},
+        0.25)
+    by_name = {r[0]: r for r in rows}
+    assert set(by_name) == {"fast", "slower", "regressed", "new"}, rows
+    assert [n for n, *_, bad in rows if bad] == ["regressed"], rows
+    assert by_name["slower"][3] == 1.2
+    assert by_name["new"][2:] == (None, None, False)
+
+
+def test_quick_run_covers_every_case():
+    proc = _bench("--quick")
+    assert proc.returncode == 0, proc.stderr
+    assert f"ran {len(benchmark.HORIZONS) * 3 + 5} cases once" in proc.stdout, proc.stdout
+
+
+def test_compare_exits_nonzero_on_regression():
+    case = f"nws.format_expires[{benchmark.ALERT_COUNT}]"
+    fd, path = tempfile.mkstemp(prefix="kde-weather-bench-test-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump({"tolerance": 0.25, "results": {case: 1e-3}}, f)
+        proc = _bench("--compare", "--baseline", path, "-k", "format_expires")
+        assert proc.returncode == 1, (proc.returncode, proc.stdout, proc.stderr)
+        assert "REGRESSED" in proc.stdout and "1 of 1 cases regressed" in proc.stdout, proc.stdout
+
+        with open(path, "w") as f:
+            json.dump({"tolerance": 0.25, "results": {case: 1e9}}, f)
+        proc = _bench("--compare", "--baseline", path, "-k", "format_expires")
+        assert proc.returncode == 0, (proc.returncode, proc.stdout, proc.stderr)
+    finally:
+        os.remove(path)
+
+
+def _run():
+    tests = [v for k, v in sorted(globals().items())
+             if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"[PASS] {t.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {t.__name__}: {e}")
+    if failed:
+        print(f"\n{failed} of {len(tests)} failed")
+        sys.exit(1)
+    print(f"\nAll {len(tests)} passed")
+
+
+if __name__ == "__main__":
+    _run()
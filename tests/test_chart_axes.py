@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""Tests for the chart axis layout math (backend.models.chart_axes).
+
+No framework; run directly:
+    PYTHONPATH=src python tests/test_chart_axes.py
+"""
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from kde_weather.backend.models.chart_axes import nice_interval, x_axis, y_axis
+
+
+def _ms(*args):
+    return datetime(*args).timestamp() * 1000
+
+
+def test_nice_interval_rounds_to_1_2_5():
+    assert nice_interval(0) == 1
+    assert nice_interval(50) == 10
+    assert nice_interval(12) == 2
+    assert nice_interval(3) == 0.5
+
+
+def test_y_axis_snaps_and_clamps():
+    assert y_axis([41, 78]) == {"yMin": 40, "yMax": 80, "yTickCount": 5}
+    # Flat series still gets one interval either side.
+    assert y_axis([50, 50]) == {"yMin": 49, "yMax": 51, "yTickCount": 3}
+    assert y_axis([0, 0], clamp_min=0)["yMin"] == 0
+
+
+def test_x_axis_snaps_to_six_hours_and_bands_days():
+    layout = x_axis(_ms(2026, 6, 17, 9), _ms(2026, 6, 18, 20))
+    assert layout["xMinMs"] == _ms(2026, 6, 17, 6)
+    assert layout["xMaxMs"] == _ms(2026, 6, 19, 0)
+    assert layout["xTickCount"] == 8
+    bands = layout["dayBands"]
+    assert [b["even"] for b in bands] == [True, False], bands
+    assert bands[0]["endMs"] == bands[1]["startMs"] == _ms(2026, 6, 18, 0)
+    assert bands[-1]["endMs"] == layout["xMaxMs"]
+
+
+def _run():
+    tests = [v for k, v in sorted(globals().items())
+             if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"[PASS] {t.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {t.__name__}: {e}")
+    if failed:
+        print(f"\n{failed} of {len(tests)} failed")
+        sys.exit(1)
+    print(f"\nAll {len(tests)} passed")
+
+
+if __name__ == "__main__":
+    _run()
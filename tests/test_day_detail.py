@@ -3,7 +3,10 @@
 
 Runs in a subprocess with an isolated $HOME, offscreen Qt, and stubbed network
 (so AppController's startup refresh touches nothing). We seed the NWS cache
-directly, call selectDay, and assert dayDetail reflects the parsed day.
+directly, call selectDay, and assert dayDetail reflects the parsed day -- and
+that an expired entry is shown at once, without its ended alerts, while a
+background fetch replaces it.  refresh() fetches the detail up front, and
+only the alerts when just they have expired.
 
     PYTHONPATH=src python tests/test_day_detail.py
 """
@@ -14,14 +17,36 @@ import tempfile
 
 
 def _child():
+    import time
+
+    from PySide6.QtCore import QEventLoop, QTimer
     from PySide6.QtWidgets import QApplication
 
     # Stub the network so the startup refresh and any worker are offline/no-ops.
     from kde_weather.backend.api import worker
-    worker.fetch_forecast = lambda lat, lon: {"hourly": {}, "daily": {}}
+    worker.fetch_forecast_batch = lambda coords: [{"hourly": {}, "daily": {}} for _ in coords]
     worker.fetch_geocode = lambda query, count=5: []
     worker.fetch_nws_details = lambda lat, lon: {"available": True, "periods": [], "alerts": []}
+    worker.fetch_nws_alerts = lambda lat, lon: {"alerts": [], "alerts_max_age": None}
+
+    from kde_weather.backend import orchestrator
+
+    async def fake_forecast(transport, lat, lon):
+        return {"hourly": {}, "daily": {}}
+
+    nws_calls = []
 
+    async def fake_nws(transport, lat, lon):
+        nws_calls.append("nws")
+        return {"available": True, "periods": [], "alerts": []}
+
+    async def fake_nws_alerts(transport, lat, lon):
+        nws_calls.append("nws_alerts")
+        return {"alerts": [], "alerts_max_age": None}
+    orchestrator.PROVIDERS = {"forecast": fake_forecast, "nws": fake_nws,
+                              "nws_alerts": fake_nws_alerts}
+
+    from kde_weather.backend.api.nws import index_payload
     from kde_weather.backend.app_controller import AppController
 
     app = QApplication([])
@@ -30,8 +55,20 @@ def _child():
     loc = ctrl._settings.activeLocation
     key = (loc["lat"], loc["lon"])
 
+    def spin_until(done):
+        for _ in range(50):
+            if done():
+                return True
+            loop = QEventLoop()
+            QTimer.singleShot(20, loop.quit)
+            loop.exec()
+        return done()
+
+    # refresh() for the new location fetches its NWS detail alongside the forecast.
+    assert spin_until(lambda: ctrl._nws_cache.is_fresh(key)), ctrl._nws_cache.stats()
+
     # Seed the per-location NWS cache so selectDay() serves from it (no fetch).
-    ctrl._nws_cache[key] = {
+    cached = {
         "available": True,
         "periods": [
             {"name": "Wednesday", "isDaytime": True,
@@ -46,6 +83,7 @@ def _child():
             "effective": "2026-06-17T10:00:00-04:00",
             "expires": "2026-06-17T20:00:00-04:00"}}],
     }
+    ctrl._nws_cache.put(key, cached)
 
     ctrl.selectDay("2026-06-17")
     dd = ctrl._day_detail
@@ -59,6 +97,26 @@ def _child():
     ctrl.selectDay("2026-06-17")
     assert dd.selectedDate == "", dd.selectedDate
 
+    # An expired entry: shown immediately, minus the alert that has ended...
+    ctrl._nws_cache.put(key, cached, now=time.time() - 24 * 3600)
+    ctrl.selectDay("2026-06-17")
+    assert [p["name"] for p in dd.periods] == ["Wednesday", "Wednesday Night"], dd.periods
+    assert dd.alerts == [], dd.alerts
+    # ...and replaced by the background refresh (the stub returns no periods).
+    assert spin_until(lambda: ctrl._nws_cache.is_fresh(key))
+    assert dd.periods == [], dd.periods
+
+    # Only the alerts expired: refresh() fetches just those and keeps the
+    # cached periods -- no /points -> forecast chain.
+    index_payload(cached)
+    ctrl._nws_cache.put(key, dict(cached, alerts_max_age=0))
+    nws_calls.clear()
+    ctrl.refresh()
+    assert spin_until(lambda: ctrl._nws_cache.is_fresh(key)), ctrl._nws_cache.stats()
+    assert nws_calls == ["nws_alerts"], nws_calls
+    assert [p["name"] for p in dd.periods] == ["Wednesday", "Wednesday Night"], dd.periods
+    assert dd.alerts == [], dd.alerts
+
     ctrl.shutdown()
     print("child ok")
 
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+"""Tests for the on-disk forecast cache and fetch_forecast's revalidation.
+
+No framework; run directly:
+    PYTHONPATH=src python tests/test_forecast_cache.py
+The cache directory is redirected to a temp dir and the pooled
+http_client.get is replaced by a recording fake, so nothing touches the real
+~/.cache or the network.
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from kde_weather.backend.api import forecast_cache, open_meteo
+
+
+class _FakeResp:
+    def __init__(self, status=200, payload=None, headers=None):
+        self.status_code = status
+        self._payload = payload or {}
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"HTTP {self.status_code}")
+
+    def json(self):
+        return self._payload
+
+
+class _Recorder:
+    """Stands in for http_client.get: returns queued responses, records calls."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def __call__(self, url, *args, **kwargs):
+        self.calls.append(kwargs)
+        return self.responses.pop(0)
+
+
+def _with_fake(recorder, fn):
+    """Run fn() with a temp cache dir and http_client.get replaced by recorder."""
+    orig_get, orig_dir = open_meteo.http_client.get, forecast_cache.CACHE_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        forecast_cache.CACHE_DIR = Path(tmp)
+        open_meteo.http_client.get = recorder
+        try:
+            return fn()
+        finally:
+            open_meteo.http_client.get = orig_get
+            forecast_cache.CACHE_DIR = orig_dir
+
+
+def test_cache_key_rounds_coordinates():
+    p = open_meteo.forecast_params(43.04811, -76.14742)
+    a = forecast_cache.cache_key(43.04811, -76.14742, p)
+    b = forecast_cache.cache_key(43.0492, -76.1491, open_meteo.forecast_params(43.0492, -76.1491))
+    assert a == b, (a, b)
+
+
+def test_parse_max_age():
+    assert forecast_cache.parse_max_age("public, max-age=900") == 900
+    assert forecast_cache.parse_max_age("no-cache") == 0
+    assert forecast_cache.parse_max_age("") is None
+    assert forecast_cache.parse_max_age(None) is None
+
+
+def test_fresh_entry_served_without_request():
+    rec = _Recorder(_FakeResp(payload={"hourly": {"time": ["x"]}},
+                              headers={"Cache-Control": "max-age=600"}))
+
+    def run():
+        first = open_meteo.fetch_forecast(43.0, -76.0)
+        second = open_meteo.fetch_forecast(43.0, -76.0)
+        return first, second
+
+    first, second = _with_fake(rec, run)
+    assert first == second == {"hourly": {"time": ["x"]}}, (first, second)
+    assert len(rec.calls) == 1, rec.calls
+
+
+def test_stale_entry_revalidates_and_reuses_body_on_304():
+    rec = _Recorder(
+        _FakeResp(payload={"v": 1}, headers={"ETag": '"abc"', "Cache-Control": "max-age=0"}),
+        _FakeResp(status=304, headers={"Cache-Control": "max-age=600"}),
+    )
+
+    def run():
+        open_meteo.fetch_forecast(43.0, -76.0)
+        body = open_meteo.fetch_forecast(43.0, -76.0)
+        entry = open_meteo.cached_forecast(43.0, -76.0)
+        return body, entry
+
+    body, entry = _with_fake(rec, run)
+    assert body == {"v": 1}, body
+    assert rec.calls[1]["headers"] == {"If-None-Match": '"abc"'}, rec.calls[1]
+    # The 304's Cache-Control replaced max-age=0, so the entry is fresh again.
+    assert forecast_cache.is_fresh(entry), entry
+
+
+def test_batch_fetch_splits_results_into_per_location_entries():
+    rec = _Recorder(_FakeResp(payload=[{"loc": "a"}, {"loc": "b"}],
+                              headers={"Cache-Control": "max-age=600", "ETag": '"combined"'}))
+
+    def run():
+        results = open_meteo.fetch_forecast_batch([(43.0, -76.0), (40.7, -74.0)])
+        return results, open_meteo.cached_forecast(40.7, -74.0)
+
+    results, entry = _with_fake(rec, run)
+    assert len(rec.calls) == 1, rec.calls
+    assert rec.calls[0]["params"]["latitude"] == "43.0,40.7", rec.calls[0]
+    assert results == [{"loc": "a"}, {"loc": "b"}], results
+    assert entry["body"] == {"loc": "b"} and forecast_cache.is_fresh(entry), entry
+    # The combined body's ETag can't validate one location's slice.
+    assert entry["etag"] is None, entry
+
+
+def test_corrupt_or_expired_entry_is_ignored():
+    def run():
+        key = "k"
+        forecast_cache.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (forecast_cache.CACHE_DIR / "k.json").write_text("{not json")
+        assert forecast_cache.load(key) is None
+        forecast_cache.store(key, {"v": 1}, {}, now=0)
+        assert forecast_cache.load(key, now=forecast_cache.MAX_STALE_AGE + 1) is None
+        assert forecast_cache.load(key, now=10)["body"] == {"v": 1}
+
+    _with_fake(_Recorder(), run)
+
+
+def _run():
+    tests = [v for k, v in sorted(globals().items())
+             if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"[PASS] {t.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {t.__name__}: {e}")
+    if failed:
+        print(f"\n{failed} of {len(tests)} failed")
+        sys.exit(1)
+    print(f"\nAll {len(tests)} passed")
+
+
+if __name__ == "__main__":
+    _run()
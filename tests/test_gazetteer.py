@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""Tests for the offline mmap gazetteer and its builder, on synthetic data.
+
+No framework; run directly:
+    PYTHONPATH=src python tests/test_gazetteer.py
+"""
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from kde_weather.backend.api import gazetteer
+
+_TSV = """name\tadmin1\tcountry\tlatitude\tlongitude\tpopulation
+Syracuse\tNew York\tUnited States\t43.04812\t-76.14742\t142000
+Syracuse\tUtah\tUnited States\t41.08939\t-112.06467\t32000
+Siracusa\tSicily\tItaly\t37.07542\t15.28664\t122000
+Syria\t\t\t35.0\t38.0\t0
+São Paulo\tSão Paulo\tBrazil\t-23.5475\t-46.63611\t10021295
+Santa Fe\tNew Mexico\tUnited States\t35.68698\t-105.9378\t84000
+Santiago\tRegión Metropolitana\tChile\t-33.45694\t-70.64827\t4837295
+Bad Row\t\t\t\tnot-a-number\t1
+"""
+
+
+def _with_index(fn, text=_TSV):
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "cities.tsv")
+        out = os.path.join(tmp, "gaz.idx")
+        with open(src, "w", encoding="utf-8") as f:
+            f.write(text)
+        n = gazetteer.build_from_file(src, out)
+        g = gazetteer.Gazetteer(out)
+        try:
+            return fn(g, n)
+        finally:
+            g.close()
+
+
+def test_builder_skips_unparseable_rows():
+    assert _with_index(lambda g, n: (n, len(g))) == (7, 7)
+
+
+def test_result_shape_matches_open_meteo():
+    res = _with_index(lambda g, n: g.search("Syracuse", 1))
+    assert res == [{"name": "Syracuse", "admin1": "New York", "country": "United States",
+                    "latitude": 43.04812, "longitude": -76.14742, "population": 142000}], res
+
+
+def test_short_prefix_uses_ranked_table():
+    res = _with_index(lambda g, n: g.search("sa", 5))
+    assert [r["name"] for r in res] == ["São Paulo", "Santiago", "Santa Fe"], res
+
+
+def test_long_prefix_scans_and_ranks_by_population():
+    res = _with_index(lambda g, n: g.search("syrac", 5))
+    assert [r["admin1"] for r in res] == ["New York", "Utah"], res
+
+
+def test_accents_and_case_are_folded():
+    res = _with_index(lambda g, n: g.search("SAO PAUL", 5))
+    assert [r["name"] for r in res] == ["São Paulo"], res
+
+
+def test_no_match_and_empty_query():
+    assert _with_index(lambda g, n: (g.search("zzzzzz"), g.search("zz"), g.search("  "))) == ([], [], [])
+
+
+def test_many_entries_with_same_prefix():
+    rows = ["name\tadmin1\tcountry\tlatitude\tlongitude\tpopulation"]
+    rows += [f"Springfield {i:03d}\tX\tY\t1\t2\t{i}" for i in range(300)]
+    res = _with_index(lambda g, n: g.search("spring", 3), text="\n".join(rows) + "\n")
+    assert [r["population"] for r in res] == [299, 298, 297], res
+    res = _with_index(lambda g, n: g.search("spr", 3), text="\n".join(rows) + "\n")
+    assert [r["population"] for r in res] == [299, 298, 297], res
+
+
+def test_rejects_non_index_file():
+    with tempfile.NamedTemporaryFile(suffix=".idx") as f:
+        f.write(b"x" * 64)
+        f.flush()
+        try:
+            gazetteer.Gazetteer(f.name)
+        except ValueError:
+            return
+    raise AssertionError("expected ValueError for a non-index file")
+
+
+def _run():
+    tests = [v for k, v in sorted(globals().items())
+             if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"[PASS] {t.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {t.__name__}: {e}")
+    if failed:
+        print(f"\n{failed} of {len(tests)} failed")
+        sys.exit(1)
+    print(f"\nAll {len(tests)} passed")
+
+
+if __name__ == "__main__":
+    _run()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""Tests for the geocode LRU cache and its local prefix filtering.
+
+No framework; run directly:
+    PYTHONPATH=src python tests/test_geocode_cache.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from kde_weather.backend.api.geocode_cache import GeocodeCache, normalize
+
+_SYR = [{"name": "Syracuse", "admin1": "New York"},
+        {"name": "Syracuse", "admin1": "Utah"},
+        {"name": "Syria", "admin1": ""}]
+
+
+def test_normalize_folds_case_accents_and_spaces():
+    assert normalize("  São   PAULO ") == "sao paulo"
+
+
+def test_exact_hit_ignores_case_and_whitespace():
+    c = GeocodeCache()
+    c.store("Syracuse", _SYR[:2], requested=5, now=0)
+    assert c.lookup(" syracuse ", now=1) == _SYR[:2]
+
+
+def test_longer_query_filtered_from_complete_prefix():
+    c = GeocodeCache()
+    c.store("syr", _SYR, requested=5, now=0)  # 3 < 5 -> complete
+    res = c.lookup("Syrac", now=1)
+    assert [r["admin1"] for r in res] == ["New York", "Utah"], res
+
+
+def test_truncated_prefix_is_not_filtered():
+    c = GeocodeCache()
+    c.store("syr", _SYR, requested=3, now=0)  # hit the limit -> maybe cut off
+    assert c.lookup("syrac", now=1) is None
+
+
+def test_entries_expire_and_lru_evicts():
+    c = GeocodeCache(max_entries=2, ttl=10)
+    c.store("aaa", [], requested=5, now=0)
+    assert c.lookup("aaa", now=11) is None
+    c.store("bbb", [], requested=5, now=0)
+    c.store("ccc", [], requested=5, now=0)
+    c.lookup("bbb", now=1)                 # touch bbb -> ccc is now oldest
+    c.store("ddd", [], requested=5, now=1)
+    assert c.lookup("ccc", now=1) is None
+    assert c.lookup("bbb", now=1) == []
+
+
+def _run():
+    tests = [v for k, v in sorted(globals().items())
+             if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"[PASS] {t.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {t.__name__}: {e}")
+    if failed:
+        print(f"\n{failed} of {len(tests)} failed")
+        sys.exit(1)
+    print(f"\nAll {len(tests)} passed")
+
+
+if __name__ == "__main__":
+    _run()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""Tests for the shared pooled HTTP client (keep-alive reuse + counters).
+
+No framework; run directly:
+    PYTHONPATH=src python tests/test_http_client.py
+Talks only to a throwaway HTTP/1.1 server on 127.0.0.1, never the network.
+"""
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from kde_weather.backend.api import http_client
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so the client can reuse sockets
+
+    def do_GET(self):
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_sequential_requests_reuse_one_connection():
+    server = _serve()
+    try:
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        before = http_client.pool_stats()
+        for i in range(3):
+            resp = http_client.get(f"{base}/r{i}", timeout=5)
+            assert resp.json() == {"path": f"/r{i}"}, resp.text
+        after = http_client.pool_stats()
+    finally:
+        server.shutdown()
+    assert after["requests"] - before["requests"] == 3, (before, after)
+    assert after["connections"] - before["connections"] == 1, (before, after)
+    assert after["reused"] - before["reused"] == 2, (before, after)
+
+
+def test_threads_share_the_adapter_but_not_the_session():
+    sessions = []
+    t = threading.Thread(target=lambda: sessions.append(http_client.session()))
+    t.start()
+    t.join()
+    main = http_client.session()
+    assert sessions[0] is not main
+    assert sessions[0].get_adapter("https://x") is main.get_adapter("https://x")
+    assert "gzip" in main.headers["Accept-Encoding"], main.headers
+
+
+def _run():
+    tests = [v for k, v in sorted(globals().items())
+             if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"[PASS] {t.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {t.__name__}: {e}")
+    if failed:
+        print(f"\n{failed} of {len(tests)} failed")
+        sys.exit(1)
+    print(f"\nAll {len(tests)} passed")
+
+
+if __name__ == "__main__":
+    _run()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""Tests for request coalescing / latest-wins bookkeeping (backend.inflight).
+
+No framework; run directly:
+    PYTHONPATH=src python tests/test_inflight.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from kde_weather.backend.inflight import InFlight
+
+
+def test_duplicate_request_attaches_to_inflight_one():
+    f = InFlight()
+    assert f.begin("forecast", (1, 2)) is True
+    assert f.begin("forecast", (1, 2)) is False  # coalesced, no new worker
+    assert f.finish("forecast", (1, 2)) is True
+    assert not f.is_pending("forecast", (1, 2))
+
+
+def test_out_of_order_response_is_dropped():
+    f = InFlight()
+    f.begin("geocode", "syr")
+    f.begin("geocode", "syrac")
+    # The newer query answers first and wins; the older one is stale.
+    assert f.finish("geocode", "syrac") is True
+    assert f.finish("geocode", "syr") is False
+
+
+def test_reattaching_makes_inflight_request_current_again():
+    f = InFlight()
+    f.begin("forecast", "A")
+    f.begin("forecast", "B")
+    assert f.begin("forecast", "A") is False  # A -> B -> A while A in flight
+    assert f.finish("forecast", "B") is False
+    assert f.finish("forecast", "A") is True
+
+
+def test_supersede_invalidates_without_a_request():
+    f = InFlight()
+    f.begin("forecast", "A")
+    f.supersede("forecast")  # e.g. switched to a location served from cache
+    assert f.finish("forecast", "A") is False
+
+
+def test_pending_keys_lists_one_kind():
+    f = InFlight()
+    f.begin("batch", ((1, 2), (3, 4)))
+    f.begin("forecast", (5, 6))
+    assert f.pending_keys("batch") == [((1, 2), (3, 4))]
+    f.finish("batch", ((1, 2), (3, 4)))
+    assert f.pending_keys("batch") == []
+
+
+def test_kinds_are_independent():
+    f = InFlight()
+    f.begin("forecast", "A")
+    f.begin("geocode", "q")
+    assert f.finish("forecast", "A") is True
+    assert f.finish("geocode", "q") is True
+
+
+def _run():
+    tests = [v for k, v in sorted(globals().items())
+             if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"[PASS] {t.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {t.__name__}: {e}")
+    if failed:
+        print(f"\n{failed} of {len(tests)} failed")
+        sys.exit(1)
+    print(f"\nAll {len(tests)} passed")
+
+
+if __name__ == "__main__":
+    _run()
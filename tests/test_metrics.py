@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+"""Tests for the runtime metrics registry and the HTTP instrumentation.
+
+No framework; run directly:
+    PYTHONPATH=src python tests/test_metrics.py
+The HTTP tests talk only to a throwaway HTTP/1.1 server on 127.0.0.1.
+"""
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from kde_weather import metrics
+from kde_weather.backend.api import http_client, resilience
+from kde_weather.backend.api.aio_http import StreamTransport
+
+
+def test_everything_is_a_no_op_while_disabled():
+    metrics.disable()
+
+    @metrics.timed("f_s")
+    def f(x):
+        return x + 1
+
+    metrics.count("c")
+    metrics.observe("h", 1.0)
+    metrics.stop("h", metrics.start())
+    metrics.add_source("s", dict)
+    assert f(1) == 2 and metrics.start() is None
+    assert metrics.snapshot() is None and not metrics.active()
+
+
+def test_counters_histograms_rates_and_sources():
+    metrics.disable()
+    metrics.enable()
+    try:
+        @metrics.timed("f_s")
+        def f():
+            return "ok"
+
+        for _ in range(3):
+            assert f() == "ok"
+        for v in range(1, 101):
+            metrics.observe("size", v)
+        metrics.count("cache.hit", 3)
+        metrics.count("cache.miss")
+        metrics.count("other.hit", 0)
+        metrics.add_source("extra", lambda: {"answer": 42})
+        metrics.add_source("broken", lambda: 1 / 0)
+
+        snap = metrics.snapshot()
+        assert snap["histograms"]["f_s"]["count"] == 3
+        size = snap["histograms"]["size"]
+        assert (size["min"], size["max"], size["p50"], size["p95"]) == (1, 100, 50, 95), size
+        assert snap["hit_rates"] == {"cache": 0.75, "other": None}, snap["hit_rates"]
+        assert snap["extra"] == {"answer": 42}
+        assert "error" in snap["broken"]
+
+        path = os.path.join(tempfile.mkdtemp(prefix="kde-weather-metrics-test-"), "m.json")
+        metrics.dump(path)
+        with open(path) as fh:
+            assert json.load(fh)["counters"]["cache.hit"] == 3
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+    finally:
+        metrics.disable()
+
+
+def test_percentile_is_nearest_rank():
+    odd, even = [5, 1, 4, 2, 3], [4, 1, 3, 2]
+    assert [metrics.percentile(odd, p) for p in (50, 95, 99)] == [3, 5, 5]
+    assert [metrics.percentile(even, p) for p in (50, 95, 99)] == [2, 4, 4]
+    # 0.95 * 30 = 28.5: the 29th value, not the 28th a rounding rank picks.
+    thirty = list(range(1, 31))
+    assert [metrics.percentile(thirty, p) for p in (50, 95, 99)] == [15, 29, 30]
+    assert metrics.percentile([7], 50) == 7 and metrics.percentile(odd, 0) == 1
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps({"path": self.path, "pad": "x" * 100}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_sync_and_async_requests_are_timed_per_host():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    resilience.reset()
+    metrics.disable()
+    metrics.enable()
+
+    async def run():
+        t = StreamTransport()
+        resp = await t.get(f"{base}/async")
+        await t.close()
+        return resp.json()
+
+    try:
+        assert http_client.get(f"{base}/sync", timeout=5).json()["path"] == "/sync"
+        assert asyncio.run(run())["path"] == "/async"
+        snap = metrics.snapshot()
+    finally:
+        metrics.disable()
+        server.shutdown()
+    hist = snap["histograms"]
+    assert snap["counters"]["http.127.0.0.1.requests"] == 2, snap["counters"]
+    assert hist["http.127.0.0.1.ttfb_s"]["count"] == 2, hist
+    assert hist["http.127.0.0.1.body_bytes"]["min"] > 100, hist
+    assert hist["http.json_decode_s"]["count"] == 2, hist
+    # One new socket per engine: the sync pool may already hold one from an
+    # earlier test, so at least the async connect is timed.
+    assert hist["http.127.0.0.1.connect_s"]["count"] >= 1, hist
+
+
+def _run():
+    tests = [v for k, v in sorted(globals().items())
+             if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"[PASS] {t.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {t.__name__}: {e}")
+    if failed:
+        print(f"\n{failed} of {len(tests)} failed")
+        sys.exit(1)
+    print(f"\nAll {len(tests)} passed")
+
+
+if __name__ == "__main__":
+    _run()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+"""Tests for the list models: columnar HourlyModel / DailyModel storage and
+diff-based (reset-free) updates.
+
+No framework; run directly:
+    PYTHONPATH=src python tests/test_models.py
+The models are plain QAbstractListModels, so no QApplication is needed.
+"""
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from kde_weather.backend.models.daily_model import DailyModel
+from kde_weather.backend.models.geocode_model import GeocodeModel
+from kde_weather.backend.models.hourly_model import HourlyModel
+
+
+def _hourly(hours=72, past=3):
+    """Synthetic Open-Meteo hourly block starting `past` hours before now."""
+    start = datetime.now().replace(minute=0, second=0, microsecond=0) - timedelta(hours=past)
+    times = [(start + timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M") for i in range(hours)]
+    return {
+        "time": times,
+        "temperature_2m": [float(i) for i in range(hours)],
+        "relative_humidity_2m": [50] * hours,
+        # One null in the visible window, and a column shorter than "time".
+        "rain": [None if i == past + 1 else 0.1 for i in range(hours)],
+        "weather_code": [3] * (hours - 30),
+    }
+
+
+def test_hourly_window_starts_at_current_hour():
+    m = HourlyModel()
+    m.update(_hourly())
+    assert m.start_idx == 3, m.start_idx
+    assert m.rowCount() == 48, m.rowCount()
+    assert m.data(m.index(0), HourlyModel.TempRole) == 3.0
+    assert m.data(m.index(0), HourlyModel.TimeRole) == _hourly()["time"][3]
+    assert m.dataVersion == 1
+
+
+def test_hourly_missing_values_are_none():
+    m = HourlyModel()
+    m.update(_hourly())
+    assert m.data(m.index(1), HourlyModel.RainRole) is None
+    assert m.data(m.index(47), HourlyModel.WeatherCodeRole) is None  # past column end
+    assert m.data(m.index(0), HourlyModel.WindGustsRole) is None     # column absent
+    assert m.data(m.index(0), 12345) is None                          # unknown role
+    assert m.row(2)["temperature_2m"] == 5.0
+
+
+def test_series_data_skips_missing_and_uses_epoch_ms():
+    m = HourlyModel()
+    m.update(_hourly())
+    series = m.seriesData("rain")
+    assert len(series) == 47, len(series)
+    first = datetime.fromisoformat(_hourly()["time"][3])
+    assert series[0] == {"x": int(first.timestamp() * 1000), "y": 0.1}, series[0]
+    assert m.seriesData("nonsense") == []
+
+
+def test_series_data_is_memoized_per_update():
+    m = HourlyModel()
+    m.update(_hourly())
+    series = m.seriesData("temperature")
+    assert m.seriesData("temperature") is series
+    changed = _hourly()
+    changed["temperature_2m"][5] = -1.0
+    m.update(changed)
+    assert m.seriesData("temperature") is not series
+
+
+def test_feed_series_replaces_points_in_one_call():
+    from PySide6.QtCharts import QLineSeries
+    m = HourlyModel()
+    m.update(_hourly())
+    series = QLineSeries()
+    assert m.feedSeries(series, "rain") == 47
+    assert series.count() == 47 and series.at(0).y() == 0.1
+    assert m.feedSeries(series, "") == 0 and series.count() == 0
+    layout = m.chartLayout(["temperature", "apparentTemperature"], 0.0)
+    assert (layout["yMin"], layout["yMax"]) == (0, 50), layout
+    assert m.chartLayout(["temperature", "apparentTemperature"], 0.0) is layout
+    assert m.chartLayout(["snowDepth"], 0.0) == {}
+
+
+def test_daily_roles_map_to_columns():
+    m = DailyModel()
+    m.update({"time": ["2026-06-17", "2026-06-18"], "temperature_2m_max": [80, None],
+              "sunrise": ["2026-06-17T05:30", "2026-06-18T05:31"]})
+    assert m.rowCount() == 2
+    assert m.data(m.index(0), DailyModel.DateRole) == "2026-06-17"
+    assert m.data(m.index(0), DailyModel.TempMaxRole) == 80
+    assert m.data(m.index(1), DailyModel.TempMaxRole) is None
+    assert m.data(m.index(1), DailyModel.SunriseRole) == "2026-06-18T05:31"
+    assert m.data(m.index(1), DailyModel.SunsetRole) == ""
+
+
+def _record(model):
+    """Collect the model's change signals as tuples, in emission order."""
+    log = []
+    model.modelReset.connect(lambda: log.append(("reset",)))
+    model.rowsRemoved.connect(lambda _p, first, last: log.append(("removed", first, last)))
+    model.rowsInserted.connect(lambda _p, first, last: log.append(("inserted", first, last)))
+    model.dataChanged.connect(
+        lambda tl, br, roles: log.append(("changed", tl.row(), br.row(), sorted(roles))))
+    return log
+
+
+def test_hourly_window_shift_removes_and_appends_rows():
+    m = HourlyModel()
+    m.update(_hourly())
+    log = _record(m)
+    # Same forecast, but starting an hour from now: as if the current hour
+    # had passed by the time of the refresh.
+    shifted = {key: vals[4:] for key, vals in _hourly().items()}
+    m.update(shifted)
+    assert ("removed", 0, 0) in log and ("inserted", 47, 47) in log, log
+    assert not any(e[0] in ("reset", "changed") for e in log), log
+    assert m.rowCount() == 48
+    assert m.data(m.index(0), HourlyModel.TempRole) == 4.0
+
+
+def test_hourly_advance_slides_window_without_new_data():
+    m = HourlyModel()
+    m.update(_hourly())
+    log = _record(m)
+    assert m.advance() is False and log == []
+    later = datetime.now() + timedelta(hours=2)
+    assert m.advance(later) is True
+    assert m.start_idx == 5, m.start_idx
+    assert m.data(m.index(0), HourlyModel.TempRole) == 5.0
+    assert log[0] == ("removed", 0, 1) and log[-1] == ("inserted", 46, 47), log
+    assert m.dataVersion == 2
+
+
+def test_hourly_unchanged_refresh_emits_nothing():
+    m = HourlyModel()
+    m.update(_hourly())
+    log = _record(m)
+    m.update(_hourly())
+    assert log == [], log
+    assert m.dataVersion == 1
+
+
+def test_daily_changed_cell_signals_only_its_role():
+    m = DailyModel()
+    days = {"time": ["2026-06-17", "2026-06-18"], "temperature_2m_max": [80, 81]}
+    m.update(days)
+    log = _record(m)
+    m.update(dict(days, temperature_2m_max=[80, 83]))
+    assert log == [("changed", 1, 1, [DailyModel.TempMaxRole])], log
+
+
+def test_geocode_results_diff_by_row():
+    m = GeocodeModel()
+    a = {"name": "Paris", "country": "France"}
+    b = {"name": "Paris", "admin1": "Texas", "country": "United States"}
+    m.update([a, b])
+    log = _record(m)
+    m.update([a])
+    m.clear()
+    assert log == [("removed", 1, 1), ("removed", 0, 0)], log
+    assert m.rowCount() == 0
+
+
+def _run():
+    tests = [v for k, v in sorted(globals().items())
+             if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"[PASS] {t.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {t.__name__}: {e}")
+    if failed:
+        print(f"\n{failed} of {len(tests)} failed")
+        sys.exit(1)
+    print(f"\nAll {len(tests)} passed")
+
+
+if __name__ == "__main__":
+    _run()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+"""Tests for the TTL/LRU-bounded NWS detail cache.
+
+No framework; run directly:
+    PYTHONPATH=src python tests/test_nws_cache.py
+"""
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from kde_weather.backend.api.nws import active_alerts, index_payload, merge_alerts
+from kde_weather.backend.api.nws_cache import NwsCache, approx_size, header_lifetime
+
+
+def _payload(periods_max_age=None, alerts_max_age=None, text="x"):
+    return {"available": True, "periods": [{"detailedForecast": text}], "alerts": [],
+            "periods_max_age": periods_max_age, "alerts_max_age": alerts_max_age}
+
+
+def test_header_lifetime_prefers_max_age_then_expires():
+    assert header_lifetime({"Cache-Control": "public, max-age=120",
+                            "Expires": "Thu, 01 Jan 2026 00:10:00 GMT"}) == 120
+    assert header_lifetime({"Date": "Thu, 01 Jan 2026 00:00:00 GMT",
+                            "Expires": "Thu, 01 Jan 2026 00:10:00 GMT"}) == 600
+    assert header_lifetime({"Expires": "garbage"}) is None
+    assert header_lifetime({}) is None
+
+
+def test_periods_and_alerts_expire_separately():
+    c = NwsCache(periods_ttl=3600, alerts_ttl=60)
+    c.put("k", _payload(alerts_max_age=30), now=0)
+    assert c.get("k", now=10)[1] is True
+    # Alerts (from the header, 30 s) lapse first; the payload is still served.
+    payload, fresh = c.get("k", now=40)
+    assert fresh is False and payload["periods"][0]["detailedForecast"] == "x"
+    c.put("k", _payload(), now=100)  # no header lifetimes: fallbacks apply
+    assert c.get("k", now=150)[1] is True
+    assert c.get("k", now=161)[1] is False
+
+
+def test_only_alerts_refetched_while_periods_fresh():
+    c = NwsCache(periods_ttl=3600, alerts_ttl=60)
+    payload = _payload()
+    payload["periods"][0].update(startTime="2026-06-17T06:00:00-04:00", isDaytime=True)
+    index_payload(payload)
+    c.put("k", payload, now=0)
+    assert c.to_fetch("k", now=30) is None and c.to_fetch("other", now=30) == "details"
+    assert c.to_fetch("k", now=100) == "alerts" and c.get("k", now=100)[1] is False
+
+    alert = {"properties": {"event": "Heat Advisory",
+                            "effective": "2026-06-17T10:00:00-04:00",
+                            "expires": "2026-06-17T20:00:00-04:00"}}
+    update = {"alerts": [alert], "alerts_max_age": 120}
+    index_payload(update)
+    c.put_alerts("k", merge_alerts(payload, update), now=100)
+    merged = c.peek("k")
+    assert merged["periods"] is payload["periods"] and merged["alerts"] == [alert]
+    periods, alerts = merged["index"].detail("2026-06-17")
+    assert periods[0]["text"] == "x" and alerts[0]["event"] == "Heat Advisory", (periods, alerts)
+    assert payload["alerts"] == [] and "Heat" not in str(payload["index"].detail("2026-06-17"))
+    # The alerts restart their own lifetime; the periods keep theirs.
+    assert c.to_fetch("k", now=219) is None and c.to_fetch("k", now=221) == "alerts"
+    assert c.to_fetch("k", now=3600) == "details"
+
+    c.put_alerts("gone", merge_alerts(payload, update), now=100)
+    assert c.peek("gone") is None
+
+
+def test_lru_eviction_by_count_and_bytes():
+    c = NwsCache(max_entries=2)
+    c.put("a", _payload(), now=0)
+    c.put("b", _payload(), now=0)
+    c.get("a", now=1)            # a is now the most recently used
+    c.put("c", _payload(), now=2)
+    assert c.peek("b") is None and c.peek("a") is not None
+
+    big = _payload(text="y" * 1000)
+    c = NwsCache(max_bytes=approx_size(big) * 2 + 10)
+    for key in "abc":
+        c.put(key, big, now=0)
+    assert c.peek("a") is None and c.stats()["entries"] == 2
+    assert c.stats()["bytes"] == approx_size(big) * 2
+
+
+def test_stats_count_hits_stale_hits_misses_evictions():
+    c = NwsCache(max_entries=1, periods_ttl=10, alerts_ttl=10)
+    c.get("a", now=0)
+    c.put("a", _payload(), now=0)
+    c.get("a", now=1)
+    c.get("a", now=20)
+    c.put("b", _payload(), now=20)
+    s = c.stats()
+    assert (s["hits"], s["stale_hits"], s["misses"], s["evictions"]) == (1, 1, 1, 1), s
+
+
+def test_active_alerts_drops_ended_ones():
+    now = datetime(2026, 6, 17, 12, tzinfo=timezone.utc)
+    ended = {"event": "A", "expires": (now - timedelta(hours=1)).isoformat()}
+    running = {"event": "B", "expires": (now + timedelta(hours=1)).isoformat()}
+    open_ended = {"event": "C"}
+    assert [a["event"] for a in active_alerts([ended, running, open_ended], now)] == ["B", "C"]
+
+
+def _run():
+    tests = [v for k, v in sorted(globals().items())
+             if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"[PASS] {t.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {t.__name__}: {e}")
+    if failed:
+        print(f"\n{failed} of {len(tests)} failed")
+        sys.exit(1)
+    print(f"\nAll {len(tests)} passed")
+
+
+if __name__ == "__main__":
+    _run()
@@ -6,12 +6,32 @@ No framework; run directly:
 Each test_* function raises AssertionError on failure; the runner reports
 results and exits non-zero if any fail.
 """
+import atexit
 import os
+import shutil
 import sys
+import tempfile
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+import requests
 
 sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "src")))
 
-from kde_weather.backend.api import nws
+from kde_weather.backend.api import gridpoint_cache, nws
+
+# Keep the persistent gridpoint map out of the real ~/.cache.
+_TMP = Path(tempfile.mkdtemp(prefix="kde-weather-nws-test-"))
+atexit.register(shutil.rmtree, _TMP, True)
+_tests_run = 0
+
+
+def _fresh_gridpoints():
+    """Point gridpoint_cache at an empty file of its own."""
+    global _tests_run
+    _tests_run += 1
+    gridpoint_cache.CACHE_FILE = _TMP / f"points{_tests_run}.json"
 
 
 def test_periods_for_date_selects_day_and_night():
@@ -78,34 +98,83 @@ def test_format_expires_human_readable():
     assert nws.format_expires("garbage") == ""
 
 
+def test_day_index_matches_linear_helpers():
+    periods = [
+        {"name": f"P{i}", "isDaytime": i % 2 == 0,
+         "startTime": f"2026-06-{17 + i // 2:02d}T{6 if i % 2 == 0 else 18:02d}:00:00-04:00"}
+        for i in range(14)
+    ] + [{"name": "bad", "startTime": "garbage"}]
+    alerts = [
+        {"properties": {"event": "Ongoing", "expires": "2026-06-18T06:00:00-04:00"}},
+        {"properties": {"event": "Later", "effective": "2026-06-21T12:00:00-04:00",
+                        "expires": "2026-06-22T06:00:00-04:00"}},
+        {"event": "Open", "onset": "2026-06-19T08:00:00-04:00"},
+        {"properties": {"event": "Span", "effective": "2026-06-16T00:00:00-04:00",
+                        "expires": "2026-06-20T00:00:00-04:00"}},
+    ]
+    index = nws.DayIndex({"periods": periods, "alerts": alerts})
+    for day in range(15, 25):
+        date_str = f"2026-06-{day}"
+        assert index.periods(date_str) == nws.periods_for_date(periods, date_str), date_str
+        want = sorted(a["event"] for a in nws.alerts_for_date(alerts, date_str))
+        got = sorted(a["event"] for a in index.alerts(date_str))
+        assert got == want, (date_str, got, want)
+
+
+def test_day_index_detail_is_memoized_and_parses_nothing_again():
+    payload = {"available": True, "periods": [
+        {"name": "Wednesday", "isDaytime": True, "detailedForecast": "Sunny.",
+         "startTime": "2026-06-17T06:00:00-04:00"}],
+        "alerts": [{"properties": {"event": "Heat Advisory",
+                                   "expires": "2026-06-17T20:00:00-04:00"}}]}
+    index = nws.index_payload(payload)
+    assert nws.index_payload(payload) is index
+    first = index.detail("2026-06-17")
+    orig, calls = nws._parse_iso, []
+    nws._parse_iso = lambda ts: calls.append(ts) or orig(ts)
+    try:
+        again = index.detail("2026-06-17")
+    finally:
+        nws._parse_iso = orig
+    assert again[0] is first[0] and again[1] is first[1] and calls == [], calls
+    assert first[0] == [{"name": "Wednesday", "text": "Sunny."}], first
+    assert first[1][0]["expiresText"] == "until Wed 8:00 PM", first
+    # Past the alert's end, a "now" filter drops it.
+    late = datetime(2026, 6, 18, tzinfo=timezone.utc)
+    assert index.detail("2026-06-17", late)[1] == []
+
+
 class _FakeResp:
-    def __init__(self, status=200, payload=None):
+    def __init__(self, status=200, payload=None, headers=None):
         self.status_code = status
         self._payload = payload or {}
+        self.headers = headers or {}
 
     def raise_for_status(self):
         if self.status_code >= 400:
-            raise nws.requests.exceptions.HTTPError(f"HTTP {self.status_code}")
+            raise requests.exceptions.HTTPError(f"HTTP {self.status_code}")
 
     def json(self):
         return self._payload
 
 
 def _install_fake_get(mapping):
-    """Replace nws.requests.get with a URL-dispatching fake; return a restore fn.
+    """Replace the pooled http_client.get with a URL-dispatching fake; return a restore fn.
 
-    `mapping` maps a substring of the URL to a _FakeResp.
+    `mapping` maps a substring of the URL to a _FakeResp, or to a function
+    returning one (called on the requesting thread).
     """
-    orig = nws.requests.get
+    _fresh_gridpoints()
+    orig = nws.http_client.get
 
     def fake_get(url, *args, **kwargs):
         for needle, resp in mapping.items():
             if needle in url:
-                return resp
+                return resp() if callable(resp) else resp
         raise AssertionError(f"unexpected URL {url!r}")
 
-    nws.requests.get = fake_get
-    return lambda: setattr(nws.requests, "get", orig)
+    nws.http_client.get = fake_get
+    return lambda: setattr(nws.http_client, "get", orig)
 
 
 def test_fetch_unavailable_when_point_404():
@@ -117,6 +186,30 @@ def test_fetch_unavailable_when_point_404():
     assert res == {"available": False, "periods": [], "alerts": []}, res
 
 
+def test_fetch_remembers_points_outside_coverage():
+    calls = []
+
+    def points():
+        calls.append("points")
+        return _FakeResp(status=404)
+
+    def alerts():
+        calls.append("alerts")
+        return _FakeResp()
+
+    restore = _install_fake_get({"/points/": points, "/alerts/active": alerts})
+    try:
+        first = nws.fetch_nws_details(51.5, -0.1)
+        made = len(calls)
+        second = nws.fetch_nws_details(51.5, -0.1)
+    finally:
+        restore()
+    assert first == second == {"available": False, "periods": [], "alerts": []}, second
+    assert calls.count("points") == 1, calls
+    # A point known to be outside costs no request at all, not even alerts.
+    assert len(calls) == made, calls
+
+
 def test_fetch_unavailable_when_no_forecast_url():
     # Points endpoint returns 200 but its properties lack a forecast URL.
     restore = _install_fake_get({"/points/": _FakeResp(payload={"properties": {}})})
@@ -134,7 +227,8 @@ def test_fetch_happy_path_returns_periods_and_alerts():
         "/forecast": _FakeResp(payload={
             "properties": {"periods": [{"name": "Today", "isDaytime": True}]}}),
         "/alerts/active": _FakeResp(payload={
-            "features": [{"properties": {"event": "Test Warning"}}]}),
+            "features": [{"properties": {"event": "Test Warning"}}]},
+            headers={"Cache-Control": "public, max-age=30"}),
     }
     restore = _install_fake_get(mapping)
     try:
@@ -144,6 +238,100 @@ def test_fetch_happy_path_returns_periods_and_alerts():
     assert res["available"] is True, res
     assert res["periods"][0]["name"] == "Today", res
     assert res["alerts"][0]["properties"]["event"] == "Test Warning", res
+    assert (res["periods_max_age"], res["alerts_max_age"]) == (None, 30), res
+
+
+def test_fetch_alerts_only_requests_alerts():
+    restore = _install_fake_get({"/alerts/active": _FakeResp(
+        payload={"features": [{"properties": {"event": "Test Warning"}}]},
+        headers={"Cache-Control": "public, max-age=30"})})
+    try:
+        res = nws.fetch_nws_alerts(43.0, -76.0)  # any other URL fails the fake
+    finally:
+        restore()
+    assert res == {"alerts": [{"properties": {"event": "Test Warning"}}], "alerts_max_age": 30}, res
+
+
+_POINTS = {"properties": {
+    "forecast": "https://api.weather.gov/gridpoints/X/1,1/forecast",
+    "gridId": "X", "gridX": 1, "gridY": 1}}
+_PERIODS = {"properties": {"periods": [{"name": "Today", "isDaytime": True}]}}
+
+
+def test_fetch_runs_alerts_alongside_points():
+    # Each side waits for the other: sequential requests would never meet.
+    both = threading.Barrier(2, timeout=5)
+
+    def meet(resp):
+        def respond():
+            both.wait()
+            return resp
+        return respond
+
+    restore = _install_fake_get({
+        "/points/": meet(_FakeResp(payload=_POINTS)),
+        "/forecast": _FakeResp(payload=_PERIODS),
+        "/alerts/active": meet(_FakeResp(payload={"features": []})),
+    })
+    try:
+        res = nws.fetch_nws_details(43.0, -76.0)
+    finally:
+        restore()
+    assert res["available"] is True and res["alerts"] == [], res
+
+
+def test_fetch_reuses_remembered_gridpoint():
+    calls = []
+
+    def record(needle, resp):
+        def respond():
+            calls.append(needle)
+            return resp
+        return respond
+
+    restore = _install_fake_get({
+        "/points/": record("points", _FakeResp(payload=_POINTS)),
+        "/forecast": record("forecast", _FakeResp(payload=_PERIODS)),
+        "/alerts/active": _FakeResp(payload={"features": []}),
+    })
+    try:
+        nws.fetch_nws_details(43.0, -76.0)
+        nws.fetch_nws_details(43.00001, -76.0)  # same point at 4 decimals
+    finally:
+        restore()
+    assert calls == ["points", "forecast", "forecast"], calls
+    assert gridpoint_cache.lookup(43.0, -76.0)["gridpoint"] == "X/1,1"
+
+
+def test_fetch_re_resolves_when_remembered_gridpoint_moved():
+    responses = [_FakeResp(status=301), _FakeResp(payload=_PERIODS)]
+    points_calls = []
+
+    def points():
+        points_calls.append(1)
+        return _FakeResp(payload=_POINTS)
+
+    restore = _install_fake_get({
+        "/points/": points,
+        "/forecast": lambda: responses.pop(0),
+        "/alerts/active": _FakeResp(payload={"features": []}),
+    })
+    try:
+        gridpoint_cache.store(43.0, -76.0, {
+            "forecast": "https://api.weather.gov/gridpoints/OLD/9,9/forecast"})
+        res = nws.fetch_nws_details(43.0, -76.0)
+    finally:
+        restore()
+    assert res["periods"][0]["name"] == "Today", res
+    assert points_calls == [1] and responses == [], (points_calls, responses)
+    assert gridpoint_cache.lookup(43.0, -76.0)["gridpoint"] == "X/1,1"
+
+
+def test_gridpoint_entry_expires_after_ttl():
+    _fresh_gridpoints()
+    gridpoint_cache.store(1.0, 2.0, {"forecast": "u"}, now=1000)
+    assert gridpoint_cache.lookup(1.0, 2.0, now=1000 + 60)["forecast"] == "u"
+    assert gridpoint_cache.lookup(1.0, 2.0, now=1000 + gridpoint_cache.TTL_SECONDS + 1) is None
 
 
 def _run():
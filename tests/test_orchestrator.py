@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+"""Tests for the multi-provider RefreshOrchestrator.
+
+Runs in a subprocess with offscreen Qt (rounds are driven by QTimers and
+AsyncRequest signals); providers are fake coroutines, so nothing touches
+the network:
+
+    PYTHONPATH=src python tests/test_orchestrator.py
+"""
+import os
+import subprocess
+import sys
+
+
+def _child():
+    import asyncio
+    import time
+
+    from PySide6.QtCore import QCoreApplication, QEventLoop, QObject, QTimer, Signal
+
+    from kde_weather.backend import orchestrator
+    from kde_weather.backend.api.io_loop import IoLoop
+    from kde_weather.backend.orchestrator import FIRST_PAINT_MS, RefreshOrchestrator
+
+    app = QCoreApplication([])
+    delays = {}
+
+    def provider(name):
+        async def fetch(transport, lat, lon):
+            await asyncio.sleep(delays[name])
+            if delays[name] < 0:
+                raise ValueError("boom")
+            return f"{name}@{lat},{lon}"
+        return fetch
+
+    orchestrator.PROVIDERS = {"forecast": provider("forecast"), "nws": provider("nws")}
+    io = IoLoop()
+    orch = RefreshOrchestrator(lambda: io)
+    events = []
+    started = [0.0]
+    orch.ready.connect(lambda n, k, v: events.append((n, v, time.monotonic() - started[0])))
+    orch.failed.connect(lambda n, k, m: events.append((n, "failed:" + m, time.monotonic() - started[0])))
+
+    def run(forecast, nws, wait_ms=1500):
+        delays.update(forecast=forecast, nws=nws)
+        events.clear()
+        started[0] = time.monotonic()
+        orch.start((1.0, 2.0), ["forecast", "nws"])
+        loop = QEventLoop()
+        QTimer.singleShot(wait_ms, loop.quit)
+        loop.exec()
+        return list(events)
+
+    # Both fast: one combined paint as soon as the last one answers,
+    # before the first-paint deadline.
+    ev = run(0.01, 0.05)
+    assert sorted(e[0] for e in ev) == ["forecast", "nws"], ev
+    assert abs(ev[0][2] - ev[1][2]) < 0.02 and ev[1][2] < FIRST_PAINT_MS / 1000, ev
+    assert orch.pending() == 0
+
+    # Slow NWS: the forecast goes out at the deadline, NWS when it lands.
+    ev = run(0.01, 0.8)
+    assert [e[0] for e in ev] == ["forecast", "nws"], ev
+    assert ev[0][2] < FIRST_PAINT_MS / 1000 + 0.15, ev
+    assert ev[1][2] >= 0.8, ev
+
+    # Slow forecast: NWS isn't held back past the deadline either.
+    ev = run(0.8, 0.01)
+    assert [e[0] for e in ev] == ["nws", "forecast"], ev
+    assert ev[0][2] < FIRST_PAINT_MS / 1000 + 0.15, ev
+
+    # A failure is reported per provider; the shared budget bounds the rest.
+    orchestrator.REFRESH_BUDGET_S = 0.3
+    ev = run(-0.01, 5)
+    assert {e[0]: e[1] for e in ev}["forecast"] == "failed:boom", ev
+    assert "deadline" in {e[0]: e[1] for e in ev}["nws"], ev
+
+    # Cancelled rounds report nothing.
+    delays.update(forecast=5, nws=5)
+    events.clear()
+    orch.start((1.0, 2.0), ["forecast", "nws"])
+    loop = QEventLoop()
+    QTimer.singleShot(100, loop.quit)
+    loop.exec()
+    orch.cancel_all()
+    loop = QEventLoop()
+    QTimer.singleShot(400, loop.quit)
+    loop.exec()
+    assert events == [] and orch.pending() == 0, events
+
+    # Held until a signal (the first frame, in the app): nothing launches
+    # before it fires, and everything started meanwhile launches after.
+    class Window(QObject):
+        frameSwapped = Signal()
+
+    window = Window()
+    delays.update(forecast=0.01, nws=0.01)
+    events.clear()
+    orch.hold_until(window.frameSwapped, timeout_ms=10_000)
+    orch.start((1.0, 2.0), ["forecast", "nws"])
+    loop = QEventLoop()
+    QTimer.singleShot(200, loop.quit)
+    loop.exec()
+    assert events == [] and orch.pending() == 2, events
+    window.frameSwapped.emit()
+    loop = QEventLoop()
+    QTimer.singleShot(300, loop.quit)
+    loop.exec()
+    assert sorted(e[0] for e in events) == ["forecast", "nws"], events
+    assert io.shutdown() is True
+    print("child ok")
+
+
+def main():
+    if len(sys.argv) >= 2 and sys.argv[1] == "_child":
+        _child()
+        return
+    src = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "src"))
+    env = dict(os.environ)
+    env["QT_QPA_PLATFORM"] = "offscreen"
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (src, env.get("PYTHONPATH", "")) if p)
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), "_child"],
+                          env=env, capture_output=True, text=True)
+    ok = proc.returncode == 0 and "child ok" in proc.stdout
+    print(f"[{'PASS' if ok else 'FAIL'}] RefreshOrchestrator first paint / merge (exit {proc.returncode})")
+    if not ok:
+        sys.stdout.write(proc.stdout)
+        sys.stderr.write(proc.stderr)
+        sys.exit(1)
+    print("\nAll 1 passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""Test that refresh() joins a refreshAll() batch already fetching its location.
+
+Runs in a subprocess with an isolated $HOME, offscreen Qt, and stubbed
+network.  The batch fetch is held open on its pool thread while refresh()
+runs, so it is still in flight; refresh() must not send its own forecast
+request, and the batch's result must reach the screen when it lands.
+
+    PYTHONPATH=src python tests/test_refresh_join.py
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+
+def _child():
+    import threading
+
+    from PySide6.QtCore import QEventLoop, QTimer
+    from PySide6.QtWidgets import QApplication
+
+    release_batch = threading.Event()
+
+    def held_batch(coords):
+        release_batch.wait(10)
+        return [{"hourly": {}, "daily": {}, "source": "batch"} for _ in coords]
+
+    from kde_weather.backend.api import worker
+    worker.fetch_forecast_batch = held_batch
+    worker.fetch_nws_details = lambda lat, lon: {"available": True, "periods": [], "alerts": []}
+
+    from kde_weather.backend import orchestrator
+    single_fetches = []
+
+    async def fake_forecast(transport, lat, lon):
+        single_fetches.append((lat, lon))
+        return {"hourly": {}, "daily": {}, "source": "single"}
+
+    async def fake_nws(transport, lat, lon):
+        return {"available": True, "periods": [], "alerts": []}
+    orchestrator.PROVIDERS = {"forecast": fake_forecast, "nws": fake_nws}
+
+    from kde_weather.backend.app_controller import AppController
+
+    app = QApplication([])
+    ctrl = AppController()
+
+    def spin_until(done):
+        for _ in range(50):
+            if done():
+                return True
+            loop = QEventLoop()
+            QTimer.singleShot(20, loop.quit)
+            loop.exec()
+        return done()
+
+    # Adding a location refreshes it with a single request.
+    ctrl._settings.addLocation("Test City", 43.0, -76.0)
+    loc = ctrl._settings.activeLocation
+    key = (loc["lat"], loc["lon"])
+    assert spin_until(lambda: single_fetches and not ctrl.loading), single_fetches
+    assert ctrl._refresher.pending() == 0
+
+    # Stale again; a batch picks the location up and is held in flight.
+    ctrl._snapshots[key]["fetched_at"] = 0
+    single_fetches.clear()
+    ctrl.refreshAll()
+    assert ctrl._inflight.pending_keys("batch") == [(key,)], ctrl._inflight.pending_keys("batch")
+
+    # refresh() joins it: loading, but no request of its own.
+    ctrl.refresh()
+    assert ctrl.loading
+    spin_until(lambda: False)  # give a stray request time to show up
+    assert single_fetches == [] and ctrl._refresher.pending() == 0, single_fetches
+
+    # The batch's answer is what lands on screen.
+    release_batch.set()
+    assert spin_until(lambda: not ctrl.loading)
+    assert ctrl._snapshots[key]["body"]["source"] == "batch", ctrl._snapshots[key]
+    assert single_fetches == [], single_fetches
+
+    ctrl.shutdown()
+    print("child ok")
+
+
+def main():
+    if len(sys.argv) >= 2 and sys.argv[1] == "_child":
+        _child()
+        return
+    src = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "src"))
+    with tempfile.TemporaryDirectory() as home:
+        env = dict(os.environ)
+        env["HOME"] = home
+        env["QT_QPA_PLATFORM"] = "offscreen"
+        env["PYTHONPATH"] = os.pathsep.join(p for p in (src, env.get("PYTHONPATH", "")) if p)
+        proc = subprocess.run([sys.executable, os.path.abspath(__file__), "_child"],
+                              env=env, capture_output=True, text=True)
+    ok = proc.returncode == 0 and "child ok" in proc.stdout
+    print(f"[{'PASS' if ok else 'FAIL'}] refresh() joins an in-flight batch (exit {proc.returncode})")
+    if not ok:
+        sys.stdout.write(proc.stdout)
+        sys.stderr.write(proc.stderr)
+        sys.exit(1)
+    print("\nAll 1 passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+"""Tests for the per-host resilience layer (timeouts, retries, circuit breaker).
+
+No framework; run directly:
+    PYTHONPATH=src python tests/test_resilience.py
+HostHealth runs on a fake clock; the retry and fail-fast tests talk only to
+a throwaway HTTP/1.1 server on 127.0.0.1, never the network.
+"""
+import asyncio
+import atexit
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from kde_weather.backend.api import forecast_cache, http_client, open_meteo, resilience
+from kde_weather.backend.api.aio_http import StreamTransport
+from kde_weather.backend.api.resilience import CLOSED, HALF_OPEN, OPEN, CircuitOpenError, HostHealth
+
+_TMP = Path(tempfile.mkdtemp(prefix="kde-weather-resilience-test-"))
+atexit.register(shutil.rmtree, _TMP, True)
+forecast_cache.CACHE_DIR = _TMP
+resilience.BACKOFF_BASE = 0.001  # retries without real waits
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _refused(health):
+    try:
+        health.acquire()
+    except CircuitOpenError:
+        return True
+    return False
+
+
+def test_timeout_adapts_to_observed_latency():
+    h = HostHealth("h", clock=_Clock())
+    for _ in range(resilience.MIN_SAMPLES - 1):
+        h.success(0.1)
+    assert h.timeout(15) == 15  # too few samples to judge
+    h.success(0.1)
+    expected = resilience.TIMEOUT_FACTOR * 0.1 + resilience.TIMEOUT_FLOOR
+    assert abs(h.timeout(15) - expected) < 1e-9, h.timeout(15)
+    assert h.timeout(1) == 1  # never above the caller's ceiling
+    assert h.stats()["p95_s"] == 0.1 and h.stats()["samples"] == 5
+
+
+def test_timeout_is_factor_times_nearest_rank_p95():
+    h = HostHealth("h", clock=_Clock())
+    for i in (list(range(30, 0, -2)) + list(range(29, 0, -2))):
+        h.success(i / 10)  # 0.1 .. 3.0 s, out of order
+    # p95 of 30 samples is the 29th smallest: 2.9 s.
+    expected = resilience.TIMEOUT_FACTOR * 2.9 + resilience.TIMEOUT_FLOOR
+    assert abs(h.timeout(60) - expected) < 1e-9, h.timeout(60)
+    stats = h.stats()
+    assert (stats["p50_s"], stats["p95_s"], stats["samples"]) == (1.5, 2.9, 30), stats
+
+
+def test_circuit_opens_then_half_open_probe_closes_it():
+    clock = _Clock()
+    h = HostHealth("h", clock=clock)
+    for _ in range(resilience.FAILURE_THRESHOLD - 1):
+        h.acquire()
+        h.failure()
+    assert h.stats()["state"] == CLOSED
+    h.acquire()
+    h.failure()
+    assert h.stats()["state"] == OPEN and _refused(h)
+
+    clock.now += resilience.COOLDOWN
+    h.acquire()                      # the one probe
+    assert h.stats()["state"] == HALF_OPEN
+    assert _refused(h)               # everyone else still fails fast
+    h.success(0.2)
+    assert h.stats()["state"] == CLOSED and not _refused(h)
+
+
+def test_failed_probe_doubles_the_cooldown():
+    clock = _Clock()
+    h = HostHealth("h", clock=clock)
+    for _ in range(resilience.FAILURE_THRESHOLD):
+        h.failure()
+    clock.now += resilience.COOLDOWN
+    h.acquire()
+    h.failure()                      # probe failed
+    assert h.stats()["state"] == OPEN
+    clock.now += resilience.COOLDOWN
+    assert _refused(h)               # one cool-down is no longer enough
+    clock.now += resilience.COOLDOWN
+    h.acquire()
+    h.release()                      # a cancelled probe frees the slot
+    h.acquire()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    failures_left = 0
+    hits = 0
+
+    def do_GET(self):
+        cls = type(self)
+        cls.hits += 1
+        if cls.failures_left > 0:
+            cls.failures_left -= 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps({"ok": True}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve(failures):
+    _Handler.failures_left, _Handler.hits = failures, 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_sync_get_retries_5xx_then_fails_fast_when_open():
+    resilience.reset()
+    server, base = _serve(failures=2)
+    try:
+        resp = http_client.get(f"{base}/x", timeout=5)
+        assert resp.status_code == 200 and _Handler.hits == 3, _Handler.hits
+
+        _Handler.failures_left = 100
+        resp = http_client.get(f"{base}/x", timeout=5)
+        assert resp.status_code == 503  # last attempt's response comes back
+        hits = _Handler.hits
+        try:
+            # Two more failures make five in a row; the third attempt is refused.
+            http_client.get(f"{base}/x", timeout=5)
+            raise AssertionError("circuit did not open")
+        except CircuitOpenError:
+            pass
+        assert _Handler.hits == hits + 2, (hits, _Handler.hits)
+        try:
+            http_client.get(f"{base}/x", timeout=5)
+            raise AssertionError("circuit did not stay open")
+        except CircuitOpenError:
+            pass
+        assert _Handler.hits == hits + 2, "a request went out while open"
+    finally:
+        server.shutdown()
+        resilience.reset()
+
+
+def test_async_get_retries_5xx():
+    resilience.reset()
+    server, base = _serve(failures=1)
+
+    async def run():
+        t = StreamTransport()
+        resp = await t.get(f"{base}/x", timeout=5)
+        await t.close()
+        return resp
+
+    try:
+        resp = asyncio.run(run())
+    finally:
+        server.shutdown()
+    assert resp.status_code == 200 and _Handler.hits == 2, _Handler.hits
+    assert resilience.stats()["127.0.0.1"]["state"] == CLOSED
+    resilience.reset()
+
+
+def test_forecast_served_from_stale_cache_while_open():
+    resilience.reset()
+    key = forecast_cache.cache_key(43.0, -76.0, open_meteo.forecast_params(43.0, -76.0))
+    forecast_cache.store(key, {"cached": True}, {"Cache-Control": "max-age=0"})
+    health = resilience.host("api.open-meteo.com")
+    for _ in range(resilience.FAILURE_THRESHOLD):
+        health.failure()
+    try:
+        assert open_meteo.fetch_forecast(43.0, -76.0) == {"cached": True}
+        try:
+            open_meteo.fetch_forecast(10.0, 10.0)  # nothing cached to fall back on
+            raise AssertionError("no CircuitOpenError without a cache entry")
+        except CircuitOpenError:
+            pass
+    finally:
+        resilience.reset()
+
+
+def _run():
+    tests = [v for k, v in sorted(globals().items())
+             if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"[PASS] {t.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {t.__name__}: {e}")
+    if failed:
+        print(f"\n{failed} of {len(tests)} failed")
+        sys.exit(1)
+    print(f"\nAll {len(tests)} passed")
+
+
+if __name__ == "__main__":
+    _run()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+"""Tests for the adaptive refresh scheduler and the minute tick.
+
+CadenceTracker and content_digest are plain Python; RefreshScheduler runs in
+a subprocess with offscreen Qt on a fake clock, with its timer inspected
+rather than waited on:
+
+    PYTHONPATH=src python tests/test_scheduler.py
+"""
+import os
+import subprocess
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from kde_weather.backend.scheduler import CHANGE_SLACK_S, CadenceTracker, content_digest
+
+
+def test_digest_ignores_response_noise():
+    a = {"hourly": {"temperature_2m": [50, 51]}, "generationtime_ms": 0.4}
+    b = {"hourly": {"temperature_2m": [50, 51]}, "generationtime_ms": 0.9}
+    c = {"hourly": {"temperature_2m": [50, 52]}, "generationtime_ms": 0.4}
+    assert content_digest(a) == content_digest(b)
+    assert content_digest(a) != content_digest(c)
+
+
+def test_cadence_learned_from_changes_only():
+    t = CadenceTracker()
+    assert t.observe("x", "d0", 0) is True       # first sighting: not timed
+    assert t.observe("x", "d0", 900) is False    # unchanged: no change recorded
+    t.observe("x", "d1", 3600)
+    assert t.period() is None                    # one change, no gaps yet
+    t.observe("x", "d2", 7200)
+    t.observe("y", "e0", 7000)
+    assert t.period() is None                    # still only one gap
+    t.observe("x", "d3", 10800)
+    assert t.period() == 3600, t.period()
+    # The first expected change strictly after a given time.
+    assert t.next_change(10800) == 14400
+    assert t.next_change(20000) == 21600
+    t.forget({"y"})
+    assert t.period() is None
+
+
+def test_clock_text():
+    from kde_weather.backend.app_controller import clock_text
+    assert clock_text(datetime(2026, 10, 17, 15, 4)) == "Saturday, Oct 17  •  3:04 PM"
+    assert clock_text(datetime(2026, 10, 17, 0, 30)) == "Saturday, Oct 17  •  12:30 AM"
+    assert clock_text(datetime(2026, 12, 20, 12, 0)) == "Sunday, Dec 20  •  12:00 PM"
+
+
+def test_clock_text_ignores_the_locale():
+    import locale
+    from kde_weather.backend.app_controller import clock_text
+    saved = locale.setlocale(locale.LC_TIME)
+    try:
+        for name in ("de_DE.UTF-8", "fr_FR.UTF-8", "es_ES.UTF-8"):
+            try:
+                locale.setlocale(locale.LC_TIME, name)
+            except locale.Error:
+                continue  # not installed here
+            assert clock_text(datetime(2026, 10, 17, 15, 4)) == "Saturday, Oct 17  •  3:04 PM", name
+    finally:
+        locale.setlocale(locale.LC_TIME, saved)
+
+
+def _child():
+    from PySide6.QtCore import QCoreApplication, Qt
+
+    from kde_weather.backend import scheduler as sched
+    from kde_weather.backend.scheduler import RefreshScheduler
+
+    app = QCoreApplication([])
+
+    class Clock:
+        now = 60 * 16_667 + 30.0  # half a minute past a minute boundary
+
+        def __call__(self):
+            return self.now
+
+    # Visible, nothing learned yet: the user's interval applies, and the
+    # timer wakes for the next minute boundary first.
+    clock = Clock()
+    s = RefreshScheduler(15, clock=clock)
+    events = []
+    s.minute.connect(lambda: events.append("minute"))
+    s.due.connect(lambda: events.append("due"))
+    s.start()
+    t0 = clock.now
+    assert s.due_at() == t0 + 900, s.due_at()
+    assert s._timer.timerType() == Qt.PreciseTimer
+    assert 30_000 <= s._timer.interval() <= 30_000 + sched.MINUTE_SLACK_MS, s._timer.interval()
+
+    # Upstream changes hourly: the next refresh waits for the next change.
+    for i, at in enumerate((t0 - 10800, t0 - 7200, t0 - 3600, t0)):
+        clock.now = at
+        s.observe((1.0, 2.0), {"hourly": {"v": [i]}})
+    clock.now = t0
+    assert s.period() == 3600, s.period()
+    assert s.due_at() == t0 + 3600 + CHANGE_SLACK_S, s.due_at()
+
+    # A minute tick that isn't due yet only emits `minute`.
+    clock.now = t0 + 60
+    s._fire()
+    assert events == ["minute"], events
+    s.stop()
+
+    # Hidden: no minute ticks, and each background refresh doubles the wait.
+    clock = Clock()
+    s = RefreshScheduler(15, clock=clock)
+    events = []
+    s.minute.connect(lambda: events.append("minute"))
+    s.due.connect(lambda: events.append("due"))
+    s.start()
+    t0 = clock.now
+    s.set_exposed(False)
+    assert s.due_at() == t0 + 1800, s.due_at()
+    assert s._timer.timerType() == Qt.VeryCoarseTimer
+    assert s._timer.interval() == 1800 * 1000, s._timer.interval()
+    waits = []
+    for _ in range(5):
+        clock.now = s.due_at()
+        start = clock.now
+        s._fire()
+        waits.append(s.due_at() - start)
+    assert waits == [3600, 7200, 14400, sched.MAX_HIDDEN_INTERVAL_S,
+                     sched.MAX_HIDDEN_INTERVAL_S], waits
+    assert events == ["due"] * 5, events
+
+    # Exposed again with a refresh overdue: clock catch-up and refresh at once.
+    events.clear()
+    clock.now += 1000  # past the visible interval, short of the hidden one
+    s.set_exposed(True)
+    assert events == ["minute", "due"], events
+    assert s.due_at() == clock.now + 900, s.due_at()
+    # Exposed again before it's due: just the clock.
+    s.set_exposed(False)
+    events.clear()
+    s.set_exposed(True)
+    assert events == ["minute"], events
+    s.stop()
+    del app
+    print("child ok")
+
+
+def test_scheduler_timing():
+    src = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "src"))
+    env = dict(os.environ)
+    env["QT_QPA_PLATFORM"] = "offscreen"
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (src, env.get("PYTHONPATH", "")) if p)
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), "_child"],
+                          env=env, capture_output=True, text=True, timeout=60)
+    assert proc.returncode == 0 and "child ok" in proc.stdout, proc.stdout + proc.stderr
+
+
+def _run():
+    tests = [v for k, v in sorted(globals().items())
+             if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"[PASS] {t.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {t.__name__}: {e}")
+    if failed:
+        print(f"\n{failed} of {len(tests)} failed")
+        sys.exit(1)
+    print(f"\nAll {len(tests)} passed")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 2 and sys.argv[1] == "_child":
+        _child()
+    else:
+        _run()
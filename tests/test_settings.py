@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""Tests for debounced, batched, atomic Settings persistence.
+
+Runs in a subprocess with an isolated $HOME and offscreen Qt (the debounce
+is a QTimer, so it needs an event loop):
+
+    PYTHONPATH=src python tests/test_settings.py
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+
+def _child():
+    import threading
+
+    from PySide6.QtCore import QCoreApplication, QEventLoop, QTimer
+
+    from kde_weather.backend import settings as settings_mod
+    from kde_weather.backend.settings import CONFIG_FILE, SAVE_DELAY_MS, Settings
+
+    app = QCoreApplication([])
+    writes = []
+    real_write = settings_mod.write_atomic
+
+    def counting_write(path, text):
+        writes.append(threading.current_thread() is threading.main_thread())
+        real_write(path, text)
+    settings_mod.write_atomic = counting_write
+
+    def wait(ms):
+        loop = QEventLoop()
+        QTimer.singleShot(ms, loop.quit)
+        loop.exec()
+
+    def saved():
+        with open(CONFIG_FILE) as f:
+            return json.load(f)
+
+    s = Settings()
+    # A burst of toggles is one background write, after the debounce.
+    for i in range(10):
+        s.setElementEnabled("rain", i % 2 == 0)
+    assert writes == [] and not CONFIG_FILE.exists(), writes
+    wait(SAVE_DELAY_MS + 300)
+    s.flush()  # wait for the writer thread
+    assert writes == [False], writes
+    assert saved()["enabled_elements"]["rain"] is False
+
+    # A batch produces a single write once the block ends.
+    with s.batch():
+        for i in range(5):
+            s.addLocation(f"City {i}", float(i), float(i))
+        assert not s._save_timer.isActive()
+    wait(SAVE_DELAY_MS + 300)
+    s.flush()
+    assert len(writes) == 2, writes
+    assert len(saved()["locations"]) == 5
+
+    # flush() writes a pending change immediately, on the calling thread.
+    s.refreshIntervalMinutes = 15
+    s.flush()
+    assert writes[-1] is True and saved()["refresh_interval_minutes"] == 15
+    assert not s._save_timer.isActive()
+    assert [p.name for p in CONFIG_FILE.parent.iterdir()] == ["settings.json"]
+    print("child ok")
+
+
+def main():
+    if len(sys.argv) >= 2 and sys.argv[1] == "_child":
+        _child()
+        return
+    src = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "src"))
+    with tempfile.TemporaryDirectory() as home:
+        env = dict(os.environ)
+        env["HOME"] = home
+        env["QT_QPA_PLATFORM"] = "offscreen"
+        env["PYTHONPATH"] = os.pathsep.join(p for p in (src, env.get("PYTHONPATH", "")) if p)
+        proc = subprocess.run([sys.executable, os.path.abspath(__file__), "_child"],
+                              env=env, capture_output=True, text=True)
+    ok = proc.returncode == 0 and "child ok" in proc.stdout
+    print(f"[{'PASS' if ok else 'FAIL'}] Settings debounce/batch/flush (exit {proc.returncode})")
+    if not ok:
+        sys.stdout.write(proc.stdout)
+        sys.stderr.write(proc.stderr)
+        sys.exit(1)
+    print("\nAll 1 passed")
+
+
+if __name__ == "__main__":
+    main()
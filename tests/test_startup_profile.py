@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""Tests for the startup profiler's parsing and report (startup_profile).
+
+No framework; run directly:
+    PYTHONPATH=src python tests/test_startup_profile.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from kde_weather import startup_profile
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _json
+import time:       900 |       1020 | json
+qml: some unrelated app output
+import time:      5000 |      70000 | PySide6.QtCore
+"""
+
+
+def test_parse_importtime_keeps_depth_and_skips_noise():
+    imports = startup_profile.parse_importtime(IMPORTTIME)
+    assert [i["module"] for i in imports] == ["_json", "json", "PySide6.QtCore"], imports
+    assert imports[0] == {"module": "_json", "self_us": 120, "cumulative_us": 120, "depth": 1}
+    assert imports[1]["depth"] == 0
+
+
+def test_report_lists_phases_and_slowest_roots():
+    phases = [{"phase": "imports", "at_s": 0.25}, {"phase": "first frame swapped", "at_s": 0.5}]
+    report = startup_profile.format_report(phases, startup_profile.parse_importtime(IMPORTTIME))
+    lines = report.splitlines()
+    assert "+  0.250  first frame swapped" in lines[2], lines
+    roots = lines[lines.index("Slowest top-level imports (cumulative ms):") + 1:]
+    assert roots[0].endswith("PySide6.QtCore") and roots[1].endswith("json"), roots
+
+
+def test_mark_is_a_noop_when_not_profiling():
+    assert not startup_profile.active()
+    startup_profile.mark("anything")
+    startup_profile.finish()
+
+
+def _run():
+    tests = [v for k, v in sorted(globals().items())
+             if k.startswith("test_") and callable(v)]
+    failed = 0
+    for t in tests:
+        try:
+            t()
+            print(f"[PASS] {t.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {t.__name__}: {e}")
+    if failed:
+        print(f"\n{failed} of {len(tests)} failed")
+        sys.exit(1)
+    print(f"\nAll {len(tests)} passed")
+
+
+if __name__ == "__main__":
+    _run()
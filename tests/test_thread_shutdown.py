@@ -7,7 +7,7 @@ making Qt abort with "QThread: Destroyed while thread is still running" (SIGABRT
   1. quitting the app while a forecast request is in-flight
      -- fixed by AppController.shutdown(), called from main.py
   2. a rapid second refresh dropping the first request's still-running thread
-     -- fixed by tracking every in-flight pair in AppController._active
+     -- fixed by keeping every in-flight worker referenced (now in WorkerPool)
 
 The project has no test framework, so this runs standalone:
 
@@ -42,22 +42,33 @@ def _run_scenario(name):
     from PySide6.QtWidgets import QApplication
 
     # Stub the blocking HTTP calls with a slow sleep so the worker thread is
-    # guaranteed to still be running when we quit / refresh again. ForecastWorker
-    # looks the name up in the worker module's globals at call time, so rebinding
-    # it here is enough; no real network is touched.
+    # guaranteed to still be running when we quit / refresh again. The pool
+    # workers look the names up in the worker module's globals at call time,
+    # so rebinding them here is enough; no real network is touched.
     from kde_weather.backend.api import worker
 
-    def slow_forecast(lat, lon):
-        time.sleep(2.0)
-        return {"hourly": {}, "daily": {}}
-
     def slow_geocode(query, count=5):
         time.sleep(2.0)
         return []
 
-    worker.fetch_forecast = slow_forecast
+    def slow_batch(coords):
+        time.sleep(2.0)
+        return [{"hourly": {}, "daily": {}} for _ in coords]
+
+    worker.fetch_forecast_batch = slow_batch
     worker.fetch_geocode = slow_geocode
 
+    # refresh() fetches through the orchestrator on the asyncio I/O loop;
+    # give it equally slow coroutines, which shutdown() must cancel.
+    import asyncio
+
+    from kde_weather.backend import orchestrator
+
+    async def slow_async(transport, lat, lon):
+        await asyncio.sleep(2.0)
+        return {"hourly": {}, "daily": {}}
+    orchestrator.PROVIDERS = {"forecast": slow_async, "nws": slow_async}
+
     from kde_weather.backend.app_controller import AppController
 
     app = QApplication([])
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""Tests for WorkerPool: priority order, bounded queue, main-thread delivery.
+
+Runs in a subprocess with offscreen Qt, like the other Qt tests:
+
+    PYTHONPATH=src python tests/test_worker_pool.py
+"""
+import os
+import subprocess
+import sys
+
+
+def _child():
+    import threading
+
+    from PySide6.QtCore import QObject, QTimer, Signal
+    from PySide6.QtWidgets import QApplication
+
+    from kde_weather.backend.api.worker import WorkerPool
+
+    app = QApplication([])
+    gate = threading.Event()
+    ran, delivered, dropped = [], [], []
+
+    class FakeWorker(QObject):
+        finished = Signal(dict)
+        error = Signal(str)
+        dropped = Signal()
+
+        def __init__(self, name, block=False):
+            super().__init__()
+            self.name = name
+            self.block = block
+
+        def run(self):
+            if self.block:
+                gate.wait(5)
+            ran.append(self.name)
+            self.finished.emit({"name": self.name})
+
+    def submit(pool, name, priority, block=False):
+        w = FakeWorker(name, block)
+        w.finished.connect(
+            lambda d: delivered.append((d["name"], threading.current_thread() is threading.main_thread())))
+        w.dropped.connect(lambda n=name: dropped.append(n))
+        return pool.submit(w, priority)
+
+    # One thread, two queue slots: "blocker" occupies the thread while the
+    # rest queue up behind it.
+    pool = WorkerPool(max_threads=1, max_queued=2)
+    submit(pool, "blocker", 30, block=True)
+    submit(pool, "prefetch", 0)
+    submit(pool, "geocode-old", 10)
+    # Queue full: evicts the lowest-priority job ("prefetch").
+    submit(pool, "nws", 20)
+    # Queue full again: the oldest equal-or-lower job ("geocode-old") goes.
+    submit(pool, "geocode-new", 10)
+    # Nothing queued ranks below it any more -> the new job is dropped itself.
+    assert submit(pool, "prefetch-2", 0) is False
+    assert dropped == ["prefetch", "geocode-old", "prefetch-2"], dropped
+
+    gate.set()
+
+    def check():
+        if len(delivered) < 3:
+            QTimer.singleShot(20, check)
+            return
+        assert ran == ["blocker", "nws", "geocode-new"], ran
+        assert all(on_main for _name, on_main in delivered), delivered
+        assert pool.pending() == 0, pool.pending()
+        app.quit()
+
+    QTimer.singleShot(0, check)
+    QTimer.singleShot(5000, lambda: app.exit(1))
+    rc = app.exec()
+    pool.shutdown()
+    assert rc == 0, (ran, delivered)
+    print("child ok")
+
+
+def main():
+    if len(sys.argv) >= 2 and sys.argv[1] == "_child":
+        _child()
+        return
+    src = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "src"))
+    env = dict(os.environ)
+    env["QT_QPA_PLATFORM"] = "offscreen"
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (src, env.get("PYTHONPATH", "")) if p)
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), "_child"],
+                          env=env, capture_output=True, text=True)
+    ok = proc.returncode == 0 and "child ok" in proc.stdout
+    print(f"[{'PASS' if ok else 'FAIL'}] WorkerPool priority/queue/delivery (exit {proc.returncode})")
+    if not ok:
+        sys.stdout.write(proc.stdout)
+        sys.stderr.write(proc.stderr)
+        sys.exit(1)
+    print("\nAll 1 passed")
+
+
+if __name__ == "__main__":
+    main()